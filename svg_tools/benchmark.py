@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+svg_tools 성능 측정
+- 합성 SVG(패스 세그먼트 10개 ~ 100만 개)로 파싱/변환/렌더링/갤러리 생성 시간 측정
+- 측정 항목마다 별도 프로세스에서 실행하여 최대 메모리(peak RSS)를 따로 기록
+- 처리량, p50/p99 지연 시간을 출력하고 JSON 기준값으로 저장/비교 (기준보다 느려지면 종료 코드 1)
+
+사용법:
+    python benchmark.py                              # 기본 크기로 전체 측정
+    python benchmark.py --cases parse_svg_path resize_svg --sizes 10 1000 1000000
+    python benchmark.py --save-baseline baseline.json
+    python benchmark.py --compare baseline.json --threshold 0.1
+"""
+
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+try:
+    import resource
+except ImportError:  # Windows는 최대 메모리를 측정하지 않음
+    resource = None
+
+BASELINE_VERSION = 1
+DEFAULT_SIZES = (10, 1000, 100000)
+DEFAULT_GALLERY_SIZES = (10, 100)
+DEFAULT_REPEAT = 20
+DEFAULT_MAX_TIME = 10.0  # 초 (측정 항목 하나에 쓸 최대 시간, 최소 3회는 반복)
+DEFAULT_THRESHOLD = 0.10
+MIN_REPEAT = 3
+CANVAS_SIZE = 1000
+RENDER_SIZE = 256
+
+def synthetic_path(segments, seed=0, canvas=CANVAS_SIZE):
+    """세그먼트 segments개의 패스 데이터 (직선/곡선/호, 절대/상대 명령을 섞은 재현 가능한 임의 경로)"""
+    rng = random.Random(seed)
+    margin = canvas * 0.1
+    low, high = margin, canvas - margin
+    x = y = canvas / 2
+    parts = [f"M {x:.2f} {y:.2f}"]
+
+    def point():
+        return rng.uniform(low, high), rng.uniform(low, high)
+    
+    for i in range(1, segments):
+        if i % 50 == 0:  # 50개마다 새 하위 패스
+            x, y = point()
+            parts.append(f"Z M {x:.2f} {y:.2f}")
+            continue
+        kind = rng.random()
+        nx, ny = point()
+        if kind < 0.3:
+            parts.append(f"L {nx:.2f} {ny:.2f}")
+        elif kind < 0.4:
+            parts.append(f"l {nx - x:.2f} {ny - y:.2f}")
+        elif kind < 0.45:
+            parts.append(f"H {nx:.2f}")
+            ny = y
+        elif kind < 0.5:
+            parts.append(f"V {ny:.2f}")
+            nx = x
+        elif kind < 0.7:
+            (x1, y1), (x2, y2) = point(), point()
+            parts.append(f"C {x1:.2f} {y1:.2f} {x2:.2f} {y2:.2f} {nx:.2f} {ny:.2f}")
+        elif kind < 0.8:
+            (x1, y1), (x2, y2) = point(), point()
+            parts.append(f"c {x1 - x:.2f} {y1 - y:.2f} {x2 - x:.2f} {y2 - y:.2f} {nx - x:.2f} {ny - y:.2f}")
+        elif kind < 0.9:
+            x1, y1 = point()
+            parts.append(f"Q {x1:.2f} {y1:.2f} {nx:.2f} {ny:.2f}")
+        else:
+            radius = rng.uniform(canvas * 0.05, canvas * 0.4)
+            parts.append(f"A {radius:.2f} {radius:.2f} 0 {rng.randint(0, 1)} {rng.randint(0, 1)} {nx:.2f} {ny:.2f}")
+        x, y = nx, ny
+    parts.append("Z")
+    return ' '.join(parts)
+
+def synthetic_svg(segments, seed=0, canvas=CANVAS_SIZE, max_segments_per_path=1000):
+    """세그먼트 segments개를 여러 <path>로 나눈 SVG 문서 문자열 (흰색 배경 포함)"""
+    paths = []
+    remaining = segments
+    index = 0
+    while remaining > 0:
+        count = min(remaining, max_segments_per_path)
+        paths.append(f'  <path fill="#13aefe" d="{synthetic_path(count, seed + index, canvas)}"/>')
+        remaining -= count
+        index += 1
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {canvas} {canvas}" '
+            f'width="{canvas}" height="{canvas}">\n'
+            f'  <rect width="{canvas}" height="{canvas}" fill="#ffffff"/>\n'
+            + '\n'.join(paths) + '\n</svg>\n')
+
+def write_synthetic_svg(path, segments, seed=0):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(synthetic_svg(segments, seed))
+    return path
+
+# 측정 항목: 준비(크기, 작업 폴더) -> 실행할 함수, 크기 단위
+def _setup_parse(size, work_dir):
+    from svg_tools import SVGTools
+    path_data = synthetic_path(size)
+    return lambda: SVGTools.parse_svg_path(path_data)
+
+def _setup_resize(size, work_dir):
+    from svg_tools import SVGTools
+    input_file = write_synthetic_svg(os.path.join(work_dir, 'input.svg'), size)
+    output_file = os.path.join(work_dir, 'output.svg')
+    return lambda: SVGTools.resize_svg(input_file, output_file, 500)
+
+def _setup_center(size, work_dir):
+    from svg_tools import SVGTools
+    input_file = write_synthetic_svg(os.path.join(work_dir, 'input.svg'), size)
+    output_file = os.path.join(work_dir, 'output.svg')
+    return lambda: SVGTools.scale_and_center_symbol(input_file, output_file, CANVAS_SIZE, 850)
+
+def _setup_profile(size, work_dir, center='bbox'):
+    from scale_for_profile import scale_for_circular_profile
+    input_file = write_synthetic_svg(os.path.join(work_dir, 'input.svg'), size)
+    output_file = os.path.join(work_dir, 'output.svg')
+    return lambda: scale_for_circular_profile(input_file, output_file, center=center)
+
+def _setup_svg_to_png(size, work_dir):
+    from svg_to_png import SVGConverter
+    input_file = write_synthetic_svg(os.path.join(work_dir, 'input.svg'), size)
+    output_file = os.path.join(work_dir, 'output.png')
+    converter = SVGConverter(verbose=False, cache=False)  # 캐시를 쓰면 렌더링을 측정할 수 없음
+
+    def run():
+        if not converter.convert(input_file, output_file, RENDER_SIZE, RENDER_SIZE):
+            raise RuntimeError("SVG 변환 실패")
+    return run
+
+def _setup_gallery(size, work_dir, paginated=False):
+    """이미지 size개 (세그먼트 100개 SVG) 갤러리를 매번 처음부터 생성 (썸네일 포함)"""
+    from create_image_gallery import create_image_gallery
+    images_dir = os.path.join(work_dir, 'Images')
+    tools_dir = os.path.join(work_dir, 'tools')
+    os.makedirs(images_dir)
+    os.makedirs(tools_dir)
+    for i in range(size):
+        write_synthetic_svg(os.path.join(images_dir, f'icon_{i:06d}.svg'), 100, seed=i)
+    os.chdir(tools_dir)  # 갤러리 스크립트는 ../Images를 읽음
+
+    def run():
+        for name in os.listdir(work_dir):
+            path = os.path.join(work_dir, name)
+            if name not in ('Images', 'tools'):
+                if os.path.isdir(path):
+                    shutil.rmtree(path)
+                else:
+                    os.remove(path)
+        if not create_image_gallery(paginated=paginated):
+            raise RuntimeError("갤러리 생성 실패")
+    return run
+
+CASES = {
+    'parse_svg_path': (_setup_parse, 'segments'),
+    'resize_svg': (_setup_resize, 'segments'),
+    'scale_and_center_symbol': (_setup_center, 'segments'),
+    'scale_for_circular_profile': (_setup_profile, 'segments'),
+    'scale_for_circular_profile/mec': (lambda size, work_dir: _setup_profile(size, work_dir, 'mec'), 'segments'),
+    'svg_to_png': (_setup_svg_to_png, 'segments'),
+    'create_image_gallery': (_setup_gallery, 'images'),
+    'create_image_gallery/paginated': (lambda size, work_dir: _setup_gallery(size, work_dir, True), 'images'),
+}
+
+def percentile(values, fraction):
+    """정렬된 값의 백분위수 (선형 보간)"""
+    if len(values) == 1:
+        return values[0]
+    position = (len(values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+def peak_rss_bytes():
+    """현재 프로세스(와 끝난 자식 프로세스 중 가장 큰 것)의 최대 메모리 (측정할 수 없으면 None)"""
+    if resource is None:
+        return None
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return peak if sys.platform == 'darwin' else peak * 1024  # Linux는 KB 단위
+
+def run_case(name, size, repeat=DEFAULT_REPEAT, max_time=DEFAULT_MAX_TIME):
+    """측정 항목 하나 실행 (작업 프로세스 안에서 호출)"""
+    setup, unit = CASES[name]
+    work_dir = tempfile.mkdtemp(prefix='svg_benchmark_')
+    cwd = os.getcwd()
+    try:
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            run = setup(size, work_dir)
+            setup_rss = peak_rss_bytes()
+            run()  # 준비 실행 (모듈 import, 변환 방법 찾기 등은 측정에서 제외)
+            
+            times = []
+            started = time.perf_counter()
+            while len(times) < repeat:
+                start = time.perf_counter()
+                run()
+                times.append(time.perf_counter() - start)
+                if len(times) >= MIN_REPEAT and time.perf_counter() - started > max_time:
+                    break
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(work_dir, ignore_errors=True)
+    
+    times.sort()
+    p50 = percentile(times, 0.5)
+    return {
+        'case': name,
+        'size': size,
+        'unit': unit,
+        'runs': len(times),
+        'p50': p50,
+        'p99': percentile(times, 0.99),
+        'mean': sum(times) / len(times),
+        'throughput': size / p50 if p50 else None,  # 초당 세그먼트/이미지 수
+        'peak_rss': peak_rss_bytes(),
+        'setup_rss': setup_rss,
+    }
+
+def run_case_subprocess(name, size, repeat, max_time):
+    """측정 항목을 새 프로세스에서 실행 (최대 메모리가 다른 항목과 섞이지 않도록)"""
+    command = [sys.executable, os.path.abspath(__file__), '--worker', json.dumps([name, size, repeat, max_time])]
+    result = subprocess.run(command, capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "작업 프로세스 실패")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def result_key(result):
+    return f"{result['case']}@{result['size']}"
+
+def format_seconds(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.3f}s"
+
+def format_bytes(size):
+    if size is None:
+        return '-'
+    return f"{size / (1024 * 1024):.1f}MB"
+
+def print_result(result, comparison=None):
+    throughput = result['throughput']
+    line = (f"{result['case']:<32} {result['size']:>9,} {format_seconds(result['p50']):>10} "
+            f"{format_seconds(result['p99']):>10} {throughput:>12,.0f}/s {format_bytes(result['peak_rss']):>9}"
+            f" {result['runs']:>4}")
+    if comparison:
+        line += f"  {comparison}"
+    print(line)
+
+def compare_result(result, baseline, threshold):
+    """기준값과 비교 (설명 문자열, 회귀 여부)"""
+    if baseline is None:
+        return "기준 없음", False
+    regressions = []
+    change = result['p50'] / baseline['p50'] - 1
+    text = f"p50 {change:+.1%}"
+    if change > threshold:
+        regressions.append('시간')
+    if result.get('peak_rss') and baseline.get('peak_rss'):
+        rss_change = result['peak_rss'] / baseline['peak_rss'] - 1
+        text += f", 메모리 {rss_change:+.1%}"
+        if rss_change > threshold:
+            regressions.append('메모리')
+    if regressions:
+        return f"⚠️  회귀 ({', '.join(regressions)}): {text}", True
+    return text, False
+
+def load_baseline(path):
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get('version') != BASELINE_VERSION:
+        raise ValueError(f"지원하지 않는 기준값 파일 버전: {data.get('version')}")
+    return data['results']
+
+def save_baseline(path, results):
+    data = {
+        'version': BASELINE_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': {result_key(result): result for result in results},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def main():
+    """메인 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='svg_tools 성능 측정 (처리량, p50/p99, 최대 메모리)')
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), default=list(CASES),
+                        help='측정할 항목 (기본: 전체)')
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(DEFAULT_SIZES),
+                        help='패스 세그먼트 수 (기본: %(default)s)')
+    parser.add_argument('--gallery-sizes', nargs='+', type=int, default=list(DEFAULT_GALLERY_SIZES),
+                        help='갤러리 이미지 수 (기본: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='반복 횟수 (기본: %(default)s)')
+    parser.add_argument('--max-time', type=float, default=DEFAULT_MAX_TIME,
+                        help='항목당 최대 측정 시간(초), 최소 3회는 반복 (기본: %(default)s)')
+    parser.add_argument('--save-baseline', metavar='JSON', help='결과를 기준값 파일로 저장')
+    parser.add_argument('--compare', metavar='JSON', help='기준값 파일과 비교 (회귀가 있으면 종료 코드 1)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='회귀로 판단할 증가율 (기본: %(default)s = 10%%)')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    
+    args = parser.parse_args()
+    if args.worker:
+        name, size, repeat, max_time = json.loads(args.worker)
+        print(json.dumps(run_case(name, size, repeat, max_time)))
+        return 0
+    
+    baseline = load_baseline(args.compare) if args.compare else None
+    
+    print(f"Python {platform.python_version()} ({platform.platform()})")
+    print(f"{'항목':<32} {'크기':>9} {'p50':>10} {'p99':>10} {'처리량':>14} {'메모리':>9} {'횟수':>4}")
+    results = []
+    regressed = False
+    for name in args.cases:
+        sizes = args.gallery_sizes if CASES[name][1] == 'images' else args.sizes
+        for size in sizes:
+            try:
+                result = run_case_subprocess(name, size, args.repeat, args.max_time)
+            except Exception as e:
+                print(f"{name:<32} {size:>9,} 실패: {e}")
+                regressed = regressed or baseline is not None
+                continue
+            results.append(result)
+            comparison = None
+            if baseline is not None:
+                comparison, is_regression = compare_result(result, baseline.get(result_key(result)), args.threshold)
+                regressed = regressed or is_regression
+            print_result(result, comparison)
+    
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results)
+        print(f"\n기준값 저장: {args.save_baseline}")
+    if baseline is not None:
+        print(f"\n{'❌ 성능 회귀가 있습니다.' if regressed else '✅ 회귀 없음'} (기준: {args.compare}, 허용: {args.threshold:.0%})")
+    return 1 if regressed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,76 +1,30 @@
 #!/usr/bin/env python3
 """
 Images 폴더의 모든 이미지를 표시하는 갤러리 HTML 생성
+이미지는 썸네일로 표시하고 원본은 "전체 크기"를 누를 때 불러옴
 """
 
 import os
-import glob
-import base64
+import html
+import json
 from pathlib import Path
+from urllib.parse import quote
 
-def get_image_data_uri(image_path):
-    """이미지를 data URI로 변환"""
-    try:
-        with open(image_path, 'rb') as f:
-            data = f.read()
-            ext = os.path.splitext(image_path)[1].lower()
-            mime_map = {
-                '.svg': 'image/svg+xml',
-                '.png': 'image/png',
-                '.jpg': 'image/jpeg',
-                '.jpeg': 'image/jpeg',
-                '.gif': 'image/gif',
-                '.webp': 'image/webp'
-            }
-            mime_type = mime_map.get(ext, 'image/png')
-            
-            if ext == '.svg':
-                # SVG는 텍스트로 직접 포함
-                return data.decode('utf-8')
-            else:
-                # 다른 이미지는 base64로 인코딩
-                b64 = base64.b64encode(data).decode('utf-8')
-                return f'<img src="data:{mime_type};base64,{b64}" alt="{os.path.basename(image_path)}">'
-    except Exception as e:
-        print(f"Error reading {image_path}: {e}")
-        return None
+from gallery_manifest import INDEX_PLACEHOLDER, GalleryManifest, manifest_path
+from image_discovery import scan_images
 
-def create_image_gallery():
-    """이미지 갤러리 HTML 생성"""
-    
-    # Images 폴더 경로
-    images_dir = '../Images'
-    if not os.path.exists(images_dir):
-        print(f"Images 폴더를 찾을 수 없습니다: {images_dir}")
-        return False
-    
-    # 지원하는 이미지 확장자
-    extensions = ['*.svg', '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp']
-    
-    # 모든 이미지 파일 찾기
-    all_images = []
-    for ext in extensions:
-        pattern = os.path.join(images_dir, ext)
-        files = glob.glob(pattern)
-        all_images.extend(files)
-    
-    # 파일명으로 정렬
-    all_images.sort(key=lambda x: os.path.basename(x).lower())
-    
-    if not all_images:
-        print("Images 폴더에 이미지 파일이 없습니다.")
-        return False
-    
-    print(f"찾은 이미지 파일: {len(all_images)}개")
-    
-    # HTML 생성
-    html_content = """<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Image Gallery - Images Folder</title>
-    <style>
+# 출력 파일 쓰기 버퍼 크기
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# 썸네일 폴더 (갤러리 HTML과 같은 위치)
+THUMBNAIL_DIR = 'image_gallery_thumbs'
+
+# 페이지 모드: 페이지 파일 폴더와 페이지당 이미지 수
+PAGES_DIR = 'image_gallery_pages'
+PAGE_SIZE = 500
+
+# 갤러리 공통 스타일
+GALLERY_STYLE = """
         * {
             box-sizing: border-box;
         }
@@ -171,10 +125,6 @@ def create_image_gallery():
             width: auto;
             height: auto;
         }
-        .image-container svg {
-            width: 90%;
-            height: 90%;
-        }
         .circle-overlay {
             position: absolute;
             top: 50%;
@@ -273,7 +223,53 @@ def create_image_gallery():
             font-size: 20px;
             line-height: 1;
         }
-    </style>
+"""
+
+def script_json(value):
+    """<script> 안에 넣을 JSON (</script>로 끝나지 않도록 '</' 이스케이프)"""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+
+def relative_url(path, output_dir):
+    """갤러리 HTML 기준 상대 URL (#, ?, %, 공백 등이 든 파일 이름도 그대로 열리도록 인코딩)"""
+    return quote(os.path.relpath(path, output_dir).replace('\\', '/'))
+
+def gallery_item_html(image_path, output_dir, thumb_path=None, i=INDEX_PLACEHOLDER):
+    """이미지 하나의 HTML 조각 (썸네일이 없으면 원본을 표시, i는 이미지 번호)"""
+    filename = html.escape(os.path.basename(image_path))
+    ext = os.path.splitext(image_path)[1].lower()[1:]  # 확장자 (점 제외)
+    file_size = os.path.getsize(image_path) / 1024  # KB
+    
+    # 썸네일 (만들지 못했으면 원본) 경로
+    thumb_path = thumb_path or image_path
+    thumb_src = html.escape(relative_url(thumb_path, output_dir))
+    
+    return f"""
+        <div class="image-item visible" data-type="{ext}" data-index="{i}">
+            <div class="image-container" id="container-{i}">
+                <img src="{thumb_src}" alt="{filename}" loading="lazy">
+                <div class="circle-overlay"></div>
+            </div>
+            <div class="image-info">
+                <div class="image-title">{filename}</div>
+                <div class="image-meta">{ext.upper()} • {file_size:.1f} KB</div>
+            </div>
+            <div class="image-actions">
+                <button class="btn" onclick="viewFullsize({i})">전체 크기</button>
+                <button class="btn btn-primary" onclick="downloadImage({i})">다운로드</button>
+            </div>
+        </div>
+"""
+
+def generate_gallery_html(all_images, output_dir, fragments):
+    """갤러리 HTML을 조각 단위로 생성 (fragments: 이미지 순서대로의 HTML 조각)"""
+    # HTML 생성
+    yield """<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Image Gallery - Images Folder</title>
+    <style>""" + GALLERY_STYLE + """    </style>
 </head>
 <body>
     <div class="header">
@@ -309,36 +305,9 @@ def create_image_gallery():
 """
     
     # 각 이미지 아이템 추가
-    for i, image_path in enumerate(all_images):
-        filename = os.path.basename(image_path)
-        ext = os.path.splitext(filename)[1].lower()[1:]  # 확장자 (점 제외)
-        file_size = os.path.getsize(image_path) / 1024  # KB
-        
-        # 이미지 콘텐츠 가져오기
-        if ext == 'svg':
-            with open(image_path, 'r', encoding='utf-8') as f:
-                image_content = f.read()
-        else:
-            image_content = get_image_data_uri(image_path)
-        
-        html_content += f"""
-        <div class="image-item visible" data-type="{ext}" data-index="{i}">
-            <div class="image-container" id="container-{i}">
-                {image_content}
-                <div class="circle-overlay"></div>
-            </div>
-            <div class="image-info">
-                <div class="image-title">{filename}</div>
-                <div class="image-meta">{ext.upper()} • {file_size:.1f} KB</div>
-            </div>
-            <div class="image-actions">
-                <button class="btn" onclick="viewFullsize({i})">전체 크기</button>
-                <button class="btn btn-primary" onclick="downloadImage({i})">다운로드</button>
-            </div>
-        </div>
-"""
+    yield from fragments
     
-    html_content += """
+    yield """
     </div>
     
     <div class="modal" id="modal" onclick="closeModal()">
@@ -350,9 +319,9 @@ def create_image_gallery():
     
     <script>
         // 이미지 데이터
-        const imageData = """ + str([{
+        const imageData = """ + script_json([{
             'filename': os.path.basename(img),
-            'path': img,
+            'path': relative_url(img, output_dir),
             'ext': os.path.splitext(img)[1].lower()[1:]
         } for img in all_images]) + """;
         
@@ -406,9 +375,14 @@ def create_image_gallery():
         function viewFullsize(index) {
             const modal = document.getElementById('modal');
             const modalBody = document.getElementById('modal-body');
-            const container = document.getElementById(`container-${index}`);
+            const data = imageData[index];
             
-            modalBody.innerHTML = container.innerHTML;
+            // 원본 이미지는 전체 크기로 볼 때 불러옴
+            const img = document.createElement('img');
+            img.src = data.path;
+            img.alt = data.filename;
+            modalBody.innerHTML = '';
+            modalBody.appendChild(img);
             modal.style.display = 'block';
         }
         
@@ -418,28 +392,332 @@ def create_image_gallery():
         
         function downloadImage(index) {
             const data = imageData[index];
-            const container = document.getElementById(`container-${index}`);
             
-            if (data.ext === 'svg') {
-                // SVG 다운로드
-                const svg = container.querySelector('svg');
-                const svgString = new XMLSerializer().serializeToString(svg);
-                const blob = new Blob([svgString], {type: 'image/svg+xml'});
-                const url = URL.createObjectURL(blob);
-                const a = document.createElement('a');
-                a.href = url;
-                a.download = data.filename;
-                a.click();
-                URL.revokeObjectURL(url);
-            } else {
-                // 다른 이미지 다운로드
-                const img = container.querySelector('img');
-                const a = document.createElement('a');
-                a.href = img.src;
-                a.download = data.filename;
-                a.click();
+            // 썸네일이 아닌 원본 파일 다운로드
+            const a = document.createElement('a');
+            a.href = data.path;
+            a.download = data.filename;
+            a.click();
+        }
+        
+        // ESC 키로 모달 닫기
+        document.addEventListener('keydown', function(e) {
+            if (e.key === 'Escape') {
+                closeModal();
             }
+        });
+    </script>
+</body>
+</html>
+"""
+
+# 페이지 모드 추가 스타일 (절대 위치로 보이는 카드만 배치)
+PAGINATED_STYLE = """
+        .gallery.virtual {
+            display: block;
+            position: relative;
         }
+        .gallery.virtual .image-item {
+            display: block;
+            position: absolute;
+        }
+        .gallery.virtual .image-container {
+            background: var(--image-bg, #fafafa);
+        }
+        .gallery.virtual .image-title {
+            white-space: nowrap;
+            overflow: hidden;
+            text-overflow: ellipsis;
+        }
+        .gallery.show-circles .circle-overlay {
+            display: block;
+        }
+        .controls input[type="search"] {
+            width: 200px;
+        }
+"""
+
+def write_gallery_pages(all_images, output_dir, manifest, page_size=PAGE_SIZE):
+    """페이지 파일(page-N.js)을 쓰고 HTML에 넣을 JSON 색인 반환
+    
+    색인에는 검색/필터에 필요한 (파일명, 확장자, KB)만 넣고, 썸네일과 원본 경로는
+    페이지 파일에 나누어 저장한다. 페이지 파일은 file://에서도 읽을 수 있도록
+    galleryPage(번호, JSON) 호출 형식의 스크립트로 작성한다.
+    """
+    pages_dir = os.path.join(output_dir, PAGES_DIR)
+    thumb_dir = os.path.join(output_dir, THUMBNAIL_DIR)
+    os.makedirs(pages_dir, exist_ok=True)
+    
+    items = []
+    page_names = set()
+    for page, start in enumerate(range(0, len(all_images), page_size)):
+        entries = []
+        for image_path in all_images[start:start + page_size]:
+            filename = os.path.basename(image_path)
+            entry = manifest.entry(image_path)
+            thumb_path = os.path.join(thumb_dir, entry['thumbnail']) if entry['thumbnail'] else image_path
+            items.append([filename, os.path.splitext(filename)[1].lower()[1:], round(entry['size'] / 1024, 1)])
+            entries.append([relative_url(path, output_dir) for path in (thumb_path, image_path)])
+        
+        # 내용이 같은 페이지 파일은 다시 쓰지 않음
+        name = f"page-{page}.js"
+        page_names.add(name)
+        content = f"galleryPage({page}, {script_json(entries)});\n"
+        path = os.path.join(pages_dir, name)
+        try:
+            with open(path, encoding='utf-8') as f:
+                if f.read() == content:
+                    continue
+        except OSError:
+            pass
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+    
+    for entry in os.scandir(pages_dir):
+        if entry.name not in page_names:
+            os.remove(entry.path)
+    return {'pageSize': page_size, 'pagesDir': PAGES_DIR, 'items': items}
+
+def generate_paginated_html(index):
+    """페이지 모드 갤러리 HTML (화면에 보이는 카드만 그리고 검색/필터는 색인으로 처리)"""
+    yield """<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Image Gallery - Images Folder</title>
+    <style>""" + GALLERY_STYLE + PAGINATED_STYLE + """    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>Image Gallery</h1>
+        <div class="stats">Images 폴더 - 총 """ + str(len(index['items'])) + """개 파일 (<span id="matchCount"></span>)</div>
+    </div>
+    
+    <div class="controls">
+        <label>
+            <input type="checkbox" id="showCircles" onchange="toggleCircles()">
+            원형 가이드 표시
+        </label>
+        <label>
+            배경색: 
+            <select id="bgColor" onchange="changeBgColor()">
+                <option value="#fafafa">밝은 회색</option>
+                <option value="#ffffff">흰색</option>
+                <option value="#000000">검은색</option>
+                <option value="#1a1a1a">어두운 회색</option>
+                <option value="#13aefe">파란색</option>
+            </select>
+        </label>
+        <label>
+            검색:
+            <input type="search" id="search" placeholder="파일명" oninput="applyFilter()">
+        </label>
+        <div class="filter-buttons">
+            필터:
+            <button class="filter-btn active" onclick="filterImages('all')">전체</button>
+            <button class="filter-btn" onclick="filterImages('svg')">SVG</button>
+            <button class="filter-btn" onclick="filterImages('png')">PNG</button>
+            <button class="filter-btn" onclick="filterImages('jpg')">JPG</button>
+        </div>
+    </div>
+    
+    <div class="gallery virtual" id="gallery"></div>
+    
+    <div class="modal" id="modal" onclick="closeModal()">
+        <div class="modal-content" onclick="event.stopPropagation()">
+            <button class="close-modal" onclick="closeModal()">×</button>
+            <div id="modal-body"></div>
+        </div>
+    </div>
+    
+    <script type="application/json" id="galleryIndex">""" + script_json(index) + """</script>
+    <script>
+        // 이미지 색인: items[i] = [파일명, 확장자, KB]
+        const galleryIndex = JSON.parse(document.getElementById('galleryIndex').textContent);
+        const searchNames = galleryIndex.items.map(item => item[0].toLowerCase());
+        
+        const MIN_CARD_WIDTH = 250;
+        const GAP = 20;
+        const INFO_HEIGHT = 115;  // 카드에서 이미지 아래 (정보 + 버튼) 높이
+        const OVERSCAN_ROWS = 2;  // 화면 위아래로 미리 그려 둘 행 수
+        
+        const pages = {};
+        const loadingPages = {};
+        let filterType = 'all';
+        let visibleItems = [];
+        let columns = 1;
+        let cardWidth = MIN_CARD_WIDTH;
+        let rowHeight = MIN_CARD_WIDTH + INFO_HEIGHT + GAP;
+        let renderedRange = '';
+        let renderQueued = false;
+        
+        // 페이지 파일이 호출 (썸네일/원본 경로)
+        function galleryPage(page, entries) {
+            pages[page] = entries;
+            delete loadingPages[page];
+            renderedRange = '';
+            scheduleRender();
+        }
+        
+        function loadPage(page) {
+            if (pages[page] || loadingPages[page]) {
+                return;
+            }
+            loadingPages[page] = true;
+            const script = document.createElement('script');
+            script.src = `${galleryIndex.pagesDir}/page-${page}.js`;
+            script.onerror = () => console.error(`페이지 파일을 불러올 수 없습니다: ${script.src}`);
+            document.head.appendChild(script);
+        }
+        
+        function pageEntry(index) {
+            const page = Math.floor(index / galleryIndex.pageSize);
+            if (!pages[page]) {
+                loadPage(page);
+                return null;
+            }
+            return pages[page][index % galleryIndex.pageSize];
+        }
+        
+        function escapeHtml(text) {
+            return String(text).replace(/[&<>"']/g, ch => (
+                {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[ch]));
+        }
+        
+        function toggleCircles() {
+            const showCircles = document.getElementById('showCircles').checked;
+            document.getElementById('gallery').classList.toggle('show-circles', showCircles);
+        }
+        
+        function changeBgColor() {
+            const color = document.getElementById('bgColor').value;
+            document.getElementById('gallery').style.setProperty('--image-bg', color);
+        }
+        
+        function filterImages(type) {
+            filterType = type;
+            
+            // 버튼 상태 업데이트
+            document.querySelectorAll('.filter-btn').forEach(btn => {
+                btn.classList.remove('active');
+                if (btn.textContent.toLowerCase().includes(type) || 
+                    (type === 'all' && btn.textContent === '전체')) {
+                    btn.classList.add('active');
+                }
+            });
+            applyFilter();
+        }
+        
+        function applyFilter() {
+            const query = document.getElementById('search').value.trim().toLowerCase();
+            visibleItems = [];
+            galleryIndex.items.forEach((item, i) => {
+                const ext = item[1];
+                const typeMatch = filterType === 'all' || ext === filterType || 
+                    (filterType === 'jpg' && ext === 'jpeg');
+                if (typeMatch && (!query || searchNames[i].includes(query))) {
+                    visibleItems.push(i);
+                }
+            });
+            document.getElementById('matchCount').textContent = `표시 ${visibleItems.length}개`;
+            layout();
+        }
+        
+        function layout() {
+            const gallery = document.getElementById('gallery');
+            const width = gallery.clientWidth;
+            columns = Math.max(1, Math.floor((width + GAP) / (MIN_CARD_WIDTH + GAP)));
+            cardWidth = (width - GAP * (columns - 1)) / columns;
+            rowHeight = cardWidth + INFO_HEIGHT + GAP;
+            gallery.style.height = `${Math.ceil(visibleItems.length / columns) * rowHeight}px`;
+            renderedRange = '';
+            render();
+        }
+        
+        function scheduleRender() {
+            if (renderQueued) {
+                return;
+            }
+            renderQueued = true;
+            requestAnimationFrame(() => {
+                renderQueued = false;
+                render();
+            });
+        }
+        
+        // 화면에 보이는 행 (+ 여유 행)의 카드만 그림
+        function render() {
+            const gallery = document.getElementById('gallery');
+            const top = gallery.getBoundingClientRect().top;
+            const firstRow = Math.max(0, Math.floor(-top / rowHeight) - OVERSCAN_ROWS);
+            const lastRow = Math.max(0, Math.ceil((window.innerHeight - top) / rowHeight) + OVERSCAN_ROWS);
+            const start = Math.min(visibleItems.length, firstRow * columns);
+            const end = Math.min(visibleItems.length, lastRow * columns);
+            const range = `${start}:${end}`;
+            if (range === renderedRange) {
+                return;
+            }
+            renderedRange = range;
+            
+            const cards = [];
+            for (let n = start; n < end; n++) {
+                const i = visibleItems[n];
+                const [filename, ext, size] = galleryIndex.items[i];
+                const entry = pageEntry(i);
+                const image = entry ? `<img src="${escapeHtml(entry[0])}" alt="${escapeHtml(filename)}" loading="lazy">` : '';
+                const left = (n % columns) * (cardWidth + GAP);
+                const y = Math.floor(n / columns) * rowHeight;
+                cards.push(`
+        <div class="image-item" style="left: ${left}px; top: ${y}px; width: ${cardWidth}px; height: ${cardWidth + INFO_HEIGHT}px">
+            <div class="image-container">
+                ${image}
+                <div class="circle-overlay"></div>
+            </div>
+            <div class="image-info">
+                <div class="image-title" title="${escapeHtml(filename)}">${escapeHtml(filename)}</div>
+                <div class="image-meta">${ext.toUpperCase()} • ${size.toFixed(1)} KB</div>
+            </div>
+            <div class="image-actions">
+                <button class="btn" onclick="viewFullsize(${i})">전체 크기</button>
+                <button class="btn btn-primary" onclick="downloadImage(${i})">다운로드</button>
+            </div>
+        </div>`);
+            }
+            gallery.innerHTML = cards.join('');
+        }
+        
+        function viewFullsize(index) {
+            const entry = pageEntry(index);
+            if (!entry) {
+                return;
+            }
+            const modalBody = document.getElementById('modal-body');
+            const img = document.createElement('img');
+            img.src = entry[1];
+            img.alt = galleryIndex.items[index][0];
+            modalBody.innerHTML = '';
+            modalBody.appendChild(img);
+            document.getElementById('modal').style.display = 'block';
+        }
+        
+        function closeModal() {
+            document.getElementById('modal').style.display = 'none';
+        }
+        
+        function downloadImage(index) {
+            const entry = pageEntry(index);
+            if (!entry) {
+                return;
+            }
+            const a = document.createElement('a');
+            a.href = entry[1];
+            a.download = galleryIndex.items[index][0];
+            a.click();
+        }
+        
+        window.addEventListener('scroll', scheduleRender, {passive: true});
+        window.addEventListener('resize', layout);
         
         // ESC 키로 모달 닫기
         document.addEventListener('keydown', function(e) {
@@ -447,15 +725,55 @@ def create_image_gallery():
                 closeModal();
             }
         });
+        
+        applyFilter();
     </script>
 </body>
 </html>
 """
+
+def create_image_gallery(paginated=False, page_size=PAGE_SIZE):
+    """이미지 갤러리 HTML 생성 (paginated: JSON 색인 + 페이지 파일, 보이는 카드만 표시)"""
     
-    # HTML 파일 저장
+    # Images 폴더 경로
+    images_dir = '../Images'
+    if not os.path.exists(images_dir):
+        print(f"Images 폴더를 찾을 수 없습니다: {images_dir}")
+        return False
+    
+    # 모든 이미지 파일 찾기 (하위 폴더 포함, 찾는 대로 매니페스트와 비교하여
+    # 추가/변경된 이미지만 썸네일과 HTML 조각 만들기)
     output_path = '../image_gallery.html'
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    output_dir = os.path.dirname(output_path)
+    thumb_dir = os.path.join(output_dir, THUMBNAIL_DIR)
+    generator = 'create_image_gallery/paginated' if paginated else 'create_image_gallery'
+    manifest = GalleryManifest(manifest_path(output_dir, generator), generator)
+    if paginated:
+        # 페이지 모드는 HTML 조각 없이 썸네일만 기록
+        added, changed, removed = manifest.update(scan_images(images_dir), thumb_dir)
+    else:
+        added, changed, removed = manifest.update(
+            scan_images(images_dir), thumb_dir,
+            lambda image_path, thumb_path: gallery_item_html(image_path, output_dir, thumb_path))
+    
+    # 파일명으로 정렬
+    all_images = sorted(manifest.paths, key=lambda x: os.path.basename(x).lower())
+    
+    if not all_images:
+        print("Images 폴더에 이미지 파일이 없습니다.")
+        return False
+    
+    print(f"찾은 이미지 파일: {len(all_images)}개")
+    print(f"변경 사항: 추가 {len(added)}개, 변경 {len(changed)}개, 삭제 {len(removed)}개")
+    
+    # HTML 파일 저장 (이미지 하나씩 만들어 바로 기록)
+    with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        if paginated:
+            index = write_gallery_pages(all_images, output_dir, manifest, page_size)
+            f.writelines(generate_paginated_html(index))
+        else:
+            f.writelines(generate_gallery_html(all_images, output_dir, manifest.fragments(all_images)))
+    manifest.save()
     
     print(f"✅ 이미지 갤러리가 생성되었습니다: {output_path}")
     print(f"   총 {len(all_images)}개 이미지")
@@ -472,5 +790,25 @@ def create_image_gallery():
     
     return True
 
+def main():
+    """메인 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Images 폴더 이미지 갤러리 HTML 생성')
+    parser.add_argument('--paginated', action='store_true',
+                        help='페이지 모드 (JSON 색인 + 페이지 파일, 화면에 보이는 이미지만 표시)')
+    parser.add_argument('--page-size', type=int, default=PAGE_SIZE,
+                        help='페이지 모드에서 페이지 파일당 이미지 수 (기본: %(default)s)')
+    parser.add_argument('--serve', action='store_true',
+                        help='HTML을 만들지 않고 미리보기 서버 실행 (썸네일은 요청할 때 생성)')
+    parser.add_argument('--port', type=int, default=8000, help='--serve 포트 (기본: %(default)s)')
+    
+    args = parser.parse_args()
+    if args.serve:
+        from gallery_server import serve
+        serve('../Images', port=args.port, page_size=args.page_size)
+        return
+    create_image_gallery(args.paginated, args.page_size)
+
 if __name__ == "__main__":
-    create_image_gallery()
\ No newline at end of file
+    main()
\ No newline at end of file
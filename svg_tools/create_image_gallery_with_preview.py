@@ -2,81 +2,64 @@
 """
 Images 폴더의 모든 이미지를 실제 이미지로 표시하는 갤러리 HTML 생성
 SVG는 img 태그로 로드하여 표시
+갤러리에는 썸네일을 표시하고 원본은 열기/다운로드할 때 불러옴
 """
 
 import os
-import glob
-import base64
+import html
+import json
 from pathlib import Path
+from urllib.parse import quote
 
-def get_image_src(image_path, base_dir):
-    """이미지 경로를 적절한 src로 변환"""
-    ext = os.path.splitext(image_path)[1].lower()
-    
-    if ext == '.svg':
-        # SVG는 HTML 파일 위치에서의 상대 경로로 변환
-        rel_path = os.path.relpath(image_path, base_dir).replace('\\', '/')
-        return rel_path
-    else:
-        # 다른 이미지는 base64로 인코딩
-        try:
-            with open(image_path, 'rb') as f:
-                data = f.read()
-                mime_map = {
-                    '.png': 'image/png',
-                    '.jpg': 'image/jpeg',
-                    '.jpeg': 'image/jpeg',
-                    '.gif': 'image/gif',
-                    '.webp': 'image/webp'
-                }
-                mime_type = mime_map.get(ext, 'image/png')
-                b64 = base64.b64encode(data).decode('utf-8')
-                return f'data:{mime_type};base64,{b64}'
-        except Exception as e:
-            print(f"Error reading {image_path}: {e}")
-            return None
+from gallery_manifest import INDEX_PLACEHOLDER, GalleryManifest, manifest_path
+from image_discovery import scan_images
 
-def create_image_gallery_with_preview():
-    """이미지 갤러리 HTML 생성 (모든 이미지를 img 태그로)"""
-    
-    # Images 폴더 경로
-    # 현재 스크립트 위치에서 상대 경로 계산
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    images_dir = os.path.join(os.path.dirname(script_dir), 'Images')
-    
-    if not os.path.exists(images_dir):
-        print(f"Images 폴더를 찾을 수 없습니다: {images_dir}")
-        # 대체 경로 시도
-        images_dir = os.path.join(script_dir, '..', 'Images')
-        if not os.path.exists(images_dir):
-            print(f"대체 경로도 실패: {images_dir}")
-            return False
-    
-    # 지원하는 이미지 확장자
-    extensions = ['*.svg', '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp']
-    
-    # 모든 이미지 파일 찾기
-    all_images = []
-    for ext in extensions:
-        pattern = os.path.join(images_dir, ext)
-        files = glob.glob(pattern)
-        all_images.extend(files)
-    
-    # 파일명으로 정렬
-    all_images.sort(key=lambda x: os.path.basename(x).lower())
-    
-    if not all_images:
-        print("Images 폴더에 이미지 파일이 없습니다.")
-        return False
-    
-    print(f"찾은 이미지 파일: {len(all_images)}개")
+# 출력 파일 쓰기 버퍼 크기
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# 썸네일 폴더 (갤러리 HTML과 같은 위치)
+THUMBNAIL_DIR = 'image_gallery_thumbs'
+
+def relative_url(path, output_dir):
+    """갤러리 HTML 기준 상대 URL (#, ?, %, 공백 등이 든 파일 이름도 그대로 열리도록 인코딩)"""
+    return quote(os.path.relpath(path, output_dir).replace('\\', '/'))
+
+def gallery_item_html(image_path, output_dir, thumb_path=None, i=INDEX_PLACEHOLDER):
+    """이미지 하나의 HTML 조각 (썸네일이 없으면 원본을 표시, i는 이미지 번호)"""
+    filename = html.escape(os.path.basename(image_path))
+    ext = os.path.splitext(image_path)[1].lower()[1:]  # 확장자 (점 제외)
+    file_size = os.path.getsize(image_path) / 1024  # KB
     
-    # 출력 경로 먼저 설정
-    output_path = os.path.join(os.path.dirname(script_dir), 'image_gallery.html')
-    output_dir = os.path.dirname(output_path)
+    # 썸네일 (만들지 못했으면 원본) 경로
+    thumb_path = thumb_path or image_path
+    img_src = html.escape(relative_url(thumb_path, output_dir))
+    rel_path = html.escape(os.path.relpath(image_path, output_dir).replace('\\', '/'))
     
+    return f"""
+        <div class="image-item" data-index="{i}">
+            <div class="image-frame" id="frame-{i}">
+                <img src="{img_src}" alt="{filename}" loading="lazy" 
+                     onerror="handleImageError({i})"
+                     onload="handleImageLoad({i})">
+                <div class="circle-guide"></div>
+            </div>
+            <div class="image-info">
+                <div class="image-title">{filename}</div>
+                <div class="image-meta">{ext.upper()} • {file_size:.1f} KB</div>
+                <div class="image-path">{rel_path}</div>
+                <div class="image-actions">
+                    <button class="btn" onclick="openInNewTab({i})">새 탭에서 열기</button>
+                    <button class="btn btn-primary" onclick="downloadOriginal({i})">원본 다운로드</button>
+                    <button class="btn btn-success" onclick="downloadAsPNG({i})">PNG로 저장</button>
+                </div>
+            </div>
+        </div>
+"""
+
+def generate_gallery_html(all_images, output_dir, fragments):
+    """갤러리 HTML을 조각 단위로 생성 (fragments: 이미지 순서대로의 HTML 조각)"""
     # HTML 생성
-    html_content = """<!DOCTYPE html>
+    yield """<!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
@@ -308,47 +291,18 @@ def create_image_gallery_with_preview():
 """
     
     # 각 이미지 아이템 추가
-    for i, image_path in enumerate(all_images):
-        filename = os.path.basename(image_path)
-        ext = os.path.splitext(filename)[1].lower()[1:]  # 확장자 (점 제외)
-        file_size = os.path.getsize(image_path) / 1024  # KB
-        
-        # 이미지 src 가져오기
-        img_src = get_image_src(image_path, output_dir)
-        rel_path = os.path.relpath(image_path, output_dir).replace('\\', '/')
-        
-        html_content += f"""
-        <div class="image-item" data-index="{i}">
-            <div class="image-frame" id="frame-{i}">
-                <img src="{img_src}" alt="{filename}" loading="lazy" 
-                     onerror="handleImageError({i})"
-                     onload="handleImageLoad({i})">
-                <div class="circle-guide"></div>
-            </div>
-            <div class="image-info">
-                <div class="image-title">{filename}</div>
-                <div class="image-meta">{ext.upper()} • {file_size:.1f} KB</div>
-                <div class="image-path">{rel_path}</div>
-                <div class="image-actions">
-                    <button class="btn" onclick="openInNewTab({i})">새 탭에서 열기</button>
-                    <button class="btn btn-primary" onclick="downloadOriginal({i})">원본 다운로드</button>
-                    <button class="btn btn-success" onclick="downloadAsPNG({i})">PNG로 저장</button>
-                </div>
-            </div>
-        </div>
-"""
+    yield from fragments
     
-    html_content += """
+    yield """
     </div>
     
     <script>
         // 이미지 데이터
-        const imageData = """ + str([{
+        const imageData = """ + json.dumps([{
             'filename': os.path.basename(img),
-            'path': os.path.relpath(img, os.path.dirname(output_path)).replace('\\', '/'),
-            'ext': os.path.splitext(img)[1].lower()[1:],
-            'src': get_image_src(img, os.path.dirname(output_path))
-        } for img in all_images]) + """;
+            'path': relative_url(img, output_dir),
+            'ext': os.path.splitext(img)[1].lower()[1:]
+        } for img in all_images], ensure_ascii=False).replace('</', '<\\/') + """;
         
         function toggleCircles() {
             const gallery = document.getElementById('gallery');
@@ -413,7 +367,6 @@ def create_image_gallery_with_preview():
         
         function downloadAsPNG(index) {
             const data = imageData[index];
-            const img = document.querySelector(`#frame-${index} img`);
             
             // Canvas 생성
             const canvas = document.createElement('canvas');
@@ -459,10 +412,17 @@ def create_image_gallery_with_preview():
                         convertToPNG(canvas, ctx, data, null);
                     });
             } else {
-                // PNG 등 다른 이미지는 원본 크기 사용
-                canvas.width = img.naturalWidth || 1000;
-                canvas.height = img.naturalHeight || 1000;
-                convertToPNG(canvas, ctx, data, null);
+                // PNG 등 다른 이미지는 원본을 불러와 원본 크기 사용 (갤러리에는 썸네일만 있음)
+                const original = new Image();
+                original.onload = function() {
+                    canvas.width = original.naturalWidth || 1000;
+                    canvas.height = original.naturalHeight || 1000;
+                    convertToPNG(canvas, ctx, data, null);
+                };
+                original.onerror = function() {
+                    alert('원본 이미지를 불러올 수 없습니다.');
+                };
+                original.src = data.path;
             }
         }
         
@@ -518,17 +478,56 @@ def create_image_gallery_with_preview():
                         imgObj.src = data.path;
                     });
             } else {
-                imgObj.src = data.src || data.path;
+                imgObj.src = data.path;
             }
         }
     </script>
 </body>
 </html>
 """
+
+def create_image_gallery_with_preview():
+    """이미지 갤러리 HTML 생성 (모든 이미지를 img 태그로)"""
+    
+    # Images 폴더 경로
+    # 현재 스크립트 위치에서 상대 경로 계산
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    images_dir = os.path.join(os.path.dirname(script_dir), 'Images')
+    
+    if not os.path.exists(images_dir):
+        print(f"Images 폴더를 찾을 수 없습니다: {images_dir}")
+        # 대체 경로 시도
+        images_dir = os.path.join(script_dir, '..', 'Images')
+        if not os.path.exists(images_dir):
+            print(f"대체 경로도 실패: {images_dir}")
+            return False
+    
+    # 출력 경로 먼저 설정
+    output_path = os.path.join(os.path.dirname(script_dir), 'image_gallery.html')
+    output_dir = os.path.dirname(output_path)
+    
+    # 모든 이미지 파일 찾기 (하위 폴더 포함, 찾는 대로 매니페스트와 비교하여
+    # 추가/변경된 이미지만 썸네일과 HTML 조각 만들기)
+    generator = 'create_image_gallery_with_preview'
+    manifest = GalleryManifest(manifest_path(output_dir, generator), generator)
+    added, changed, removed = manifest.update(
+        scan_images(images_dir), os.path.join(output_dir, THUMBNAIL_DIR),
+        lambda image_path, thumb_path: gallery_item_html(image_path, output_dir, thumb_path))
+    
+    # 파일명으로 정렬
+    all_images = sorted(manifest.paths, key=lambda x: os.path.basename(x).lower())
+    
+    if not all_images:
+        print("Images 폴더에 이미지 파일이 없습니다.")
+        return False
+    
+    print(f"찾은 이미지 파일: {len(all_images)}개")
+    print(f"변경 사항: 추가 {len(added)}개, 변경 {len(changed)}개, 삭제 {len(removed)}개")
     
-    # HTML 파일 저장
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # HTML 파일 저장 (이미지 하나씩 만들어 바로 기록)
+    with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        f.writelines(generate_gallery_html(all_images, output_dir, manifest.fragments(all_images)))
+    manifest.save()
     
     print(f"✅ 이미지 갤러리가 생성되었습니다: {output_path}")
     print(f"   총 {len(all_images)}개 이미지")
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+SVG 하나로 여러 크기의 아이콘 세트 만들기
+- SVG는 작업 프로세스마다 한 번만 파싱하고, 크기별 렌더링은 병렬 처리
+- 256px 이하 PNG를 묶어 .ico 파일 작성 (PNG 항목, struct로 직접 기록)
+- 모든 크기를 한 장에 모은 스프라이트 시트 + 위치 정보 JSON (Pillow 필요)
+- 렌더링 캐시에 있는 크기는 다시 렌더링하지 않음
+"""
+
+import json
+import os
+import struct
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from render_cache import RenderCache
+from svg_to_png import BACKENDS, InkscapeShell, SVGConverter, backend_version, load_svg, render_loaded
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow가 없으면 스프라이트 시트는 만들지 않음
+    Image = None
+
+DEFAULT_SIZES = (16, 32, 48, 64, 128, 256, 512, 1024)
+ICO_MAX_SIZE = 256
+
+IconSet = namedtuple('IconSet', ['pngs', 'ico', 'sprite'])
+IconSet.__doc__ = """크기별 PNG 경로 dict, .ico 경로, 스프라이트 시트 경로 (만들지 않았으면 None)"""
+
+# 작업 프로세스별로 마지막에 파싱한 SVG: (변환 방법, 경로, 수정 시각) -> 파싱 결과
+_loaded = {}
+
+def _render_task(task):
+    """크기 하나 렌더링 (같은 SVG는 프로세스 안에서 다시 파싱하지 않음)
+    
+    실패하면 다음 변환 방법으로 다시 시도할 수 있도록 예외 대신 오류 메시지를 반환한다.
+    """
+    backend, svg_path, size, png_path = task
+    try:
+        key = (backend, svg_path, os.path.getmtime(svg_path))
+        loaded = _loaded.get(key)
+        if loaded is None:
+            _loaded.clear()
+            loaded = _loaded[key] = load_svg(backend, svg_path)
+        render_loaded(backend, loaded, png_path, size, size)
+    except Exception as e:
+        return task, str(e)
+    return task, None
+
+def _render_tasks(backend, tasks, workers=None):
+    """(svg 경로, 크기, png 경로) 목록을 backend로 렌더링하고 (작업, 오류 메시지) 목록 반환
+    
+    Inkscape는 셸 하나에서 문서를 한 번 열어 모든 크기를 내보낸다.
+    """
+    if backend == 'inkscape':
+        outputs = {}
+        for svg_path, size, png_path in tasks:
+            outputs.setdefault(svg_path, []).append((png_path, size, size))
+        results = []
+        shell = InkscapeShell()
+        try:
+            for svg_path, svg_outputs in outputs.items():
+                try:
+                    shell.export_many(svg_path, svg_outputs)
+                    error = None
+                except Exception as e:
+                    error = str(e)
+                results.extend(((svg_path, size, png_path), error) for png_path, size, _ in svg_outputs)
+        finally:
+            shell.close()
+        return results
+    
+    tasks = [(backend,) + task for task in tasks]
+    if workers == 1 or len(tasks) <= 1:
+        results = map(_render_task, tasks)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_render_task, tasks))
+    return [(task[1:], error) for task, error in results]
+
+def png_size(data):
+    """PNG 데이터의 IHDR에서 (너비, 높이) 읽기"""
+    if data[:8] != b'\x89PNG\r\n\x1a\n' or data[12:16] != b'IHDR':
+        raise ValueError("PNG 파일이 아닙니다.")
+    return struct.unpack('>II', data[16:24])
+
+def write_ico(pngs, ico_path):
+    """크기별 PNG로 .ico 파일 작성 (256px 이하만 포함, 항목은 PNG 그대로)
+    
+    만든 파일 경로를 반환하며 넣을 크기가 없으면 None.
+    """
+    entries = []
+    for size in sorted(pngs):
+        if size > ICO_MAX_SIZE:
+            continue
+        with open(pngs[size], 'rb') as f:
+            data = f.read()
+        entries.append((png_size(data), data))
+    if not entries:
+        return None
+    
+    # ICONDIR: 예약(0), 형식(1 = 아이콘), 항목 수
+    header = struct.pack('<HHH', 0, 1, len(entries))
+    offset = len(header) + 16 * len(entries)
+    directory = []
+    for (width, height), data in entries:
+        # ICONDIRENTRY: 너비/높이 (0은 256), 색 수, 예약, 색 평면, 비트 수, 데이터 크기, 위치
+        directory.append(struct.pack('<BBBBHHII', width % 256, height % 256, 0, 0, 1, 32,
+                                     len(data), offset))
+        offset += len(data)
+    
+    with open(ico_path, 'wb') as f:
+        f.write(header)
+        f.writelines(directory)
+        f.writelines(data for _, data in entries)
+    return ico_path
+
+def write_sprite(pngs, sprite_path, padding=2):
+    """모든 크기를 가로로 이어 붙인 스프라이트 시트와 위치 정보 JSON 작성
+    
+    Pillow가 없으면 None을 반환한다.
+    """
+    if Image is None:
+        return None
+    
+    images = [(size, Image.open(pngs[size]).convert('RGBA')) for size in sorted(pngs)]
+    width = sum(image.width for _, image in images) + padding * (len(images) - 1)
+    height = max(image.height for _, image in images)
+    sheet = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    
+    frames = {}
+    x = 0
+    for size, image in images:
+        sheet.paste(image, (x, 0))
+        frames[str(size)] = {'x': x, 'y': 0, 'width': image.width, 'height': image.height}
+        x += image.width + padding
+    sheet.save(sprite_path)
+    
+    with open(os.path.splitext(sprite_path)[0] + '.json', 'w', encoding='utf-8') as f:
+        json.dump({'image': os.path.basename(sprite_path), 'frames': frames}, f, indent=2)
+    return sprite_path
+
+def export_icon_sets(svg_paths, output_dir=None, sizes=DEFAULT_SIZES, ico=True, sprite=False,
+                     workers=None, backend=None, cache=True):
+    """여러 SVG의 아이콘 세트를 한 번에 만들고 {SVG 경로: IconSet} 반환
+    
+    output_dir가 없으면 SVG 옆의 <이름>_icons 폴더에 저장한다.
+    렌더링은 프로세스 풀에서 크기별로 나누어 처리하고, Inkscape는 셸 하나에서
+    문서를 한 번 열어 모든 크기를 내보낸다.
+    SVGConverter처럼 렌더링에 실패한 크기는 다음 변환 방법으로 다시 렌더링한다.
+    cache는 True(기본 캐시), False(사용 안 함) 또는 RenderCache 객체.
+    """
+    backends = SVGConverter(backend, verbose=False, cache=False).backends
+    if not backends:
+        raise RuntimeError("사용할 수 있는 변환 방법이 없습니다.")
+    if cache is True:
+        cache = RenderCache()
+    versions = {backend: backend_version(backend) for backend in backends} if cache else {}
+    sizes = sorted(set(sizes), reverse=True)  # 큰 크기부터 시작해 작업 시간을 고르게 분배
+    
+    pngs = {}
+    layout = {}
+    cache_keys = {}
+    tasks = []
+    for svg_path in svg_paths:
+        base = os.path.splitext(os.path.basename(svg_path))[0]
+        directory = output_dir or os.path.splitext(svg_path)[0] + '_icons'
+        os.makedirs(directory, exist_ok=True)
+        layout[svg_path] = (directory, base)
+        pngs[svg_path] = {size: os.path.join(directory, f"{base}_{size}.png") for size in sizes}
+        if cache:
+            with open(svg_path, 'rb') as f:
+                content = f.read()
+        for size in sizes:
+            png_path = pngs[svg_path][size]
+            if cache:
+                # 어느 방법으로든 같은 내용과 크기로 렌더링한 적이 있으면 다시 렌더링하지 않음
+                keys = {backend: cache.key(content, backend, size, size, versions[backend])
+                        for backend in backends}
+                if any(cache.fetch(key, png_path) for key in keys.values()):
+                    continue
+                cache_keys[png_path] = keys
+            tasks.append((svg_path, size, png_path))
+    
+    # 실패한 크기만 모아 다음 변환 방법으로 다시 렌더링
+    rendered = {}
+    errors = []
+    for backend in backends:
+        if not tasks:
+            break
+        failed = []
+        for task, error in _render_tasks(backend, tasks, workers):
+            if error is None:
+                rendered[task[2]] = backend
+            else:
+                print(f"{backend} 변환 실패 ({task[0]}, {task[1]}px): {error}")
+                failed.append(task)
+                errors.append(error)
+        tasks = failed
+    
+    if cache:
+        for png_path, backend in rendered.items():
+            cache.put(cache_keys[png_path][backend], png_path)
+        cache.flush_stats()
+    if tasks:
+        svg_path, size, _ = tasks[0]
+        raise RuntimeError(f"{svg_path} ({size}px) 등 {len(tasks)}개 크기를 렌더링하지 못했습니다: {errors[-1]}")
+    
+    results = {}
+    for svg_path, outputs in pngs.items():
+        directory, base = layout[svg_path]
+        ico_path = write_ico(outputs, os.path.join(directory, f"{base}.ico")) if ico else None
+        sprite_path = write_sprite(outputs, os.path.join(directory, f"{base}_sprite.png")) if sprite else None
+        results[svg_path] = IconSet(dict(sorted(outputs.items())), ico_path, sprite_path)
+    return results
+
+def export_icon_set(svg_path, output_dir=None, sizes=DEFAULT_SIZES, ico=True, sprite=False,
+                    workers=None, backend=None, cache=True):
+    """SVG 하나로 아이콘 세트 (크기별 PNG, .ico, 스프라이트 시트) 만들기"""
+    return export_icon_sets([svg_path], output_dir, sizes, ico, sprite, workers, backend,
+                            cache)[svg_path]
+
+def main():
+    """메인 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='SVG로 여러 크기의 아이콘 세트 만들기')
+    parser.add_argument('svg_files', nargs='+', help='SVG 파일 경로 (여러 개 가능)')
+    parser.add_argument('-o', '--output-dir', help='출력 폴더 (기본: <이름>_icons)')
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='쉼표로 구분한 크기 목록 (기본: %(default)s)')
+    parser.add_argument('--no-ico', action='store_true', help='.ico 파일을 만들지 않음')
+    parser.add_argument('--sprite', action='store_true', help='스프라이트 시트 만들기 (Pillow 필요)')
+    parser.add_argument('-j', '--workers', type=int, help='작업 프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('--backend', choices=BACKENDS, help='변환 방법 지정 (기본: 자동 선택)')
+    parser.add_argument('--no-cache', action='store_true', help='렌더링 캐시를 사용하지 않음')
+    
+    args = parser.parse_args()
+    try:
+        sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    except ValueError:
+        parser.error(f"잘못된 크기 목록: {args.sizes}")
+    
+    missing = [path for path in args.svg_files if not os.path.exists(path)]
+    if missing:
+        print(f"SVG 파일을 찾을 수 없습니다: {', '.join(missing)}")
+        sys.exit(1)
+    
+    if args.sprite and Image is None:
+        print("Pillow가 설치되어 있지 않아 스프라이트 시트는 만들지 않습니다. (pip install pillow)")
+    
+    start = time.perf_counter()
+    try:
+        results = export_icon_sets(args.svg_files, args.output_dir, sizes, not args.no_ico,
+                                   args.sprite, args.workers, args.backend, not args.no_cache)
+    except Exception as e:
+        print(f"❌ 아이콘 세트 생성 실패: {e}")
+        sys.exit(1)
+    
+    for svg_path, icon_set in results.items():
+        print(f"✅ {svg_path}: PNG {len(icon_set.pngs)}개 ({', '.join(map(str, icon_set.pngs))})")
+        if icon_set.ico:
+            print(f"   ICO: {icon_set.ico}")
+        if icon_set.sprite:
+            print(f"   스프라이트: {icon_set.sprite}")
+    print(f"\n완료: {time.perf_counter() - start:.2f}초")
+
+if __name__ == "__main__":
+    main()
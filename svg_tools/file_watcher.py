@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+파일 변경 감시
+- Linux는 inotify(ctypes)로 파일이 있는 폴더를 감시 (저장 즉시 알림, 이름 바꾸기 저장도 감지)
+- 다른 환경이나 inotify를 쓸 수 없으면 수정 시각/크기를 짧은 간격으로 비교
+- 편집기가 여러 번 나누어 쓰는 경우를 위해 마지막 알림 후 잠시 기다렸다가 한 번에 반환
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+DEFAULT_POLL_INTERVAL = 0.05  # 초
+DEFAULT_SETTLE_TIME = 0.02  # 초 (연속된 쓰기를 한 번의 변경으로 묶는 시간)
+
+# inotify 상수 (linux/inotify.h)
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, 'O_CLOEXEC', 0o2000000)
+
+_EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+def _load_libc():
+    """inotify 함수가 있는 libc (없으면 None)"""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+    except (OSError, AttributeError):
+        return None
+    libc.inotify_add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+    return libc
+
+def file_state(path):
+    """변경 비교용 (수정 시각, 크기), 파일이 없으면 None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+class FileWatcher:
+    """파일 목록의 변경 감시
+    
+    wait()는 바뀐 파일 경로 집합을 반환한다 (timeout 동안 변경이 없으면 빈 집합).
+    method는 'inotify' 또는 'polling'.
+    """
+
+    def __init__(self, paths, poll_interval=DEFAULT_POLL_INTERVAL, settle_time=DEFAULT_SETTLE_TIME,
+                 use_inotify=True):
+        self.paths = {os.path.abspath(path) for path in paths}
+        self.poll_interval = poll_interval
+        self.settle_time = settle_time
+        self.states = {path: file_state(path) for path in self.paths}  # 마지막으로 반환한 상태
+        self._polled = dict(self.states)  # 수정 시각 비교 방식에서 마지막으로 확인한 상태
+        self._fd = None
+        self._watches = {}  # wd -> 폴더
+        libc = _load_libc() if use_inotify else None
+        if libc is not None:
+            self._start_inotify(libc)
+        self.method = 'polling' if self._fd is None else 'inotify'
+
+    def _start_inotify(self, libc):
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return
+        # 편집기는 임시 파일에 쓰고 이름을 바꾸는 경우가 많아 파일이 아닌 폴더를 감시
+        for directory in {os.path.dirname(path) for path in self.paths}:
+            wd = libc.inotify_add_watch(fd, os.fsencode(directory), IN_CLOSE_WRITE | IN_MOVED_TO | IN_MODIFY)
+            if wd < 0:
+                os.close(fd)
+                self._watches = {}
+                return
+            self._watches[wd] = directory
+        self._fd = fd
+
+    def _read_events(self):
+        """inotify 알림을 읽어 감시 중인 파일 경로 집합 반환"""
+        changed = set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            if mask & IN_Q_OVERFLOW:  # 알림을 놓쳤으면 전체 비교
+                changed.update(self.paths)
+            elif wd in self._watches and name:
+                path = os.path.join(self._watches[wd], os.fsdecode(name))
+                if path in self.paths:
+                    changed.add(path)
+        return changed
+
+    def _poll(self):
+        changed = set()
+        for path in self.paths:
+            state = file_state(path)
+            if state != self._polled[path]:
+                self._polled[path] = state
+                changed.add(path)
+        return changed
+
+    def _changes(self, timeout):
+        """변경 알림 하나 기다리기 (timeout 초, None이면 무한)"""
+        if self._fd is not None:
+            ready, _, _ = select.select([self._fd], [], [], timeout)
+            return self._read_events() if ready else set()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = self._poll()
+            if changed:
+                return changed
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return changed
+            time.sleep(self.poll_interval if remaining is None else min(self.poll_interval, remaining))
+
+    def wait(self, timeout=None):
+        """바뀐 파일 경로 집합 (내용이 그대로인 알림은 제외)"""
+        changed = self._changes(timeout)
+        if not changed:
+            return changed
+        # 쓰기가 끝날 때까지 잠시 더 모음
+        while True:
+            more = self._changes(self.settle_time)
+            if not more:
+                break
+            changed |= more
+        
+        result = set()
+        for path in changed:
+            state = file_state(path)
+            if state != self.states[path]:
+                self.states[path] = state
+                result.add(path)
+        return result
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
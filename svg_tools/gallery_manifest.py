@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+갤러리 증분 빌드용 매니페스트
+- 이미지별 (크기, 수정 시각, 내용 해시, 썸네일, HTML 조각)을 JSON으로 기록
+- 크기와 수정 시각이 같으면 파일을 읽지 않고, 달라도 해시가 같으면 이전 결과를 재사용
+- 추가/변경된 이미지만 썸네일과 HTML 조각을 새로 만들고, 삭제된 이미지는 썸네일까지 제거
+- 갤러리 스크립트(generator)마다 매니페스트를 따로 두고, 썸네일 폴더는 같이 쓴다
+  (이 매니페스트만 쓰던 썸네일만 삭제하여 다른 갤러리의 썸네일은 남겨 둠)
+"""
+
+import hashlib
+import json
+import os
+
+from gallery_thumbnails import (DEFAULT_THUMBNAIL_SIZE, build_thumbnails, remove_thumbnails,
+                                thumbnail_format)
+
+MANIFEST_VERSION = 1
+MANIFEST_PREFIX = 'image_gallery.'
+MANIFEST_SUFFIX = '.manifest.json'
+
+# HTML 조각의 이미지 번호 자리 (목록 순서가 바뀌어도 조각을 재사용하기 위해)
+INDEX_PLACEHOLDER = '%INDEX%'
+
+def file_digest(path, chunk_size=1024 * 1024):
+    """파일 내용 해시 (blake2b)"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def manifest_path(output_dir, generator):
+    """갤러리 스크립트별 매니페스트 경로 (예: image_gallery.create_image_gallery.paginated.manifest.json)"""
+    return os.path.join(output_dir, f"{MANIFEST_PREFIX}{generator.replace('/', '.')}{MANIFEST_SUFFIX}")
+
+class GalleryManifest:
+    """갤러리 HTML 옆에 저장하는 이미지별 처리 결과 기록
+    
+    generator가 다르면 (다른 갤러리 스크립트가 만든 기록) 처음부터 다시 만든다.
+    """
+
+    def __init__(self, path, generator):
+        self.path = path
+        self.generator = generator
+        self.base_dir = os.path.dirname(os.path.abspath(path))
+        self.entries = {}
+        self.paths = []  # 마지막 update에서 찾은 이미지 경로 (찾은 순서)
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == MANIFEST_VERSION and data.get('generator') == self.generator:
+            self.entries = data.get('images', {})
+
+    def save(self):
+        data = {'version': MANIFEST_VERSION, 'generator': self.generator, 'images': self.entries}
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_path, self.path)
+
+    def key(self, image_path):
+        """매니페스트 키 (매니페스트 위치 기준 상대 경로, 저장소 위치가 바뀌어도 유지)"""
+        return os.path.relpath(os.path.abspath(image_path), self.base_dir).replace('\\', '/')
+
+    def _foreign_thumbnails(self):
+        """같은 폴더의 다른 갤러리 매니페스트가 쓰는 썸네일 이름 집합"""
+        names = set()
+        for entry in os.scandir(self.base_dir):
+            if (not entry.name.startswith(MANIFEST_PREFIX) or not entry.name.endswith(MANIFEST_SUFFIX)
+                    or os.path.abspath(entry.path) == os.path.abspath(self.path)):
+                continue
+            try:
+                with open(entry.path, encoding='utf-8') as f:
+                    images = json.load(f).get('images', {})
+            except (OSError, ValueError, AttributeError):
+                continue
+            names.update(image['thumbnail'] for image in images.values() if image.get('thumbnail'))
+        return names
+
+    def _reusable(self, entry, image_path, thumb_dir):
+        """이전 썸네일을 그대로 쓸 수 있는지 (썸네일 파일이 남아 있는지)"""
+        if entry.get('thumbnail'):
+            return os.path.exists(os.path.join(thumb_dir, entry['thumbnail']))
+        return thumbnail_format(image_path) is None
+
+    def update(self, images, thumb_dir, render_fragment=None, size=DEFAULT_THUMBNAIL_SIZE,
+               workers=None):
+        """현재 이미지 목록에 맞춰 기록 갱신 후 (추가, 변경, 삭제) 키 목록 반환
+        
+        images는 ImageEntry의 iterable (image_discovery.scan_images의 결과를 탐색하는 대로 처리).
+        찾은 이미지 경로는 self.paths에 남는다.
+        
+        render_fragment(이미지 경로, 썸네일 경로 또는 None)는 번호 자리에
+        INDEX_PLACEHOLDER를 넣은 HTML 조각을 반환한다. 없으면 조각은 기록하지 않는다.
+        """
+        entries = {}
+        pending = []
+        self.paths = []
+        for image in images:
+            image_path = image.path
+            self.paths.append(image_path)
+            key = self.key(image_path)
+            entry = self.entries.get(key)
+            if entry and self._reusable(entry, image_path, thumb_dir):
+                if entry['size'] == image.size and entry['mtime'] == image.mtime_ns:
+                    entries[key] = entry
+                    continue
+                # 수정 시각만 바뀐 경우 (체크아웃, touch 등)
+                digest = file_digest(image_path)
+                if entry['hash'] == digest:
+                    entries[key] = dict(entry, size=image.size, mtime=image.mtime_ns)
+                    continue
+            else:
+                digest = file_digest(image_path)
+            pending.append((image, key, digest))
+        
+        content_hashes = {image.path: digest for image, _, digest in pending}
+        thumbnails = build_thumbnails(list(content_hashes), thumb_dir, size, workers, prune=False,
+                                      content_hashes=content_hashes)
+        added, changed = [], []
+        for image, key, digest in pending:
+            thumb_path = thumbnails.get(image.path)
+            entries[key] = {
+                'size': image.size,
+                'mtime': image.mtime_ns,
+                'hash': digest,
+                'thumbnail': os.path.basename(thumb_path) if thumb_path else None,
+                'fragment': render_fragment(image.path, thumb_path) if render_fragment else None,
+            }
+            (changed if key in self.entries else added).append(key)
+        removed = [key for key in self.entries if key not in entries]
+        
+        # 이 매니페스트만 쓰던 썸네일 삭제 (다른 갤러리가 쓰는 썸네일은 유지)
+        stale = ({entry['thumbnail'] for entry in self.entries.values() if entry.get('thumbnail')}
+                 - {entry['thumbnail'] for entry in entries.values() if entry['thumbnail']})
+        if stale:
+            remove_thumbnails(thumb_dir, stale - self._foreign_thumbnails())
+        self.entries = entries
+        return added, changed, removed
+
+    def entry(self, image_path):
+        """이미지의 기록 (크기, 수정 시각, 해시, 썸네일 파일 이름, HTML 조각)"""
+        return self.entries[self.key(image_path)]
+
+    def fragments(self, image_paths):
+        """이미지 목록 순서대로 번호를 채운 HTML 조각"""
+        for index, image_path in enumerate(image_paths):
+            yield self.entry(image_path)['fragment'].replace(INDEX_PLACEHOLDER, str(index))
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+이미지 갤러리 미리보기 서버
+- 시작할 때 아무것도 만들지 않고, 페이지 모드 갤러리 화면과 페이지 목록을 요청 때 생성
+- 썸네일과 SVG의 PNG 렌더링은 요청받은 이미지만 만들고 렌더링 캐시(render_cache)에 저장
+- ETag/If-None-Match로 바뀌지 않은 응답은 304, HTML/JS/SVG는 gzip 압축
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import shutil
+import tempfile
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+from create_image_gallery import PAGE_SIZE, generate_paginated_html, script_json
+from gallery_thumbnails import DEFAULT_THUMBNAIL_SIZE, fit_size, make_thumbnail, thumbnail_format
+from image_discovery import scan_images
+from render_cache import RenderCache
+from svg_to_png import SVGConverter, backend_version
+
+try:
+    import PIL
+except ImportError:
+    PIL = None
+
+DEFAULT_PORT = 8000
+
+# gzip으로 압축할 응답 형식과 최소 크기 (작은 응답은 압축 이득이 없음)
+COMPRESSIBLE_TYPES = ('text/html', 'text/javascript', 'application/json', 'image/svg+xml')
+GZIP_MIN_SIZE = 1024
+
+COPY_CHUNK_SIZE = 256 * 1024
+
+def etag_matches(header, etag):
+    """If-None-Match 헤더가 ETag와 일치하는지 (약한 비교)"""
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    def strip_weak(tag):
+        tag = tag.strip()
+        return tag[2:] if tag.startswith('W/') else tag
+    return any(strip_weak(candidate) == strip_weak(etag) for candidate in header.split(','))
+
+def gzip_etag(etag):
+    """gzip으로 압축한 응답의 ETag (압축하지 않은 응답과 구분)"""
+    return f'{etag[:-1]}-gzip"'
+
+class GalleryServer(ThreadingMixIn, HTTPServer):
+    """Images 폴더를 갤러리로 보여주는 HTTP 서버
+    
+    이미지 목록은 갤러리 화면을 요청할 때마다 다시 탐색한다 (새로고침하면 추가/삭제가 반영됨).
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, images_dir, thumbnail_size=DEFAULT_THUMBNAIL_SIZE,
+                 page_size=PAGE_SIZE, cache=None, verbose=False):
+        super().__init__(address, GalleryRequestHandler)
+        self.images_dir = os.path.abspath(images_dir)
+        self.thumbnail_size = thumbnail_size
+        self.page_size = page_size
+        self.cache = cache or RenderCache()
+        self.verbose = verbose
+        self.backend = None  # 첫 SVG 렌더링 때 찾음
+        self.converter = None
+        self.images = []
+        self.listing = ''  # 이미지 목록 해시 (페이지 URL에 넣어 목록이 바뀌면 새로 받도록)
+        self._lock = threading.Lock()
+        self._render_lock = threading.Lock()  # 변환 도구(Inkscape 셸 등)는 한 번에 하나씩 사용
+
+    def rescan(self):
+        """이미지 목록을 다시 탐색하고 HTML에 넣을 JSON 색인 반환"""
+        images = sorted(scan_images(self.images_dir), key=lambda image: image.name.lower())
+        digest = hashlib.blake2b(digest_size=8)
+        for image in images:
+            digest.update(f"{image.path}|{image.size}|{image.mtime_ns}\n".encode('utf-8'))
+        with self._lock:
+            self.images = images
+            self.listing = digest.hexdigest()
+        return {
+            'pageSize': self.page_size,
+            'pagesDir': f"pages/{self.listing}",
+            'items': [[image.name, image.ext, round(image.size / 1024, 1)] for image in images],
+        }
+
+    def page(self, listing, page):
+        """페이지 파일 내용 (목록이 바뀌었거나 페이지가 없으면 None)"""
+        with self._lock:
+            if listing != self.listing:
+                return None
+            images = self.images[page * self.page_size:(page + 1) * self.page_size]
+        if page < 0 or not images:
+            return None
+        entries = []
+        for image in images:
+            url = quote(self.relative_path(image.path))
+            entries.append([f"/thumbs/{url}", f"/images/{url}"])
+        return f"galleryPage({page}, {script_json(entries)});\n"
+
+    def relative_path(self, path):
+        return os.path.relpath(path, self.images_dir).replace('\\', '/')
+
+    def resolve(self, relative):
+        """URL의 상대 경로를 Images 폴더 안의 파일 경로로 (밖을 가리키거나 없으면 None)"""
+        path = os.path.realpath(os.path.join(self.images_dir, unquote(relative)))
+        if os.path.commonpath([path, os.path.realpath(self.images_dir)]) != os.path.realpath(self.images_dir):
+            return None
+        return path if os.path.isfile(path) else None
+
+    def render(self, key, render_png):
+        """캐시에 없으면 render_png(임시 PNG 경로)로 만들어 캐시에 저장하고 캐시 파일 경로 반환"""
+        cached = self.cache.get(key)
+        if cached:
+            return cached
+        with self._render_lock:
+            cached = self.cache.get(key)  # 기다리는 동안 다른 요청이 만들었을 수 있음
+            if cached:
+                return cached
+            with tempfile.TemporaryDirectory() as temp_dir:
+                temp_path = os.path.join(temp_dir, 'render.png')
+                if not render_png(temp_path):
+                    return None
+                self.cache.put(key, temp_path)
+        return self.cache.path(key)
+
+    def svg_backend(self):
+        if self.backend is None:
+            self.converter = SVGConverter(verbose=False, cache=False)
+            self.backend = self.converter.backend
+            if self.backend is None:
+                raise RuntimeError("사용할 수 있는 변환 방법이 없습니다.")
+        return self.backend
+
+    def thumbnail(self, image_path):
+        """썸네일 PNG 경로 (만들 수 없으면 None)"""
+        if thumbnail_format(image_path) is None:
+            return None
+        size = self.thumbnail_size
+        with open(image_path, 'rb') as f:
+            content = f.read()
+        if os.path.splitext(image_path)[1].lower() == '.svg':
+            # svg_to_png로 같은 크기를 변환할 때와 같은 키
+            backend = self.svg_backend()
+            width, height = fit_size(image_path, size)
+            key = self.cache.key(content, backend, width, height, backend_version(backend))
+        else:
+            key = self.cache.key(content, 'pillow-thumbnail', size, size, PIL.__version__)
+        return self.render(key, lambda png_path: make_thumbnail((image_path, png_path, size)))
+
+    def render_svg(self, svg_path, width=None, height=None):
+        """SVG를 지정 크기(없으면 원래 크기) PNG로 렌더링한 경로 (실패하면 None)"""
+        backend = self.svg_backend()
+        with open(svg_path, 'rb') as f:
+            key = self.cache.key(f.read(), backend, width, height, backend_version(backend))
+        return self.render(key, lambda png_path: self.converter.convert(svg_path, png_path, width, height))
+
+    def server_close(self):
+        super().server_close()
+        if self.converter is not None:
+            self.converter.close()
+        self.cache.flush_stats()
+
+class GalleryRequestHandler(BaseHTTPRequestHandler):
+    """갤러리 요청 처리
+    
+    /                    갤러리 화면 (페이지 모드)
+    /pages/<목록>/page-N.js  페이지 파일 (썸네일/원본 URL)
+    /thumbs/<경로>        썸네일 (없으면 원본)
+    /images/<경로>        원본 파일
+    /render/<경로>?width=&height=  SVG를 PNG로 렌더링
+    """
+
+    server_version = 'SVGToolsGallery/1.0'
+    _head_only = False
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        route, _, rest = url.path.lstrip('/').partition('/')
+        try:
+            if url.path in ('/', '/index.html'):
+                self.send_gallery()
+            elif route == 'pages':
+                self.send_page(rest)
+            elif route in ('thumbs', 'images', 'render'):
+                image_path = self.server.resolve(rest)
+                if image_path is None:
+                    self.send_error(HTTPStatus.NOT_FOUND)
+                elif route == 'thumbs':
+                    thumb_path = self.server.thumbnail(image_path)
+                    if thumb_path:
+                        self.send_rendered(thumb_path)
+                    else:
+                        self.send_file(image_path)
+                elif route == 'images':
+                    self.send_file(image_path)
+                else:
+                    self.send_render(image_path, parse_qs(url.query))
+            else:
+                self.send_error(HTTPStatus.NOT_FOUND)
+        except (BrokenPipeError, ConnectionResetError):  # 브라우저가 요청을 취소함
+            pass
+
+    def do_HEAD(self):
+        self._head_only = True
+        try:
+            self.do_GET()
+        finally:
+            self._head_only = False
+
+    def send_gallery(self):
+        index = self.server.rescan()
+        if not index['items']:
+            self.send_error(HTTPStatus.NOT_FOUND, explain="Images 폴더에 이미지 파일이 없습니다.")
+            return
+        body = ''.join(generate_paginated_html(index)).encode('utf-8')
+        etag = f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+        self.send_body(body, 'text/html; charset=utf-8', etag)
+
+    def send_page(self, rest):
+        listing, _, name = rest.partition('/')
+        number = name[len('page-'):-len('.js')] if name.startswith('page-') and name.endswith('.js') else ''
+        content = self.server.page(listing, int(number)) if number.isdigit() else None
+        if content is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        # 목록 해시가 URL에 있으므로 내용이 바뀌지 않음
+        self.send_body(content.encode('utf-8'), 'text/javascript; charset=utf-8',
+                       f'"{listing}-{number}"')
+
+    def send_render(self, svg_path, query):
+        if not svg_path.lower().endswith('.svg'):
+            self.send_error(HTTPStatus.BAD_REQUEST, explain="SVG 파일만 렌더링할 수 있습니다.")
+            return
+        try:
+            width = int(query['width'][0]) if 'width' in query else None
+            height = int(query['height'][0]) if 'height' in query else None
+        except ValueError:
+            self.send_error(HTTPStatus.BAD_REQUEST, explain="width/height는 정수여야 합니다.")
+            return
+        png_path = self.server.render_svg(svg_path, width, height)
+        if png_path is None:
+            self.send_error(HTTPStatus.INTERNAL_SERVER_ERROR, explain="SVG 변환 실패")
+            return
+        self.send_rendered(png_path)
+
+    def content_type(self, path):
+        if path.lower().endswith('.svg'):
+            return 'image/svg+xml'
+        return mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+    def accepts_gzip(self, content_type):
+        return (content_type.split(';')[0] in COMPRESSIBLE_TYPES
+                and 'gzip' in self.headers.get('Accept-Encoding', ''))
+
+    def not_modified(self, etag, content_type):
+        """If-None-Match가 일치하면 304를 보내고 True"""
+        if not etag_matches(self.headers.get('If-None-Match'), etag):
+            return False
+        self.send_response(HTTPStatus.NOT_MODIFIED)
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        if content_type.split(';')[0] in COMPRESSIBLE_TYPES:
+            self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+        return True
+
+    def send_headers(self, content_type, length, etag, encoding=None):
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(length))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')  # 매번 ETag로 확인
+        if content_type.split(';')[0] in COMPRESSIBLE_TYPES:
+            self.send_header('Vary', 'Accept-Encoding')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.end_headers()
+
+    def send_body(self, body, content_type, etag):
+        """메모리의 응답 보내기 (조건에 맞으면 gzip 압축)"""
+        if len(body) >= GZIP_MIN_SIZE and self.accepts_gzip(content_type):
+            etag = gzip_etag(etag)
+            if not self.not_modified(etag, content_type):
+                self.send_gzip(body, content_type, etag)
+            return
+        if self.not_modified(etag, content_type):
+            return
+        self.send_headers(content_type, len(body), etag)
+        if not self._head_only:
+            self.wfile.write(body)
+
+    def send_gzip(self, body, content_type, etag):
+        """body를 gzip으로 압축해 보내기 (etag는 gzip_etag로 만든 압축 응답의 ETag)"""
+        body = gzip.compress(body, compresslevel=6)
+        self.send_headers(content_type, len(body), etag, 'gzip')
+        if not self._head_only:
+            self.wfile.write(body)
+
+    def send_rendered(self, png_path):
+        """캐시의 PNG 보내기 (캐시 파일은 사용할 때마다 수정 시각이 바뀌므로 캐시 키를 ETag로 사용)"""
+        self.send_file(png_path, f'"{os.path.splitext(os.path.basename(png_path))[0]}"')
+
+    def send_file(self, path, etag=None):
+        """파일 응답 보내기 (압축하지 않는 형식은 읽는 대로 전송)"""
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        with f:
+            stat = os.fstat(f.fileno())
+            etag = etag or f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+            content_type = self.content_type(path)
+            if stat.st_size >= GZIP_MIN_SIZE and self.accepts_gzip(content_type):
+                # 바뀌지 않았으면 파일을 읽거나 압축하지 않음
+                etag = gzip_etag(etag)
+                if not self.not_modified(etag, content_type):
+                    self.send_gzip(f.read(), content_type, etag)
+                return
+            if self.not_modified(etag, content_type):
+                return
+            self.send_headers(content_type, stat.st_size, etag)
+            if not self._head_only:
+                shutil.copyfileobj(f, self.wfile, COPY_CHUNK_SIZE)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+def serve(images_dir='../Images', host='127.0.0.1', port=DEFAULT_PORT,
+          thumbnail_size=DEFAULT_THUMBNAIL_SIZE, page_size=PAGE_SIZE, verbose=False):
+    """갤러리 서버 실행 (Ctrl+C로 종료)"""
+    if not os.path.isdir(images_dir):
+        print(f"Images 폴더를 찾을 수 없습니다: {images_dir}")
+        return False
+    
+    with GalleryServer((host, port), images_dir, thumbnail_size, page_size, verbose=verbose) as server:
+        print(f"갤러리 서버: http://{host}:{server.server_address[1]}/  (Ctrl+C로 종료)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n서버를 종료합니다.")
+    return True
+
+def main():
+    """메인 함수"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Images 폴더 갤러리 미리보기 서버 (요청할 때 썸네일 생성)')
+    parser.add_argument('images_dir', nargs='?', default='../Images', help='이미지 폴더 (기본: %(default)s)')
+    parser.add_argument('--host', default='127.0.0.1', help='주소 (기본: %(default)s)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='포트 (기본: %(default)s)')
+    parser.add_argument('--thumbnail-size', type=int, default=DEFAULT_THUMBNAIL_SIZE,
+                        help='썸네일 크기 (기본: %(default)s)')
+    parser.add_argument('--page-size', type=int, default=PAGE_SIZE,
+                        help='페이지 파일당 이미지 수 (기본: %(default)s)')
+    parser.add_argument('-v', '--verbose', action='store_true', help='요청 기록 출력')
+
+    args = parser.parse_args()
+    serve(args.images_dir, args.host, args.port, args.thumbnail_size, args.page_size, args.verbose)
+
+if __name__ == "__main__":
+    main()
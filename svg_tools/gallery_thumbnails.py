@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+갤러리용 썸네일 만들기
+- PNG/JPG/GIF/WebP는 Pillow로 축소하여 WebP(지원하지 않으면 PNG)로 저장
+- SVG는 svg_to_png의 변환 방법으로 썸네일 크기에 맞춰 PNG로 렌더링
+- 썸네일은 갤러리 옆 폴더에 (경로, 수정 시각, 크기) 해시 이름으로 저장하여 다음 실행에 재사용
+- 만들어야 하는 썸네일만 프로세스 풀에서 병렬 처리
+"""
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from svg_to_png import SVGConverter, resolve_size
+
+try:
+    from PIL import Image, features
+except ImportError:  # Pillow가 없으면 래스터 이미지는 원본을 그대로 사용
+    Image = None
+
+DEFAULT_THUMBNAIL_SIZE = 256
+
+# 작업 프로세스별 SVG 변환기 (변환 방법은 한 번만 찾음)
+_converter = None
+
+def thumbnail_format(image_path):
+    """썸네일 파일 확장자 (만들 수 없으면 None)"""
+    if os.path.splitext(image_path)[1].lower() == '.svg':
+        return 'png'
+    if Image is None:
+        return None
+    return 'webp' if features.check('webp') else 'png'
+
+def thumbnail_name(image_path, size=DEFAULT_THUMBNAIL_SIZE, content_hash=None):
+    """썸네일 파일 이름 (만들 수 없으면 None)
+    
+    content_hash를 알면 내용 해시와 크기로, 모르면 원본 경로, 수정 시각, 크기로 만든다.
+    """
+    extension = thumbnail_format(image_path)
+    if extension is None:
+        return None
+    if content_hash:
+        source = content_hash
+    else:
+        stat = os.stat(image_path)
+        source = f"{os.path.abspath(image_path)}|{stat.st_mtime_ns}|{stat.st_size}"
+    digest = hashlib.blake2b(f"{source}|{size}".encode('utf-8'), digest_size=12)
+    return f"{digest.hexdigest()}.{extension}"
+
+def fit_size(svg_path, size):
+    """SVG 비율을 유지하면서 size x size 안에 들어가는 (너비, 높이)"""
+    width, height = resolve_size(svg_path, size, None)
+    if height and height > size:
+        width, height = resolve_size(svg_path, None, size)
+    return width, height
+
+def make_thumbnail(task):
+    """썸네일 하나 만들기 (실패하면 None)"""
+    global _converter
+    image_path, thumb_path, size = task
+    root, extension = os.path.splitext(thumb_path)
+    temp_path = f"{root}.{os.getpid()}.tmp{extension}"  # 변환 도구가 확장자로 형식을 판단
+    try:
+        if os.path.splitext(image_path)[1].lower() == '.svg':
+            if _converter is None:
+                _converter = SVGConverter(verbose=False, cache=False)
+            width, height = fit_size(image_path, size)
+            if not _converter.convert(image_path, temp_path, width, height):
+                raise RuntimeError("SVG 변환 실패")
+        else:
+            with Image.open(image_path) as image:
+                image.thumbnail((size, size))
+                if image.mode not in ('RGB', 'RGBA'):
+                    image = image.convert('RGBA')
+                image.save(temp_path, format=extension[1:].upper())
+        os.replace(temp_path, thumb_path)
+    except Exception as e:
+        print(f"썸네일 생성 실패 ({image_path}): {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return None
+    return thumb_path
+
+def build_thumbnails(image_paths, thumb_dir, size=DEFAULT_THUMBNAIL_SIZE, workers=None, prune=True,
+                     content_hashes=None):
+    """이미지 목록의 썸네일을 만들고 {이미지 경로: 썸네일 경로 (없으면 None)} 반환
+    
+    이미 있는 썸네일은 다시 만들지 않는다.
+    prune이면 목록에 없는 이미지의 오래된 썸네일을 삭제한다.
+    content_hashes({이미지 경로: 내용 해시})가 있으면 썸네일 이름에 내용 해시를 사용한다.
+    """
+    os.makedirs(thumb_dir, exist_ok=True)
+    thumbnails = {}
+    tasks = []
+    for image_path in image_paths:
+        name = thumbnail_name(image_path, size, (content_hashes or {}).get(image_path))
+        if name is None:
+            thumbnails[image_path] = None
+            continue
+        thumb_path = os.path.join(thumb_dir, name)
+        thumbnails[image_path] = thumb_path
+        if not os.path.exists(thumb_path):
+            tasks.append((image_path, thumb_path, size))
+    
+    if tasks:
+        print(f"썸네일 생성 중: {len(tasks)}개")
+        if workers == 1 or len(tasks) == 1:
+            results = [make_thumbnail(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(make_thumbnail, tasks, chunksize=8))
+        for (image_path, _, _), result in zip(tasks, results):
+            if result is None:
+                thumbnails[image_path] = None
+    
+    if prune:
+        prune_thumbnails(thumb_dir, {os.path.basename(path) for path in thumbnails.values() if path})
+    return thumbnails
+
+def prune_thumbnails(thumb_dir, keep):
+    """keep(파일 이름 집합)에 없는 썸네일 삭제"""
+    if not os.path.isdir(thumb_dir):
+        return
+    for entry in os.scandir(thumb_dir):
+        if entry.is_file() and entry.name not in keep:
+            os.remove(entry.path)
+
+def remove_thumbnails(thumb_dir, names):
+    """이름 목록의 썸네일만 삭제 (이미 없으면 무시)"""
+    for name in names:
+        try:
+            os.remove(os.path.join(thumb_dir, name))
+        except FileNotFoundError:
+            pass
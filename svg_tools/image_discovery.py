@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+이미지 파일 탐색
+- os.scandir 한 번으로 폴더를 읽고 확장자 검사와 크기/수정 시각을 함께 처리
+- 하위 폴더는 스레드 풀에서 병렬로 탐색 (네트워크 파일 시스템의 대기 시간을 겹침)
+- 찾는 대로 ImageEntry를 반환하므로 탐색과 다음 처리가 동시에 진행됨
+"""
+
+import os
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+IMAGE_EXTENSIONS = ('.svg', '.png', '.jpg', '.jpeg', '.gif', '.webp')
+DEFAULT_SCAN_WORKERS = 8
+
+ImageEntry = namedtuple('ImageEntry', ['path', 'name', 'ext', 'size', 'mtime_ns'])
+ImageEntry.__doc__ = """찾은 이미지 (경로, 파일명, 점 없는 소문자 확장자, 크기, 수정 시각 ns)"""
+
+def image_entry(path):
+    """파일 경로 하나로 ImageEntry 만들기"""
+    stat = os.stat(path)
+    name = os.path.basename(path)
+    return ImageEntry(path, name, os.path.splitext(name)[1].lower()[1:], stat.st_size, stat.st_mtime_ns)
+
+def _scan_directory(path, extensions, recursive):
+    """폴더 하나 읽기: (찾은 ImageEntry 목록, 하위 폴더 목록)"""
+    images = []
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            subdirs.append(entry.path)
+                        continue
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    if ext in extensions and entry.is_file():
+                        stat = entry.stat()  # DirEntry가 결과를 보관 (Windows는 추가 호출 없음)
+                        images.append(ImageEntry(entry.path, entry.name, ext[1:], stat.st_size,
+                                                 stat.st_mtime_ns))
+                except OSError:  # 탐색 중 삭제된 파일
+                    continue
+    except OSError as e:
+        print(f"폴더를 읽을 수 없습니다 ({path}): {e}")
+    return images, subdirs
+
+def scan_images(root, extensions=IMAGE_EXTENSIONS, recursive=True, workers=DEFAULT_SCAN_WORKERS):
+    """root 아래의 이미지를 찾는 대로 ImageEntry로 반환 (순서는 보장하지 않음)
+    
+    숨김 폴더/파일(.으로 시작)과 폴더 심볼릭 링크는 건너뛴다.
+    """
+    extensions = {ext.lower() if ext.startswith('.') else f'.{ext.lower()}' for ext in extensions}
+    if workers is not None and workers <= 1:
+        pending = [root]
+        while pending:
+            images, subdirs = _scan_directory(pending.pop(), extensions, recursive)
+            pending.extend(subdirs)
+            yield from images
+        return
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        running = {executor.submit(_scan_directory, root, extensions, recursive)}
+        while running:
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                images, subdirs = future.result()
+                running.update(executor.submit(_scan_directory, subdir, extensions, recursive)
+                               for subdir in subdirs)
+                yield from images
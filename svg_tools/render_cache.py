@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+SVG 렌더링 결과 캐시
+- 키: (SVG 내용 해시, 변환 방법, 너비, 높이, 변환 방법 버전)
+- 캐시에 있으면 렌더러를 실행하지 않고 저장된 PNG를 복사
+- 전체 크기가 한도를 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (LRU, 파일 수정 시각 기준)
+- 명령줄: stats / clear / prune
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+def default_cache_dir():
+    """기본 캐시 폴더 (SVG_RENDER_CACHE_DIR 환경 변수, 없으면 ~/.cache/svg_tools/render)"""
+    directory = os.environ.get('SVG_RENDER_CACHE_DIR')
+    if directory:
+        return directory
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'svg_tools', 'render')
+
+class RenderCache:
+    """내용 해시를 키로 하는 PNG 디스크 캐시"""
+    
+    STATS_FILE = 'stats.json'
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._total_bytes = None  # 처음 저장할 때 한 번만 계산
+
+    @staticmethod
+    def key(content, backend, width, height, version):
+        """SVG 내용(bytes)과 렌더링 설정으로 만든 캐시 키"""
+        digest = hashlib.blake2b(content, digest_size=16)
+        digest.update(f"|{backend}|{version}|{width}|{height}".encode('utf-8'))
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.png")
+
+    def get(self, key):
+        """캐시된 PNG 경로 (없으면 None, 있으면 사용 시각 갱신)"""
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def fetch(self, key, png_path):
+        """캐시된 PNG를 png_path로 복사 (없으면 False)"""
+        cached = self.get(key)
+        if cached is None:
+            return False
+        try:
+            shutil.copyfile(cached, png_path)
+        except FileNotFoundError:  # 다른 프로세스가 방금 삭제함
+            return False
+        return True
+
+    def put(self, key, png_path):
+        """렌더링한 PNG를 캐시에 저장 (임시 파일에 쓴 뒤 교체)"""
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        shutil.copyfile(png_path, temp_path)
+        # 같은 키를 덮어쓰면 이전 항목 크기는 합계에서 뺌
+        try:
+            old_size = os.path.getsize(path)
+        except OSError:
+            old_size = 0
+        os.replace(temp_path, path)
+        
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, size, _ in self.entries())
+        else:
+            self._total_bytes += os.path.getsize(path) - old_size
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+        return path
+
+    def entries(self):
+        """(경로, 크기, 마지막 사용 시각) 목록"""
+        result = []
+        if not os.path.isdir(self.directory):
+            return result
+        for bucket in os.scandir(self.directory):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.name.endswith('.png'):
+                    stat = entry.stat()
+                    result.append((entry.path, stat.st_size, stat.st_mtime))
+        return result
+
+    def evict(self, target_bytes=None):
+        """오래 사용하지 않은 항목부터 삭제하여 target_bytes 이하로 줄임 (기본: 한도의 90%)
+        
+        삭제한 항목 수를 반환한다.
+        """
+        if target_bytes is None:
+            target_bytes = int(self.max_bytes * 0.9)
+        entries = sorted(self.entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for path, size, _ in entries:
+            if total <= target_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        self._total_bytes = total
+        return removed
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        if os.path.isdir(self.directory):
+            shutil.rmtree(self.directory)
+        self._total_bytes = 0
+        self.hits = self.misses = 0
+
+    def _read_stats(self):
+        try:
+            with open(os.path.join(self.directory, self.STATS_FILE), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'hits': 0, 'misses': 0}
+
+    def flush_stats(self):
+        """이번 실행의 적중/실패 횟수를 누적 통계에 더해 저장"""
+        if not self.hits and not self.misses:
+            return
+        stats = self._read_stats()
+        stats['hits'] = stats.get('hits', 0) + self.hits
+        stats['misses'] = stats.get('misses', 0) + self.misses
+        stats['updated'] = time.time()
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, self.STATS_FILE)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(stats, f)
+        os.replace(temp_path, path)
+        self.hits = self.misses = 0
+
+    def stats(self):
+        """항목 수, 전체 크기, 누적 적중률 등 캐시 상태"""
+        entries = self.entries()
+        stats = self._read_stats()
+        hits = stats.get('hits', 0) + self.hits
+        misses = stats.get('misses', 0) + self.misses
+        return {
+            'directory': self.directory,
+            'entries': len(entries),
+            'total_bytes': sum(size for _, size, _ in entries),
+            'max_bytes': self.max_bytes,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+            'oldest': min((mtime for _, _, mtime in entries), default=None),
+            'newest': max((mtime for _, _, mtime in entries), default=None),
+        }
+
+def main():
+    """메인 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='SVG 렌더링 캐시 관리')
+    parser.add_argument('command', choices=('stats', 'clear', 'prune'), help='실행할 명령')
+    parser.add_argument('--dir', help=f'캐시 폴더 (기본: {default_cache_dir()})')
+    parser.add_argument('--max-size', type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024,
+                        help='prune: 최대 크기 (MB)')
+    
+    args = parser.parse_args()
+    cache = RenderCache(args.dir, int(args.max_size * 1024 * 1024))
+    
+    if args.command == 'stats':
+        stats = cache.stats()
+        print(f"캐시 폴더: {stats['directory']}")
+        print(f"항목 수: {stats['entries']}")
+        print(f"전체 크기: {stats['total_bytes'] / 1024 / 1024:.2f} MB / {stats['max_bytes'] / 1024 / 1024:.0f} MB")
+        print(f"적중: {stats['hits']}, 실패: {stats['misses']} (적중률 {stats['hit_rate'] * 100:.1f}%)")
+        if stats['oldest'] is not None:
+            print(f"가장 오래된 항목: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(stats['oldest']))}")
+            print(f"가장 최근 항목: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(stats['newest']))}")
+    elif args.command == 'clear':
+        cache.clear()
+        print(f"캐시를 삭제했습니다: {cache.directory}")
+    else:
+        removed = cache.evict(cache.max_bytes)
+        print(f"{removed}개 항목을 삭제했습니다.")
+
+if __name__ == "__main__":
+    main()
@@ -2,173 +2,431 @@
 """
 SVG를 원형 프로필에 맞게 스케일링
 트위터, 디스코드 등의 원형 프로필 이미지에 맞춤
+- 중심: 경계 상자 중심(bbox) 또는 최소 외접원 중심(mec, 비대칭 심볼도 원을 최대한 채움)
+- 일괄 처리: 폴더의 SVG를 대상별 프리셋(원형/둥근 사각형, 캔버스 크기, 여백)으로 한 번에 변환
+  (원본마다 기하 정보는 한 번만 계산하고, 프리셋별 결과는 프로세스 풀에서 병렬로 저장)
 """
 
-import re
-import math
 import sys
 import os
+import math
+import time
+from array import array
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from svg_document import SVGDocument, format_number
+from svg_geometry import (circle_polyline, convex_hull, farthest_point, flatten_path, hull_points,
+                          minimum_enclosing_circle, path_polyline, welzl)
+from svg_stream import iter_stream_geometry, stream_geometry, stream_transform
+from svg_tools import BatchResult, batch_output_path, collect_svg_files, common_root
+from svg_transform import compose, scale, translate
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 순수 Python으로 처리
+    np = None
+
+PROFILE_TOLERANCE = 1e-4  # 곡선 근사 허용 오차 (심볼 크기 대비 비율)
+
+# 심볼 중심을 정하는 방식
+CENTER_BBOX = 'bbox'  # 경계 상자 중심
+CENTER_MEC = 'mec'    # 최소 외접원 중심
+CENTER_MODES = (CENTER_BBOX, CENTER_MEC)
+
+PROFILE_MARGIN = 0.98  # 프로필 가이드 대비 심볼 크기 (2% 여유)
+
+# 프로필 모양: 둥근 사각형은 모서리 반지름을 한 변의 절반 대비 비율로 표시 (원 = 1.0)
+SHAPE_CIRCLE = 'circle'
+SHAPE_ROUNDED_SQUARE = 'rounded-square'
+SHAPE_CORNERS = {SHAPE_CIRCLE: 1.0, SHAPE_ROUNDED_SQUARE: 0.4}
+
+ProfilePreset = namedtuple('ProfilePreset', ['name', 'shape', 'canvas_size', 'margin'])
+ProfilePreset.__doc__ = """대상 서비스별 프로필 설정 (이름, 모양, 캔버스 크기, 가이드 대비 여백 비율)"""
+
+PRESETS = {
+    'twitter': ProfilePreset('twitter', SHAPE_CIRCLE, 400, 0.98),
+    'discord': ProfilePreset('discord', SHAPE_CIRCLE, 128, 0.98),
+    'slack': ProfilePreset('slack', SHAPE_ROUNDED_SQUARE, 512, 0.95),
+    'github': ProfilePreset('github', SHAPE_CIRCLE, 460, 0.98),
+}
+
+SourceFit = namedtuple('SourceFit', ['background', 'matrices'])
+SourceFit.__doc__ = """원본 파일 하나의 프리셋 맞춤 결과 (배경 요소 번호 목록, 프리셋 이름 -> 변환 행렬)"""
+
+def profile_tolerance(min_x, min_y, max_x, max_y):
+    """심볼 크기에 비례하는 곡선 근사 허용 오차 (사용자 단위)"""
+    size = max(max_x - min_x, max_y - min_y)
+    return size * PROFILE_TOLERANCE if size > 0 else 1.0
+
+def get_bounding_box_and_corners(svg_content, tolerance=None):
+    """SVG의 경계 상자와 곡선 위 점 계산 (문자열 또는 SVGDocument)
+    
+    반환값: (min_x, min_y, max_x, max_y, 꺾은선 점 좌표 버퍼, 원 (cx, cy, r) 목록)
+    곡선은 tolerance(없으면 심볼 크기에 비례) 안의 꺾은선으로 근사하고 공용 꺾은선 캐시를 사용한다.
+    """
+    if isinstance(svg_content, SVGDocument):
+        document = svg_content
+    else:
+        document = SVGDocument.from_string(svg_content)
+    
+    # 배경(Fill) 도형을 제외한 모든 도형의 기하 정보 (캐시 사용)
+    bounds, geometries, circles, _ = document.geometry()
+    if tolerance is None:
+        tolerance = profile_tolerance(*bounds)
+    
+    points = array('d')
+    for geometry in geometries:
+        points.extend(path_polyline(geometry, tolerance))
+    
+    return bounds + (points, circles)
+
+def stream_farthest_point(input_file, background, center_x, center_y, tolerance):
+    """스트리밍으로 배경을 제외한 도형 중 중심에서 가장 먼 점 (거리, (x, y))
+    
+    도형 하나씩 꺾은선으로 근사하여 비교하므로 메모리 사용량이 파일 크기와 무관하다.
+    """
+    best = (0.0, None)
+    for position, geometry, circle, _ in iter_stream_geometry(input_file):
+        if position in background:
+            continue
+        if circle is not None:
+            candidate = farthest_point(array('d'), center_x, center_y, [circle])
+        else:
+            # 대용량 파일의 패스로 공용 캐시를 채우지 않음
+            candidate = farthest_point(flatten_path(geometry.path, tolerance), center_x, center_y)
+        if candidate[0] > best[0]:
+            best = candidate
+    return best
 
-def extract_numbers(path_d):
-    """패스 데이터에서 모든 숫자 추출"""
-    numbers = re.findall(r'[-+]?\d*\.?\d+', path_d)
-    coords = []
-    for i in range(0, len(numbers), 2):
-        if i + 1 < len(numbers):
-            coords.append((float(numbers[i]), float(numbers[i+1])))
-    return coords
-
-def get_bounding_box_and_corners(svg_content):
-    """SVG의 경계 상자와 각 모서리까지의 거리 계산"""
-    min_x, min_y = float('inf'), float('inf')
-    max_x, max_y = float('-inf'), float('-inf')
-    
-    # 모든 path 요소 찾기 (Fill 제외)
-    path_pattern = r'<path[^>]*d="([^"]*)"[^>]*>'
-    paths = re.findall(path_pattern, svg_content)
-    
-    all_coords = []
-    
-    for path_d in paths:
-        # Fill path는 제외
-        if 'M 1000.00 0.00' in path_d:
+def stream_enclosing_circle(input_file, background, tolerance):
+    """스트리밍으로 배경을 제외한 도형 전체의 최소 외접원 (cx, cy, r)
+    
+    도형마다 꺾은선의 볼록 껍질만 남겨 합치므로 메모리에는 껍질 꼭짓점만 유지한다.
+    """
+    hull = []
+    for position, geometry, circle, _ in iter_stream_geometry(input_file):
+        if position in background:
             continue
-            
-        coords = extract_numbers(path_d)
-        all_coords.extend(coords)
-        for x, y in coords:
-            min_x = min(min_x, x)
-            min_y = min(min_y, y)
-            max_x = max(max_x, x)
-            max_y = max(max_y, y)
-    
-    # circle 요소도 고려
-    circle_pattern = r'<circle[^>]*cx="([\d.]+)"[^>]*cy="([\d.]+)"[^>]*r="([\d.]+)"[^>]*>'
-    circles = re.findall(circle_pattern, svg_content)
-    for cx_str, cy_str, r_str in circles:
-        cx, cy, r = float(cx_str), float(cy_str), float(r_str)
-        min_x = min(min_x, cx - r)
-        min_y = min(min_y, cy - r)
-        max_x = max(max_x, cx + r)
-        max_y = max(max_y, cy + r)
-        # 원의 8방향 점들도 추가
-        for angle in range(0, 360, 45):
-            rad = math.radians(angle)
-            x = cx + r * math.cos(rad)
-            y = cy + r * math.sin(rad)
-            all_coords.append((x, y))
-    
-    return min_x, min_y, max_x, max_y, all_coords
-
-def scale_for_circular_profile(input_file, output_file, canvas_size=1000):
-    """SVG를 원형 프로필에 맞게 스케일링"""
-    with open(input_file, 'r', encoding='utf-8') as f:
-        svg_content = f.read()
-    
-    # 현재 심볼의 경계 상자와 모든 좌표 구하기
-    min_x, min_y, max_x, max_y, all_coords = get_bounding_box_and_corners(svg_content)
+        if circle is not None:
+            points = circle_polyline(*circle, tolerance)
+        else:
+            points = flatten_path(geometry.path, tolerance)
+        hull = convex_hull(hull + hull_points(points))
+    return welzl(hull)
+
+def rounded_square_extent(points, center_x, center_y, corner):
+    """둥근 사각형 기준으로 중심에서 가장 먼 점 (크기, (x, y))
+    
+    크기는 점을 담는 가장 작은 둥근 사각형(모서리 반지름 = corner x 한 변의 절반)의 한 변의 절반.
+    corner=1이면 원(유클리드 거리), 0이면 정사각형(체비쇼프 거리)과 같다.
+    """
+    count = len(points) // 2
+    if count == 0:
+        return 0.0, None
+    inner = 1 - corner  # 모서리 원의 중심 (한 변의 절반 대비)
+    if np is not None:
+        xy = np.frombuffer(points, dtype=np.float64).reshape(-1, 2)
+        u = np.abs(xy[:, 0] - center_x)
+        v = np.abs(xy[:, 1] - center_y)
+        extents = np.maximum(u, v)
+        # 모서리 영역을 지나는 점은 모서리 원과 만나는 크기 (1/t에 대한 2차 방정식의 큰 근)
+        rounded = np.minimum(u, v) > inner * extents
+        if rounded.any():
+            u, v = u[rounded], v[rounded]
+            norm = u * u + v * v
+            disc = np.maximum(inner * inner * (u + v) ** 2 - norm * (2 * inner * inner - corner * corner), 0)
+            extents[rounded] = norm / (inner * (u + v) + np.sqrt(disc))
+        best = int(np.argmax(extents))
+        return float(extents[best]), (points[2 * best], points[2 * best + 1])
+    
+    best = None
+    extent = 0.0
+    for index in range(count):
+        x, y = points[2 * index], points[2 * index + 1]
+        u, v = abs(x - center_x), abs(y - center_y)
+        candidate = max(u, v)
+        if min(u, v) > inner * candidate:
+            norm = u * u + v * v
+            disc = max(inner * inner * (u + v) ** 2 - norm * (2 * inner * inner - corner * corner), 0)
+            candidate = norm / (inner * (u + v) + math.sqrt(disc))
+        if candidate > extent:
+            best, extent = (x, y), candidate
+    return extent, best
+
+def shape_extent(points, circles, center_x, center_y, shape, tolerance):
+    """프로필 모양 기준으로 중심에서 가장 먼 점 (크기, (x, y)), 원 모양이면 원 요소는 정확히 계산"""
+    if shape == SHAPE_CIRCLE:
+        return farthest_point(points, center_x, center_y, circles)
+    samples = array('d', points)
+    for circle in circles:
+        samples.extend(circle_polyline(*circle, tolerance))
+    return rounded_square_extent(samples, center_x, center_y, SHAPE_CORNERS[shape])
+
+def fit_matrix(center_x, center_y, extent, canvas_size, margin=PROFILE_MARGIN):
+    """심볼 중심을 캔버스 중심으로 옮기고 크기를 가이드(캔버스 절반 x margin)에 맞추는 (스케일, 행렬)"""
+    canvas_center = canvas_size / 2
+    scale_factor = canvas_center * margin / extent if extent > 0 else 1.0
+    matrix = compose(translate(canvas_center - center_x * scale_factor, canvas_center - center_y * scale_factor),
+                     scale(scale_factor))
+    return scale_factor, matrix
+
+def scale_for_circular_profile(input_file, output_file, canvas_size=1000, streaming=False, tolerance=None,
+                               center=CENTER_BBOX, margin=PROFILE_MARGIN):
+    """SVG를 원형 프로필에 맞게 스케일링
+    
+    곡선은 tolerance(사용자 단위, 없으면 심볼 크기의 1/10000) 안의 꺾은선으로 근사하고,
+    원은 중심 거리 + 반지름으로 계산하여 가장 먼 점을 구한다.
+    center=CENTER_MEC이면 경계 상자 대신 최소 외접원의 중심을 캔버스 중심에 맞춘다
+    (가장 먼 점까지의 거리가 가장 짧은 중심이라 심볼을 가장 크게 키울 수 있음).
+    
+    streaming=True이면 파일을 요소 단위로 여러 번 읽어 메모리 사용량을 일정하게 유지
+    (경계 상자 -> 가장 먼 점 -> 변환 기록 순서).
+    """
+    if streaming:
+        document = None
+        stream_info = stream_geometry(input_file)
+        min_x, min_y, max_x, max_y = stream_info.bounds
+    else:
+        document = SVGDocument.load(input_file)
+        
+        # 현재 심볼의 경계 상자와 곡선 위 점 구하기
+        min_x, min_y, max_x, max_y, points, circles = get_bounding_box_and_corners(document, tolerance)
+    
+    if tolerance is None:
+        tolerance = profile_tolerance(min_x, min_y, max_x, max_y)
     
     # 현재 심볼의 중심점
     center_x = (min_x + max_x) / 2
     center_y = (min_y + max_y) / 2
+    if center == CENTER_MEC:
+        if streaming:
+            enclosing = stream_enclosing_circle(input_file, stream_info.background, tolerance)
+        else:
+            enclosing = minimum_enclosing_circle(points, circles, tolerance)
+        if enclosing is not None:
+            center_x, center_y = enclosing[0], enclosing[1]
+    elif center != CENTER_BBOX:
+        raise ValueError(f"알 수 없는 중심 방식: {center}")
     
     # 캔버스 중심
     canvas_center = canvas_size / 2
     
-    # 각 점에서 캔버스 중심까지의 거리 계산
-    max_distance = 0
-    critical_point = None
-    
-    # 현재 중심이 캔버스 중심에 있다고 가정하고 거리 계산
-    translate_x = canvas_center - center_x
-    translate_y = canvas_center - center_y
-    
-    for x, y in all_coords:
-        # 이동 후 좌표
-        translated_x = x + translate_x
-        translated_y = y + translate_y
-        
-        # 캔버스 중심에서의 거리
-        dist_from_center = math.sqrt(
-            (translated_x - canvas_center) ** 2 + 
-            (translated_y - canvas_center) ** 2
-        )
-        
-        if dist_from_center > max_distance:
-            max_distance = dist_from_center
-            critical_point = (x, y)
+    # 심볼 중심에서 가장 먼 점 (캔버스 중심으로 옮겨도 거리는 같음)
+    if streaming:
+        max_distance, critical_point = stream_farthest_point(
+            input_file, stream_info.background, center_x, center_y, tolerance)
+    else:
+        max_distance, critical_point = farthest_point(points, center_x, center_y, circles)
     
     # 원의 반지름 (여유 공간 고려)
-    circle_radius = canvas_center * 0.98  # 2% 여유
+    circle_radius = canvas_center * margin
     
-    # 필요한 스케일 팩터
-    if max_distance > 0:
-        scale_factor = circle_radius / max_distance
-    else:
-        scale_factor = 1.0
+    # 필요한 스케일 팩터와 스케일 후 이동하는 아핀 행렬 (배경 도형은 변환하지 않음)
+    scale_factor, matrix = fit_matrix(center_x, center_y, max_distance, canvas_size, margin)
     
     print(f"현재 심볼 크기: {max_x - min_x:.2f} x {max_y - min_y:.2f}")
-    print(f"현재 중심점: ({center_x:.2f}, {center_y:.2f})")
+    print(f"현재 중심점 ({center}): ({center_x:.2f}, {center_y:.2f})")
     print(f"가장 먼 점: {critical_point}")
     print(f"최대 거리: {max_distance:.2f}")
     print(f"목표 반지름: {circle_radius:.2f}")
     print(f"스케일 팩터: {scale_factor:.4f}")
     
-    # 새로운 중심 위치 계산 (스케일링 후)
-    new_translate_x = canvas_center - center_x * scale_factor
-    new_translate_y = canvas_center - center_y * scale_factor
-    
-    # 좌표 변환 함수
-    def transform_coordinates(match):
-        coords = match.group(1)
-        # Fill path는 변환하지 않음
-        if 'M 1000.00 0.00' in coords:
-            return match.group(0)
-            
-        # 숫자 패턴 찾기
-        def replace_number(num_match):
-            num = float(num_match.group(0))
-            if hasattr(replace_number, 'index'):
-                replace_number.index += 1
-            else:
-                replace_number.index = 0
-                
-            # 홀수 인덱스는 x좌표, 짝수 인덱스는 y좌표
-            if replace_number.index % 2 == 1:  # x 좌표
-                transformed = num * scale_factor + new_translate_x
-            else:  # y 좌표
-                transformed = num * scale_factor + new_translate_y
-                
-            return f"{transformed:.2f}"
+    if streaming:
+        # 요소를 하나씩 변환하여 바로 저장
+        stream_transform(input_file, output_file, matrix, skip_positions=stream_info.background)
+    else:
+        document.apply_transform(matrix, skip=document.geometry().background)
         
-        replace_number.index = 0
-        result = re.sub(r'[-+]?\d*\.?\d+', replace_number, coords)
-        return match.group(0).replace(coords, result)
+        # 결과 저장
+        document.save(output_file)
+    
+    print(f"\n심볼이 원형 프로필에 맞게 조정되었습니다.")
+    print(f"결과가 '{output_file}'에 저장되었습니다.")
+
+def fit_presets(input_file, presets, tolerance=None, center=CENTER_BBOX):
+    """원본 파일의 기하 정보를 한 번만 계산하여 프리셋별 변환 행렬 계산 (SourceFit)
     
-    # path d 속성의 좌표 변환
-    svg_content = re.sub(r'd="([^"]*)"', transform_coordinates, svg_content)
+    원형 프리셋은 center 방식의 중심을, 둥근 사각형 프리셋은 경계 상자 중심을 쓴다.
+    """
+    document = SVGDocument.load(input_file)
+    bounds, geometries, circles, background = document.geometry()
+    if not geometries and not circles:
+        raise ValueError("배경을 제외한 도형이 없습니다")
+    if tolerance is None:
+        tolerance = profile_tolerance(*bounds)
     
-    # circle 요소의 변환
-    def transform_circle(match):
-        cx = float(match.group(1)) * scale_factor + new_translate_x
-        cy = float(match.group(2)) * scale_factor + new_translate_y
-        r = float(match.group(3)) * scale_factor
-        return f'<circle fill="#13aefe" cx="{cx:.2f}" cy="{cy:.2f}" r="{r:.2f}" />'
+    points = array('d')
+    for geometry in geometries:
+        points.extend(path_polyline(geometry, tolerance))
     
-    svg_content = re.sub(r'<circle[^>]*cx="([\d.]+)"[^>]*cy="([\d.]+)"[^>]*r="([\d.]+)"[^>]*/>',
-                        transform_circle, svg_content)
+    centers = {SHAPE_ROUNDED_SQUARE: ((bounds[0] + bounds[2]) / 2, (bounds[1] + bounds[3]) / 2)}
+    centers[SHAPE_CIRCLE] = centers[SHAPE_ROUNDED_SQUARE]
+    if center == CENTER_MEC:
+        enclosing = minimum_enclosing_circle(points, circles, tolerance)
+        if enclosing is not None:
+            centers[SHAPE_CIRCLE] = enclosing[0], enclosing[1]
+    elif center != CENTER_BBOX:
+        raise ValueError(f"알 수 없는 중심 방식: {center}")
     
-    # 결과 저장
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(svg_content)
+    # 모양별로 한 번씩만 가장 먼 점 계산
+    extents = {}
+    matrices = {}
+    for preset in presets:
+        center_x, center_y = centers[preset.shape]
+        if preset.shape not in extents:
+            extents[preset.shape] = shape_extent(points, circles, center_x, center_y, preset.shape, tolerance)[0]
+        matrices[preset.name] = fit_matrix(center_x, center_y, extents[preset.shape],
+                                           preset.canvas_size, preset.margin)[1]
     
-    print(f"\n심볼이 원형 프로필에 맞게 조정되었습니다.")
-    print(f"결과가 '{output_file}'에 저장되었습니다.")
+    # 배경 요소는 문서 순서 번호로 전달 (다른 프로세스에서 다시 읽은 문서에서 찾기 위해)
+    background_ids = {id(element) for element in background}
+    positions = [index for index, element in enumerate(document.root.iter()) if id(element) in background_ids]
+    return SourceFit(positions, matrices)
+
+def write_profile_preset(input_file, output_file, preset, matrix, background=()):
+    """원본에 프리셋 변환 행렬을 적용하여 preset.canvas_size 정사각형 캔버스로 저장
+    
+    배경 요소(문서 순서 번호)는 심볼과 따로 원래 캔버스에서 새 캔버스로 늘린다.
+    """
+    document = SVGDocument.load(input_file)
+    size = preset.canvas_size
+    elements = list(document.root.iter())
+    skip = [elements[index] for index in background]
+    viewbox = document.viewbox
+    if skip and viewbox is not None:
+        # 문서 전체를 새 캔버스로 옮긴 뒤 심볼에만 나머지 변환 (matrix x 캔버스 변환의 역행렬)
+        x, y, width, height = viewbox
+        document.apply_transform(compose(scale(size / width, size / height), translate(-x, -y)))
+        document.viewbox = (0, 0, size, size)
+        matrix = compose(matrix, translate(x, y), scale(width / size, height / size))
+    document.apply_transform(matrix, skip=skip)
+    
+    document.viewbox = (0, 0, size, size)
+    for name in ('width', 'height'):
+        if document.root.get(name) is not None:
+            document.root.set(name, format_number(size))
+    
+    os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+    document.save(output_file)
+
+def preset_output_path(input_file, preset, output_dir, root=None):
+    """프리셋 결과 파일 경로 (<출력 폴더>/<프리셋>/<root 기준 상대 경로>)"""
+    return batch_output_path(input_file, 'profile', os.path.join(output_dir, preset.name), '', root)
+
+def _fit_task(input_file, presets, tolerance, center):
+    """프로세스 풀 작업: 원본 하나의 프리셋 맞춤 (실패하면 BatchResult)"""
+    start = time.perf_counter()
+    try:
+        return input_file, fit_presets(input_file, presets, tolerance, center)
+    except Exception as e:
+        return BatchResult(input_file, None, False, time.perf_counter() - start,
+                           f"{type(e).__name__}: {e}", '')
+
+def _write_task(input_file, output_file, preset, matrix, background):
+    """프로세스 풀 작업: 프리셋 결과 하나 저장"""
+    start = time.perf_counter()
+    try:
+        write_profile_preset(input_file, output_file, preset, matrix, background)
+        ok, message = True, '완료'
+    except Exception as e:
+        ok, message = False, f"{type(e).__name__}: {e}"
+    return BatchResult(input_file, output_file, ok, time.perf_counter() - start, message, '')
+
+def batch_profiles(files, presets, output_dir, workers=None, tolerance=None, center=CENTER_BBOX):
+    """여러 원본을 여러 프리셋으로 변환하고 끝난 순서대로 BatchResult 반환
+    
+    원본마다 기하 정보를 한 번 계산한 뒤(작업 하나), 프리셋별 저장을 각각 별도 작업으로 제출하여
+    같은 프로세스 풀에서 병렬로 처리한다. workers=1이면 현재 프로세스에서 순서대로 처리한다.
+    결과는 프리셋 폴더 아래에 입력 파일들의 공통 상위 폴더 기준 상대 경로로 저장한다.
+    """
+    root = common_root(files)
+    if workers == 1:
+        for input_file in files:
+            result = _fit_task(input_file, presets, tolerance, center)
+            if isinstance(result, BatchResult):
+                yield result
+                continue
+            fit = result[1]
+            for preset in presets:
+                yield _write_task(input_file, preset_output_path(input_file, preset, output_dir, root), preset,
+                                  fit.matrices[preset.name], fit.background)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(_fit_task, input_file, presets, tolerance, center) for input_file in files}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if isinstance(result, BatchResult):
+                    yield result
+                    continue
+                input_file, fit = result
+                for preset in presets:
+                    pending.add(executor.submit(_write_task, input_file,
+                                                preset_output_path(input_file, preset, output_dir, root), preset,
+                                                fit.matrices[preset.name], fit.background))
+
+def batch_main(args):
+    """프리셋 일괄 처리 실행, 실패가 있으면 1 반환"""
+    names = list(PRESETS) if 'all' in args.preset else list(dict.fromkeys(args.preset))
+    presets = [PRESETS[name] for name in names]
+    if args.margin is not None:
+        presets = [preset._replace(margin=args.margin) for preset in presets]
+    files = collect_svg_files(args.inputs, args.recursive)
+    if not files:
+        print("처리할 SVG 파일이 없습니다.")
+        return 1
+    
+    output_dir = args.output or 'profiles'
+    center = CENTER_MEC if args.mec else CENTER_BBOX
+    print(f"{len(files)}개 파일 x 프리셋 {len(presets)}개 ({', '.join(names)}) -> {output_dir} "
+          f"(프로세스 {args.workers}개)")
+    start = time.perf_counter()
+    succeeded = failed = 0
+    for result in batch_profiles(files, presets, output_dir, args.workers, args.tolerance, center):
+        if result.ok:
+            succeeded += 1
+            print(f"✓ {result.input_file} -> {result.output_file} ({result.seconds * 1000:.1f}ms)")
+        else:
+            failed += 1
+            print(f"✗ {result.input_file}: {result.message}")
+    
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    print(f"\n완료: 성공 {succeeded}개, 실패 {failed}개, {elapsed:.2f}초 ({succeeded / elapsed:.1f} 파일/초)")
+    return 1 if failed else 0
 
 def main():
-    if len(sys.argv) > 1:
-        input_file = sys.argv[1]
-        output_file = sys.argv[2] if len(sys.argv) > 2 else input_file.replace('.svg', '_profile.svg')
+    """메인 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='SVG를 원형 프로필에 맞게 스케일링')
+    parser.add_argument('inputs', nargs='*',
+                        help='입력 SVG [출력 SVG] (--preset: SVG 파일, 폴더 또는 glob 패턴)')
+    parser.add_argument('-o', '--output', help='결과 파일 (--preset: 결과 폴더, 기본 profiles)')
+    parser.add_argument('--preset', nargs='+', choices=tuple(PRESETS) + ('all',),
+                        help='일괄 처리할 대상 프리셋 (프리셋마다 하위 폴더에 저장)')
+    parser.add_argument('--canvas-size', type=float, help='캔버스 크기 (기본 1000, 프리셋과 함께 쓸 수 없음)')
+    parser.add_argument('--margin', type=float,
+                        help=f'가이드 대비 심볼 크기 비율 (기본 {PROFILE_MARGIN}, --preset이면 프리셋 값 대신 사용)')
+    parser.add_argument('--tolerance', type=float, help='곡선 근사 허용 오차 (사용자 단위, 기본: 심볼 크기의 1/10000)')
+    parser.add_argument('--mec', action='store_true', help='최소 외접원 중심에 맞춤 (원형)')
+    parser.add_argument('--stream', action='store_true', help='대용량 파일용 스트리밍 모드 (프리셋과 함께 쓸 수 없음)')
+    parser.add_argument('-r', '--recursive', action='store_true', help='하위 폴더까지 검색')
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count(), help='작업 프로세스 수')
+    args = parser.parse_args()
+    
+    if args.preset:
+        if args.canvas_size is not None or args.stream:
+            parser.error("--canvas-size, --stream은 --preset과 함께 쓸 수 없습니다 (캔버스 크기는 프리셋에 포함)")
+        sys.exit(batch_main(args))
+    
+    center = CENTER_MEC if args.mec else CENTER_BBOX
+    if args.inputs:
+        input_file = args.inputs[0]
+        output_file = args.output or (args.inputs[1] if len(args.inputs) > 1
+                                      else input_file.replace('.svg', '_profile.svg'))
     else:
         # 기본값
         input_file = '../Images/Icon_WithoutTail_1000x1000_profile.svg'
@@ -178,7 +436,9 @@ def main():
         print(f"파일을 찾을 수 없습니다: {input_file}")
         return
     
-    scale_for_circular_profile(input_file, output_file)
+    scale_for_circular_profile(input_file, output_file, args.canvas_size or 1000, streaming=args.stream,
+                               tolerance=args.tolerance, center=center,
+                               margin=PROFILE_MARGIN if args.margin is None else args.margin)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
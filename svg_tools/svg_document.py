@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+SVG 문서 처리 모듈 (xml.etree 기반)
+- 파일을 한 번만 파싱하여 트리로 유지
+- path, circle, rect, ellipse, line, polygon, polyline 좌표와 transform 속성에 아핀 변환 적용
+- 원래 속성(fill, stroke 등)은 그대로 유지
+- 변환 결과를 한 번에 직렬화하여 저장
+"""
+
+import io
+import re
+import xml.etree.ElementTree as ET
+from array import array
+from collections import namedtuple
+
+from svg_geometry import (EMPTY_BOUNDS, compute_path_geometry, is_background_bounds,
+                          path_geometry, union_bounds)
+from svg_transform import (IDENTITY, apply_point, format_matrix, multiply, parse_transform,
+                           scale_factor, transform_coords, transform_path)
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+
+ET.register_namespace('', SVG_NS)
+ET.register_namespace('xlink', 'http://www.w3.org/1999/xlink')
+
+# 좌표를 직접 바꾸는 도형
+SHAPE_TAGS = {'path', 'circle', 'rect', 'ellipse', 'line', 'polygon', 'polyline'}
+# 자식 요소로 내려가며 변환하는 컨테이너
+CONTAINER_TAGS = {'svg', 'g', 'a', 'switch'}
+# 좌표를 직접 바꿀 수 없어 transform 속성으로 변환하는 요소
+TRANSFORM_ONLY_TAGS = {'text', 'image', 'use', 'foreignObject'}
+# userSpaceOnUse 좌표를 쓰는 defs 안의 요소
+USER_SPACE_DEF_TAGS = {'clipPath', 'mask'}
+
+DocumentGeometry = namedtuple('DocumentGeometry', ['bounds', 'paths', 'circles', 'background'])
+DocumentGeometry.__doc__ = """심볼 경계 상자, PathGeometry 목록, (cx, cy, r) 목록, 배경 요소 목록"""
+
+_NUMBER_RE = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+
+def local_name(tag):
+    """네임스페이스를 제외한 태그 이름"""
+    if not isinstance(tag, str):
+        return ''
+    return tag.rsplit('}', 1)[-1]
+
+
+def format_number(value):
+    """좌표 값 문자열 (소수점 2자리)"""
+    return f"{value:.2f}"
+
+
+def parse_length(value, reference=None, default=0.0):
+    """길이 속성 값을 숫자로 변환 (단위 무시, %는 reference 기준)"""
+    if value is None:
+        return default
+    value = value.strip()
+    match = _NUMBER_RE.match(value)
+    if match is None:
+        return default
+    number = float(match.group())
+    if value.endswith('%') and reference is not None:
+        return number / 100 * reference
+    return number
+
+
+def parse_viewbox(attrib):
+    """svg 요소 속성에서 viewBox (x, y, width, height) 추출, 없으면 width/height 사용"""
+    value = attrib.get('viewBox')
+    if value:
+        numbers = [float(n) for n in _NUMBER_RE.findall(value)]
+        if len(numbers) == 4:
+            return tuple(numbers)
+    width, height = attrib.get('width'), attrib.get('height')
+    if width and height and not width.endswith('%') and not height.endswith('%'):
+        return (0.0, 0.0, parse_length(width), parse_length(height))
+    return None
+
+
+def format_viewbox(box):
+    """viewBox 속성 문자열"""
+    return ' '.join(format_number(v) for v in box)
+
+
+def shape_to_path(tag, attrib, canvas=None):
+    """기본 도형 요소(태그, 속성 dict)를 동일한 모양의 패스 문자열로 변환"""
+    get = attrib.get
+    width_ref = canvas[2] if canvas else None
+    height_ref = canvas[3] if canvas else None
+
+    if tag == 'path':
+        return get('d', '')
+    if tag == 'rect':
+        x = parse_length(get('x'), width_ref)
+        y = parse_length(get('y'), height_ref)
+        width = parse_length(get('width'), width_ref)
+        height = parse_length(get('height'), height_ref)
+        if width <= 0 or height <= 0:
+            return ''
+        return f"M {x} {y} H {x + width} V {y + height} H {x} Z"
+    if tag in ('circle', 'ellipse'):
+        cx = parse_length(get('cx'), width_ref)
+        cy = parse_length(get('cy'), height_ref)
+        if tag == 'circle':
+            rx = ry = parse_length(get('r'))
+        else:
+            rx = parse_length(get('rx'), width_ref)
+            ry = parse_length(get('ry'), height_ref)
+        if rx <= 0 or ry <= 0:
+            return ''
+        return (f"M {cx - rx} {cy} A {rx} {ry} 0 1 0 {cx + rx} {cy} "
+                f"A {rx} {ry} 0 1 0 {cx - rx} {cy} Z")
+    if tag == 'line':
+        return (f"M {parse_length(get('x1'), width_ref)} {parse_length(get('y1'), height_ref)} "
+                f"L {parse_length(get('x2'), width_ref)} {parse_length(get('y2'), height_ref)}")
+    if tag in ('polygon', 'polyline'):
+        numbers = _NUMBER_RE.findall(get('points', ''))
+        if len(numbers) < 4:
+            return ''
+        path_d = 'M ' + ' '.join(numbers[:len(numbers) // 2 * 2])
+        return path_d + ' Z' if tag == 'polygon' else path_d
+    return ''
+
+
+def shape_geometry(tag, attrib, ctm=IDENTITY, canvas=None, use_cache=True):
+    """도형 하나의 (PathGeometry, 원 정보) 계산, 빈 도형이면 None
+
+    원 정보는 circle 요소일 때 변환 후의 (cx, cy, r), 아니면 None.
+    """
+    path_d = shape_to_path(tag, attrib, canvas)
+    if not path_d:
+        return None
+    if ctm != IDENTITY:
+        geometry = compute_path_geometry(transform_path(path_d, ctm))
+    elif use_cache:
+        geometry = path_geometry(path_d)
+    else:
+        geometry = compute_path_geometry(path_d)
+
+    circle = None
+    if tag == 'circle':
+        cx, cy = apply_point(ctm, parse_length(attrib.get('cx')), parse_length(attrib.get('cy')))
+        circle = (cx, cy, parse_length(attrib.get('r')) * scale_factor(ctm))
+    return geometry, circle
+
+
+class SVGDocument:
+    """ElementTree로 파싱한 SVG 문서"""
+
+    def __init__(self, tree, prolog=(), epilogue=()):
+        self.tree = tree
+        self.root = tree.getroot()
+        # 루트 요소 앞뒤의 주석과 처리 명령 (저장할 때 그대로 다시 씀)
+        self.prolog = list(prolog)
+        self.epilogue = list(epilogue)
+
+    @classmethod
+    def load(cls, source):
+        """파일 경로 또는 파일 객체에서 문서 읽기 (주석 유지, 네임스페이스 접두사 등록)"""
+        parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True, insert_pis=True))
+        iterator = ET.iterparse(source, events=('start-ns', 'start', 'comment', 'pi'), parser=parser)
+        nodes = []
+        prolog_size = None
+        for event, value in iterator:
+            if event == 'start':
+                if prolog_size is None:
+                    prolog_size = len(nodes)
+            elif event == 'start-ns':
+                try:
+                    ET.register_namespace(*value)
+                except ValueError:
+                    pass
+            else:
+                nodes.append(value)
+        
+        root = iterator.root
+        prolog = epilogue = ()
+        if nodes:
+            # 트리에 들어가지 않은 주석/처리 명령이 루트 요소 바깥의 노드
+            inside = {id(node) for node in root.iter() if not isinstance(node.tag, str)}
+            prolog = [node for node in nodes[:prolog_size] if id(node) not in inside]
+            epilogue = [node for node in nodes[prolog_size:] if id(node) not in inside]
+        return cls(ET.ElementTree(root), prolog, epilogue)
+
+    @classmethod
+    def from_string(cls, svg_content):
+        """문자열에서 문서 읽기"""
+        return cls.load(io.BytesIO(svg_content.encode('utf-8')))
+
+    def save(self, output_file):
+        """문서를 한 번에 직렬화하여 저장 (루트 요소 앞뒤의 주석과 처리 명령 포함)"""
+        if not self.prolog and not self.epilogue:
+            self.tree.write(output_file, encoding='utf-8', xml_declaration=True)
+            return
+        parts = ["<?xml version='1.0' encoding='utf-8'?>"]
+        parts.extend(ET.tostring(node, encoding='unicode') for node in self.prolog)
+        parts.append(self.to_string())
+        parts.extend(ET.tostring(node, encoding='unicode') for node in self.epilogue)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(parts) + '\n')
+
+    def to_string(self):
+        """문서를 문자열로 직렬화"""
+        return ET.tostring(self.root, encoding='unicode')
+
+    @property
+    def viewbox(self):
+        """viewBox (x, y, width, height), 없으면 width/height 속성 사용"""
+        return parse_viewbox(self.root.attrib)
+
+    @viewbox.setter
+    def viewbox(self, box):
+        self.root.set('viewBox', format_viewbox(box))
+
+    def iter_shapes(self):
+        """(요소, 누적 변환 행렬) 순서로 모든 도형 요소 반환"""
+        stack = [(self.root, IDENTITY)]
+        while stack:
+            element, ctm = stack.pop()
+            tag = local_name(element.tag)
+            if element.get('transform'):
+                ctm = multiply(ctm, parse_transform(element.get('transform')))
+            if tag in SHAPE_TAGS:
+                yield element, ctm
+            elif tag in CONTAINER_TAGS or element is self.root:
+                # 순서를 유지하기 위해 역순으로 쌓음
+                stack.extend((child, ctm) for child in reversed(element))
+
+    def geometry(self, skip_background=True):
+        """심볼(배경 제외)의 경계 상자와 기하 정보 계산"""
+        canvas = self.viewbox
+        paths = []
+        circles = []
+        background = []
+        bounds_list = []
+        for element, ctm in self.iter_shapes():
+            shape = shape_geometry(local_name(element.tag), element.attrib, ctm, canvas)
+            if shape is None:
+                continue
+            geometry, circle = shape
+            if (skip_background and canvas is not None
+                    and is_background_bounds(geometry.bounds, canvas)):
+                background.append(element)
+                continue
+
+            if circle is not None:
+                circles.append(circle)
+            else:
+                paths.append(geometry)
+            bounds_list.append(geometry.bounds)
+
+        bounds = union_bounds(*bounds_list) if bounds_list else EMPTY_BOUNDS
+        return DocumentGeometry(bounds, paths, circles, background)
+
+    def apply_transform(self, matrix, skip=()):
+        """문서 전체 좌표에 아핀 변환 적용 (skip에 포함된 요소는 제외)"""
+        skip_ids = {id(element) for element in skip}
+        canvas = self.viewbox
+        for child in self.root:
+            _transform_element(child, matrix, skip_ids, canvas)
+
+
+# 변환 모드 (자식 요소에 적용할 방식)
+MODE_TRANSFORM = 'transform'  # 자식 좌표도 변환
+MODE_KEEP = 'keep'            # 자식은 그대로 둠
+MODE_DEFS = 'defs'            # defs 안: clipPath/mask만 변환
+
+
+def transform_attributes(tag, attrib, matrix, canvas, mode=MODE_TRANSFORM):
+    """요소 하나의 속성(dict)에 변환을 적용하고 자식 요소에 쓸 모드 반환
+
+    DOM 처리와 스트리밍 처리가 같은 규칙을 쓰도록 속성 dict만 다룬다.
+    """
+    if mode == MODE_KEEP:
+        return MODE_KEEP
+    if mode == MODE_DEFS and tag not in USER_SPACE_DEF_TAGS:
+        return MODE_KEEP
+    if tag == 'defs':
+        # defs 안에서는 사용자 좌표계를 쓰는 clipPath/mask만 변환
+        return MODE_DEFS
+    if not (tag in SHAPE_TAGS or tag in CONTAINER_TAGS
+            or tag in TRANSFORM_ONLY_TAGS or tag in USER_SPACE_DEF_TAGS):
+        return MODE_KEEP
+
+    # transform 속성이 있으면 행렬만 합성하고 자식 좌표는 그대로 둠
+    own_transform = attrib.get('transform')
+    if own_transform is not None or tag in TRANSFORM_ONLY_TAGS:
+        combined = multiply(matrix, parse_transform(own_transform))
+        attrib['transform'] = format_matrix(combined)
+        return MODE_KEEP
+
+    _scale_stroke_width(attrib, matrix)
+
+    if tag in CONTAINER_TAGS or tag in USER_SPACE_DEF_TAGS:
+        return MODE_TRANSFORM
+    if not _transform_shape(attrib, tag, matrix, canvas):
+        # 좌표로 표현할 수 없는 변환(회전/기울이기 등)은 transform 속성으로 적용
+        attrib['transform'] = format_matrix(matrix)
+    return MODE_KEEP
+
+
+def _transform_element(element, matrix, skip_ids, canvas, mode=MODE_TRANSFORM):
+    """요소 하나(와 자식들)에 변환 적용"""
+    if id(element) in skip_ids:
+        return
+    child_mode = transform_attributes(local_name(element.tag), element.attrib, matrix, canvas, mode)
+    if child_mode != MODE_KEEP:
+        for child in element:
+            _transform_element(child, matrix, skip_ids, canvas, child_mode)
+
+
+def _scale_stroke_width(attrib, matrix):
+    """stroke-width 속성을 변환 스케일에 맞게 조정"""
+    stroke_width = attrib.get('stroke-width')
+    if stroke_width is not None and not stroke_width.strip().endswith('%'):
+        attrib['stroke-width'] = format_number(parse_length(stroke_width) * scale_factor(matrix))
+
+
+def _transform_shape(attrib, tag, matrix, canvas):
+    """도형 좌표에 직접 변환 적용, 좌표로 표현할 수 없으면 False
+
+    % 단위 길이는 변환 전 viewBox 기준으로 절대값으로 바꾼 뒤 변환한다.
+    """
+    a, b, c, d, _, _ = matrix
+    get = attrib.get
+    set_attr = attrib.__setitem__
+    width_ref = canvas[2] if canvas else None
+    height_ref = canvas[3] if canvas else None
+    axis_aligned = b == 0 and c == 0
+
+    if tag == 'path':
+        path_d = get('d')
+        if path_d:
+            transformed = transform_path(path_geometry(path_d).path, matrix, normalized=True)
+            set_attr('d', transformed.to_string())
+        return True
+
+    if tag in ('polygon', 'polyline'):
+        numbers = [float(n) for n in _NUMBER_RE.findall(get('points', ''))]
+        coords = transform_coords(array('d', numbers[:len(numbers) // 2 * 2]), matrix)
+        set_attr('points', ' '.join(f"{format_number(x)},{format_number(y)}"
+                                       for x, y in zip(coords[0::2], coords[1::2])))
+        return True
+
+    if tag == 'line':
+        for x_attr, y_attr in (('x1', 'y1'), ('x2', 'y2')):
+            x, y = apply_point(matrix, parse_length(get(x_attr), width_ref), parse_length(get(y_attr), height_ref))
+            set_attr(x_attr, format_number(x))
+            set_attr(y_attr, format_number(y))
+        return True
+
+    if tag == 'circle':
+        if abs(a * c + b * d) > 1e-9 or abs(a * a + b * b - c * c - d * d) > 1e-9:
+            return False  # 균일 스케일(+회전)이 아니면 원 모양이 유지되지 않음
+        cx, cy = apply_point(matrix, parse_length(get('cx'), width_ref), parse_length(get('cy'), height_ref))
+        set_attr('cx', format_number(cx))
+        set_attr('cy', format_number(cy))
+        set_attr('r', format_number(parse_length(get('r')) * scale_factor(matrix)))
+        return True
+
+    if not axis_aligned:
+        return False
+
+    if tag == 'ellipse':
+        cx, cy = apply_point(matrix, parse_length(get('cx'), width_ref), parse_length(get('cy'), height_ref))
+        set_attr('cx', format_number(cx))
+        set_attr('cy', format_number(cy))
+        set_attr('rx', format_number(parse_length(get('rx'), width_ref) * abs(a)))
+        set_attr('ry', format_number(parse_length(get('ry'), height_ref) * abs(d)))
+        return True
+
+    if tag == 'rect':
+        x = parse_length(get('x'), width_ref)
+        y = parse_length(get('y'), height_ref)
+        x1, y1 = apply_point(matrix, x, y)
+        x2, y2 = apply_point(matrix, x + parse_length(get('width'), width_ref),
+                             y + parse_length(get('height'), height_ref))
+        set_attr('x', format_number(min(x1, x2)))
+        set_attr('y', format_number(min(y1, y2)))
+        set_attr('width', format_number(abs(x2 - x1)))
+        set_attr('height', format_number(abs(y2 - y1)))
+        if get('rx') is not None or get('ry') is not None:
+            # 한쪽만 지정되면 다른 쪽도 같은 값 (SVG 규칙)
+            rx = parse_length(get('rx', get('ry')), width_ref)
+            ry = parse_length(get('ry', get('rx')), height_ref)
+            set_attr('rx', format_number(rx * abs(a)))
+            set_attr('ry', format_number(ry * abs(d)))
+        return True
+
+    return False
@@ -0,0 +1,537 @@
+#!/usr/bin/env python3
+"""
+SVG 기하 계산 모듈
+- 베지어 곡선의 극값(도함수의 근)으로 정확한 경계 상자 계산
+- 여러 곡선의 근을 한 번에 계산 (NumPy가 있으면 벡터 연산)
+- 패스 내용의 해시를 키로 하는 기하 정보 캐시
+- 곡선을 허용 오차 안의 꺾은선으로 근사 (곡선마다 필요한 만큼만 나눔) + 꺾은선 캐시
+- 중심에서 가장 먼 점을 한 번의 벡터 연산으로 계산
+- 점 집합의 최소 외접원 (볼록 껍질로 후보를 줄인 뒤 Welzl 알고리즘, 평균 선형 시간)
+- 캔버스 전체를 덮는 배경 도형 판별
+"""
+
+import hashlib
+import math
+import random
+import struct
+from array import array
+from collections import OrderedDict, namedtuple
+
+from svg_path import as_path_data
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 순수 Python으로 처리
+    np = None
+
+PathGeometry = namedtuple('PathGeometry', ['path', 'bounds', 'points'])
+PathGeometry.__doc__ = """정규화된 PathData, 경계 상자 (min_x, min_y, max_x, max_y), 곡선 위 극점 좌표 버퍼"""
+
+EMPTY_BOUNDS = (float('inf'), float('inf'), float('-inf'), float('-inf'))
+
+DEFAULT_FLATTEN_TOLERANCE = 0.1  # 곡선과 꺾은선 사이의 최대 거리 (사용자 단위)
+MAX_CURVE_STEPS = 1024
+
+
+class GeometryCache:
+    """패스 내용 해시를 키로 하는 LRU 캐시"""
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(path_d):
+        """패스 문자열의 내용 해시"""
+        return hashlib.blake2b(path_d.encode('utf-8'), digest_size=16).digest()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+_geometry_cache = GeometryCache()
+_polyline_cache = GeometryCache()
+
+
+def _cubic_segments(path):
+    """정규화된 패스에서 선분 끝점과 3차 베지어 제어점 목록 추출
+
+    2차 베지어는 차수를 올려 3차로 바꾼다 (모양은 동일).
+    """
+    endpoints = array('d')
+    cubics = array('d')  # 곡선 하나당 x0 y0 x1 y1 x2 y2 x3 y3
+    current_x = current_y = 0.0
+    start_x = start_y = 0.0
+    for cmd, args in path:
+        if cmd == 'C':
+            cubics.extend((current_x, current_y))
+            cubics.extend(args)
+            current_x, current_y = args[4], args[5]
+        elif cmd == 'Q':
+            qx, qy, end_x, end_y = args
+            cubics.extend((current_x, current_y,
+                           current_x + 2 / 3 * (qx - current_x), current_y + 2 / 3 * (qy - current_y),
+                           end_x + 2 / 3 * (qx - end_x), end_y + 2 / 3 * (qy - end_y),
+                           end_x, end_y))
+            current_x, current_y = end_x, end_y
+        elif cmd in 'ML':
+            current_x, current_y = args
+            if cmd == 'M':
+                start_x, start_y = args
+        elif cmd == 'Z':
+            # 다음 명령은 하위 패스 시작점에서 이어짐
+            current_x, current_y = start_x, start_y
+            continue
+        endpoints.extend((current_x, current_y))
+    return endpoints, cubics
+
+
+def _cubic_extrema_numpy(cubics):
+    """모든 3차 베지어의 극값 점을 한 번에 계산 (NumPy)"""
+    control = np.frombuffer(cubics, dtype=np.float64).reshape(-1, 4, 2)
+    p0, p1, p2, p3 = control[:, 0], control[:, 1], control[:, 2], control[:, 3]
+
+    # B'(t)/3 = a t^2 + b t + c (축별)
+    a = -p0 + 3 * p1 - 3 * p2 + p3
+    b = 2 * (p0 - 2 * p1 + p2)
+    c = p1 - p0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        disc = b * b - 4 * a * c
+        sqrt_disc = np.sqrt(np.where(disc >= 0, disc, np.nan))
+        quadratic = np.abs(a) > 1e-12
+        t1 = np.where(quadratic, (-b + sqrt_disc) / (2 * a), -c / b)
+        t2 = np.where(quadratic, (-b - sqrt_disc) / (2 * a), np.nan)
+
+    # 각 근에서 곡선 위의 점 (x, y 양쪽 축의 근을 모두 사용)
+    roots = np.concatenate([t1, t2], axis=1)  # (n, 4)
+    valid = (roots > 0) & (roots < 1)
+    roots = np.where(valid, roots, 0.0)[..., None]
+    mt = 1 - roots
+    points = (mt ** 3 * p0[:, None] + 3 * mt * mt * roots * p1[:, None]
+              + 3 * mt * roots * roots * p2[:, None] + roots ** 3 * p3[:, None])
+    points = points[valid]
+    result = array('d')
+    result.frombytes(np.ascontiguousarray(points, dtype=np.float64).tobytes())
+    return result
+
+
+def _cubic_extrema_python(cubics):
+    """모든 3차 베지어의 극값 점 계산 (순수 Python)"""
+    result = array('d')
+    for index in range(0, len(cubics), 8):
+        x0, y0, x1, y1, x2, y2, x3, y3 = cubics[index:index + 8]
+        for p0, p1, p2, p3 in ((x0, x1, x2, x3), (y0, y1, y2, y3)):
+            a = -p0 + 3 * p1 - 3 * p2 + p3
+            b = 2 * (p0 - 2 * p1 + p2)
+            c = p1 - p0
+            if abs(a) > 1e-12:
+                disc = b * b - 4 * a * c
+                if disc < 0:
+                    continue
+                sqrt_disc = math.sqrt(disc)
+                roots = ((-b + sqrt_disc) / (2 * a), (-b - sqrt_disc) / (2 * a))
+            elif b != 0:
+                roots = (-c / b,)
+            else:
+                continue
+            for t in roots:
+                if 0 < t < 1:
+                    mt = 1 - t
+                    result.append(mt ** 3 * x0 + 3 * mt * mt * t * x1 + 3 * mt * t * t * x2 + t ** 3 * x3)
+                    result.append(mt ** 3 * y0 + 3 * mt * mt * t * y1 + 3 * mt * t * t * y2 + t ** 3 * y3)
+    return result
+
+
+def cubic_extrema(cubics):
+    """3차 베지어 제어점 버퍼에서 각 축 극값에 해당하는 곡선 위 점 계산"""
+    if not cubics:
+        return array('d')
+    if np is not None:
+        return _cubic_extrema_numpy(cubics)
+    return _cubic_extrema_python(cubics)
+
+
+def points_bounds(points):
+    """(x, y) 쌍 버퍼의 경계 상자"""
+    if not points:
+        return EMPTY_BOUNDS
+    xs = points[0::2]
+    ys = points[1::2]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def union_bounds(*bounds_list):
+    """여러 경계 상자를 합친 경계 상자"""
+    min_x, min_y, max_x, max_y = EMPTY_BOUNDS
+    for bounds in bounds_list:
+        min_x = min(min_x, bounds[0])
+        min_y = min(min_y, bounds[1])
+        max_x = max(max_x, bounds[2])
+        max_y = max(max_y, bounds[3])
+    return min_x, min_y, max_x, max_y
+
+
+def compute_path_geometry(path):
+    """패스의 정확한 경계 상자와 곡선 위 극점 계산 (캐시 없음)"""
+    normalized = as_path_data(path).normalized()
+    points, cubics = _cubic_segments(normalized)
+    points.extend(cubic_extrema(cubics))
+    return PathGeometry(normalized, points_bounds(points), points)
+
+
+def path_geometry(path_d):
+    """패스 문자열의 기하 정보 (내용 해시 기준으로 캐시)"""
+    key = GeometryCache.key(path_d)
+    entry = _geometry_cache.get(key)
+    if entry is None:
+        entry = compute_path_geometry(path_d)
+        _geometry_cache.put(key, entry)
+    return entry
+
+
+def path_bounds(path_d):
+    """패스의 정확한 경계 상자 (min_x, min_y, max_x, max_y)"""
+    return path_geometry(path_d).bounds
+
+
+def geometry_cache():
+    """모듈 공용 기하 캐시"""
+    return _geometry_cache
+
+
+def curve_steps(points, tolerance):
+    """베지어(시작점 포함 제어점)를 허용 오차 안의 꺾은선으로 나눌 구간 수 (Wang의 공식)"""
+    degree = len(points) // 2 - 1
+    second = 0.0
+    for i in range(degree - 1):
+        ddx = points[2 * i] - 2 * points[2 * i + 2] + points[2 * i + 4]
+        ddy = points[2 * i + 1] - 2 * points[2 * i + 3] + points[2 * i + 5]
+        second = max(second, math.hypot(ddx, ddy))
+    steps = math.ceil(math.sqrt(degree * (degree - 1) / 8 * second / tolerance))
+    return min(max(steps, 1), MAX_CURVE_STEPS)
+
+
+def flatten_curve(points, tolerance, out):
+    """베지어 곡선(시작점 포함 제어점)을 꺾은선 점으로 out에 추가 (시작점 제외)"""
+    steps = curve_steps(points, tolerance)
+    if len(points) == 8:
+        x0, y0, x1, y1, x2, y2, x3, y3 = points
+        for i in range(1, steps + 1):
+            t = i / steps
+            s = 1 - t
+            a, b, c, d = s * s * s, 3 * s * s * t, 3 * s * t * t, t * t * t
+            out.extend((a * x0 + b * x1 + c * x2 + d * x3, a * y0 + b * y1 + c * y2 + d * y3))
+    else:
+        x0, y0, x1, y1, x2, y2 = points
+        for i in range(1, steps + 1):
+            t = i / steps
+            s = 1 - t
+            a, b, c = s * s, 2 * s * t, t * t
+            out.extend((a * x0 + b * x1 + c * x2, a * y0 + b * y1 + c * y2))
+
+
+def _flatten_python(path, tolerance):
+    result = array('d')
+    current_x = current_y = 0.0
+    start_x = start_y = 0.0
+    for cmd, args in path:
+        if cmd == 'C' or cmd == 'Q':
+            flatten_curve((current_x, current_y) + args, tolerance, result)
+        elif cmd == 'Z':
+            # 다음 명령은 하위 패스 시작점에서 이어짐
+            current_x, current_y = start_x, start_y
+            continue
+        else:
+            result.extend(args)
+            if cmd == 'M':
+                start_x, start_y = args
+        current_x, current_y = args[-2], args[-1]
+    return result
+
+
+def _flatten_numpy(path, tolerance):
+    """모든 명령을 3차 베지어로 보고 곡선별 구간 수만큼 한 번에 계산 (순서 유지)
+
+    M은 한 점에 모인 곡선, L은 제어점이 선분을 삼등분하는 곡선이라 구간 하나(끝점)만 나온다.
+    """
+    segments = array('d')
+    current_x = current_y = 0.0
+    start_x = start_y = 0.0
+    for cmd, args in path:
+        if cmd == 'C':
+            segments.extend((current_x, current_y))
+            segments.extend(args)
+        elif cmd == 'Q':
+            qx, qy, end_x, end_y = args
+            segments.extend((current_x, current_y,
+                             current_x + 2 / 3 * (qx - current_x), current_y + 2 / 3 * (qy - current_y),
+                             end_x + 2 / 3 * (qx - end_x), end_y + 2 / 3 * (qy - end_y),
+                             end_x, end_y))
+        elif cmd == 'L':
+            # 제어점을 선분의 1/3, 2/3 지점에 두면 2차 차분이 0이라 구간 하나
+            end_x, end_y = args
+            dx, dy = (end_x - current_x) / 3, (end_y - current_y) / 3
+            segments.extend((current_x, current_y, current_x + dx, current_y + dy,
+                             end_x - dx, end_y - dy, end_x, end_y))
+        elif cmd == 'M':
+            segments.extend(args * 4)
+            start_x, start_y = args
+        else:  # Z: 다음 명령은 하위 패스 시작점에서 이어짐
+            current_x, current_y = start_x, start_y
+            continue
+        current_x, current_y = args[-2], args[-1]
+    if not segments:
+        return array('d')
+
+    control = np.frombuffer(segments, dtype=np.float64).reshape(-1, 4, 2)
+    p0, p1, p2, p3 = control[:, 0], control[:, 1], control[:, 2], control[:, 3]
+    second = np.maximum(np.hypot(*(p0 - 2 * p1 + p2).T), np.hypot(*(p1 - 2 * p2 + p3).T))
+    steps = np.clip(np.ceil(np.sqrt(0.75 * second / tolerance)), 1, MAX_CURVE_STEPS).astype(np.intp)
+
+    # 곡선별 t = 1/steps, 2/steps, ..., 1
+    index = np.repeat(np.arange(len(steps)), steps)
+    first = np.cumsum(steps) - steps
+    t = ((np.arange(len(index)) - first[index] + 1) / steps[index])[:, None]
+    s = 1 - t
+    points = (s * s * s * p0[index] + 3 * s * s * t * p1[index]
+              + 3 * s * t * t * p2[index] + t * t * t * p3[index])
+    result = array('d')
+    result.frombytes(np.ascontiguousarray(points, dtype=np.float64).tobytes())
+    return result
+
+
+def flatten_path(path, tolerance=DEFAULT_FLATTEN_TOLERANCE):
+    """정규화된 패스(M/L/C/Q/Z)를 꺾은선 점 좌표 버퍼(x, y 반복)로 근사 (캐시 없음)
+
+    꺾은선의 점은 모두 곡선 위에 있고, 곡선의 모든 점은 꺾은선에서 tolerance 안에 있다.
+    """
+    if np is not None:
+        return _flatten_numpy(path, tolerance)
+    return _flatten_python(path, tolerance)
+
+
+def polyline_key(path, tolerance):
+    """정규화된 PathData와 허용 오차의 내용 해시"""
+    digest = hashlib.blake2b(path.opcodes.tobytes(), digest_size=16)
+    digest.update(path.coords.tobytes())
+    digest.update(struct.pack('d', tolerance))
+    return digest.digest()
+
+
+def path_polyline(geometry, tolerance=DEFAULT_FLATTEN_TOLERANCE, use_cache=True):
+    """PathGeometry의 꺾은선 점 좌표 버퍼 (패스 내용 해시 기준으로 공용 캐시에 보관)
+
+    변환된 도형도 변환 후 좌표가 같으면 같은 항목을 쓴다. 반환된 버퍼는 수정하지 않는다.
+    """
+    if not use_cache:
+        return flatten_path(geometry.path, tolerance)
+    key = polyline_key(geometry.path, tolerance)
+    entry = _polyline_cache.get(key)
+    if entry is None:
+        entry = flatten_path(geometry.path, tolerance)
+        _polyline_cache.put(key, entry)
+    return entry
+
+
+def polyline_cache():
+    """모듈 공용 꺾은선 캐시"""
+    return _polyline_cache
+
+
+def farthest_point(points, center_x, center_y, circles=()):
+    """중심에서 가장 먼 점 (거리, (x, y)), 점이 없으면 (0.0, None)
+
+    points는 (x, y) 쌍 버퍼, circles는 (cx, cy, r) 목록이며 원은 중심 거리 + 반지름으로 정확히 계산한다.
+    NumPy가 있으면 모든 점과 원의 거리를 한 번에 계산하고 최댓값 하나를 고른다.
+    """
+    count = len(points) // 2
+    if count == 0 and not circles:
+        return 0.0, None
+    if np is not None:
+        xy = np.frombuffer(points, dtype=np.float64).reshape(-1, 2) if count else np.empty((0, 2))
+        distances = np.hypot(xy[:, 0] - center_x, xy[:, 1] - center_y)
+        if circles:
+            cx, cy, r = np.asarray(circles, dtype=np.float64).T
+            distances = np.concatenate((distances, np.hypot(cx - center_x, cy - center_y) + r))
+        best = int(np.argmax(distances))
+        distance = float(distances[best])
+    else:
+        best = -1
+        distance = 0.0
+        for index in range(count):
+            candidate = math.hypot(points[2 * index] - center_x, points[2 * index + 1] - center_y)
+            if candidate > distance:
+                best, distance = index, candidate
+        for index, (cx, cy, r) in enumerate(circles):
+            candidate = math.hypot(cx - center_x, cy - center_y) + r
+            if candidate > distance:
+                best, distance = count + index, candidate
+        if best < 0:
+            return 0.0, None
+
+    if best < count:
+        return distance, (points[2 * best], points[2 * best + 1])
+    # 원 위에서 중심과 반대쪽 끝 점
+    cx, cy, r = circles[best - count]
+    offset = math.hypot(cx - center_x, cy - center_y)
+    if offset == 0:
+        return distance, (cx + r, cy)
+    return distance, (cx + r * (cx - center_x) / offset, cy + r * (cy - center_y) / offset)
+
+
+def circle_polyline(cx, cy, r, tolerance=DEFAULT_FLATTEN_TOLERANCE):
+    """원 위의 점 좌표 버퍼 (점 사이 호가 현에서 tolerance 안에 있도록 나눔)"""
+    if r <= 0:
+        return array('d', (cx, cy))
+    steps = math.ceil(math.pi / math.acos(1 - tolerance / r)) if tolerance < r else 4
+    steps = min(max(steps, 4), MAX_CURVE_STEPS)
+    result = array('d')
+    for i in range(steps):
+        angle = 2 * math.pi * i / steps
+        result.extend((cx + r * math.cos(angle), cy + r * math.sin(angle)))
+    return result
+
+
+def _cross(o, a, b):
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def convex_hull(points):
+    """(x, y) 튜플 목록의 볼록 껍질 꼭짓점 (Andrew의 monotone chain, 반시계방향)"""
+    points = sorted(set(points))
+    if len(points) <= 2:
+        return points
+    lower = []
+    for point in points:
+        while len(lower) >= 2 and _cross(lower[-2], lower[-1], point) <= 0:
+            lower.pop()
+        lower.append(point)
+    upper = []
+    for point in reversed(points):
+        while len(upper) >= 2 and _cross(upper[-2], upper[-1], point) <= 0:
+            upper.pop()
+        upper.append(point)
+    return lower[:-1] + upper[:-1]
+
+
+def _hull_candidates_numpy(points, directions=(8, 64)):
+    """여러 방향의 극점이 이루는 볼록 다각형 안쪽의 점을 한 번에 제외 (Akl-Toussaint)
+
+    적은 방향으로 대부분을 먼저 걸러낸 뒤 남은 점만 더 많은 방향으로 다시 거른다.
+    """
+    xy = np.frombuffer(points, dtype=np.float64).reshape(-1, 2)
+    for count in directions:
+        angles = np.linspace(0, 2 * np.pi, count, endpoint=False)
+        normals = np.column_stack((np.cos(angles), np.sin(angles)))
+        polygon = xy[np.argmax(xy @ normals.T, axis=0)]  # 반시계방향 순서
+        polygon = polygon[np.any(polygon != np.roll(polygon, 1, axis=0), axis=1)]
+        if len(polygon) < 3:
+            break
+        # 변마다 바깥쪽 법선 n과 n·a: 모든 변에서 n·p < n·a이면 다각형 안쪽
+        edges = np.roll(polygon, -1, axis=0) - polygon
+        outward = np.column_stack((edges[:, 1], -edges[:, 0]))
+        limits = np.einsum('ij,ij->i', outward, polygon)
+        xy = xy[~np.all(xy @ outward.T < limits, axis=1)]
+    return list(map(tuple, xy.tolist()))
+
+
+def hull_points(points):
+    """점 좌표 버퍼(x, y 반복)의 볼록 껍질 꼭짓점 목록"""
+    if not points:
+        return []
+    if np is not None:
+        return convex_hull(_hull_candidates_numpy(points))
+    return convex_hull(zip(points[0::2], points[1::2]))
+
+
+def _circle_two(a, b):
+    cx = (a[0] + b[0]) / 2
+    cy = (a[1] + b[1]) / 2
+    return cx, cy, math.hypot(a[0] - cx, a[1] - cy)
+
+
+def _circle_three(a, b, c):
+    """세 점을 지나는 원 (한 직선 위에 있으면 가장 먼 두 점의 원)"""
+    bx, by = b[0] - a[0], b[1] - a[1]
+    cx, cy = c[0] - a[0], c[1] - a[1]
+    d = 2 * (bx * cy - by * cx)
+    if d == 0:
+        return max((_circle_two(a, b), _circle_two(a, c), _circle_two(b, c)), key=lambda circle: circle[2])
+    b2 = bx * bx + by * by
+    c2 = cx * cx + cy * cy
+    ux = (cy * b2 - by * c2) / d
+    uy = (bx * c2 - cx * b2) / d
+    return a[0] + ux, a[1] + uy, math.hypot(ux, uy)
+
+
+def _in_circle(circle, point):
+    cx, cy, r = circle
+    return math.hypot(point[0] - cx, point[1] - cy) <= r * (1 + 1e-12) + 1e-12
+
+
+def welzl(points, seed=0):
+    """(x, y) 튜플 목록의 최소 외접원 (cx, cy, r), 무작위 순서로 처리하여 평균 선형 시간"""
+    points = list(points)
+    if not points:
+        return None
+    random.Random(seed).shuffle(points)
+    circle = (points[0][0], points[0][1], 0.0)
+    for i in range(1, len(points)):
+        p = points[i]
+        if _in_circle(circle, p):
+            continue
+        circle = (p[0], p[1], 0.0)
+        for j in range(i):
+            q = points[j]
+            if _in_circle(circle, q):
+                continue
+            circle = _circle_two(p, q)
+            for k in range(j):
+                if not _in_circle(circle, points[k]):
+                    circle = _circle_three(p, q, points[k])
+    return circle
+
+
+def minimum_enclosing_circle(points, circles=(), tolerance=DEFAULT_FLATTEN_TOLERANCE):
+    """점 좌표 버퍼와 원 (cx, cy, r) 목록을 모두 담는 최소 외접원 (cx, cy, r), 비어 있으면 None
+
+    최소 외접원은 볼록 껍질 꼭짓점만으로 정해지므로 껍질을 먼저 구해 Welzl 알고리즘의 입력을 줄인다.
+    원은 tolerance 간격의 점으로 근사하므로 반지름이 최대 tolerance만큼 작을 수 있다.
+    """
+    if circles:
+        points = array('d', points)
+        for cx, cy, r in circles:
+            points.extend(circle_polyline(cx, cy, r, tolerance))
+    return welzl(hull_points(points))
+
+
+def is_background_bounds(bounds, canvas, tolerance=0.5):
+    """경계 상자가 캔버스 전체를 덮으면 배경으로 판단
+
+    canvas는 (x, y, width, height) 형식의 viewBox.
+    """
+    x, y, width, height = canvas
+    return (bounds[0] <= x + tolerance and bounds[1] <= y + tolerance
+            and bounds[2] >= x + width - tolerance and bounds[3] >= y + height - tolerance)
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+SVG 패스 데이터 파서
+- 전체 SVG 패스 문법 지원 (M/L/H/V/C/S/Q/T/A/Z, 상대 좌표 포함)
+- 암시적 반복 파라미터 처리 (M 뒤의 좌표쌍은 L로 해석)
+- 지수 표기(1e-3)와 1.5.5 형태의 붙어있는 숫자 처리
+- 문자열을 한 번만 훑는 스트리밍 방식
+- 명령어 코드(array('B')) + float64 좌표 버퍼(array('d'))로 저장하는 PathData
+"""
+
+import math
+import re
+from array import array
+from collections import namedtuple
+
+# 명령어별 파라미터 개수
+PARAM_COUNTS = {
+    'M': 2, 'm': 2,
+    'L': 2, 'l': 2,
+    'H': 1, 'h': 1,
+    'V': 1, 'v': 1,
+    'C': 6, 'c': 6,
+    'S': 4, 's': 4,
+    'Q': 4, 'q': 4,
+    'T': 2, 't': 2,
+    'A': 7, 'a': 7,
+    'Z': 0, 'z': 0
+}
+
+# M 뒤에 이어지는 좌표쌍은 L로 해석
+_IMPLICIT_COMMANDS = {'M': 'L', 'm': 'l'}
+
+# 숫자: 부호, 정수부/소수부, 지수부 ("1.5.5"는 "1.5"와 ".5"로 분리됨)
+_NUMBER_RE = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+_SEPARATOR_RE = re.compile(r'[\s,]*')
+
+_ARC_UPPER = ord('A')
+_ARC_LOWER = ord('a')
+
+PathCommand = namedtuple('PathCommand', ['command', 'args'])
+PathCommand.__doc__ = """패스 명령어 하나 (명령어 문자, 파라미터 튜플)"""
+
+
+class PathData:
+    """명령어 코드와 좌표를 연속 버퍼에 저장하는 패스 표현
+
+    - opcodes: 명령어 문자의 코드값 (array('B'))
+    - offsets: 각 명령어의 좌표 시작 위치, 마지막에 끝 위치 포함 (array('I'))
+    - coords: 모든 파라미터를 이어붙인 float64 버퍼 (array('d'))
+    """
+
+    __slots__ = ('opcodes', 'offsets', 'coords')
+
+    def __init__(self, opcodes=None, offsets=None, coords=None):
+        self.opcodes = opcodes if opcodes is not None else array('B')
+        self.offsets = offsets if offsets is not None else array('I', [0])
+        self.coords = coords if coords is not None else array('d')
+
+    @classmethod
+    def from_string(cls, path_data):
+        """패스 문자열을 한 번 훑어서 PathData 생성"""
+        path = cls()
+        _scan_path(path_data, path.opcodes, path.offsets, path.coords)
+        return path
+
+    @classmethod
+    def from_commands(cls, commands):
+        """(명령어, 파라미터) 목록으로 PathData 생성"""
+        path = cls()
+        for cmd, args in commands:
+            path.append(cmd, args)
+        return path
+
+    def append(self, cmd, args=()):
+        """명령어 하나 추가"""
+        self.opcodes.append(ord(cmd))
+        self.coords.extend(args)
+        self.offsets.append(len(self.coords))
+
+    def __len__(self):
+        return len(self.opcodes)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.opcodes)
+        if not 0 <= index < len(self.opcodes):
+            raise IndexError('PathData index out of range')
+        offsets = self.offsets
+        return PathCommand(chr(self.opcodes[index]),
+                           tuple(self.coords[offsets[index]:offsets[index + 1]]))
+
+    def __iter__(self):
+        coords = self.coords
+        offsets = self.offsets
+        for index, opcode in enumerate(self.opcodes):
+            yield PathCommand(chr(opcode), tuple(coords[offsets[index]:offsets[index + 1]]))
+
+    def __eq__(self, other):
+        if not isinstance(other, PathData):
+            return NotImplemented
+        return (self.opcodes == other.opcodes and self.offsets == other.offsets
+                and self.coords == other.coords)
+
+    def __repr__(self):
+        return f"PathData({self.to_string()!r})"
+
+    def __str__(self):
+        return self.to_string()
+
+    def copy(self):
+        """버퍼를 복사한 새 PathData"""
+        return PathData(array('B', self.opcodes), array('I', self.offsets), array('d', self.coords))
+
+    @property
+    def nbytes(self):
+        """버퍼가 차지하는 바이트 수"""
+        return sum(len(buf) * buf.itemsize for buf in (self.opcodes, self.offsets, self.coords))
+
+    def to_string(self, precision=2, separator=' '):
+        """패스 문자열로 직렬화 (한 번에 join)"""
+        number = f'%.{precision}f'
+        coords = self.coords
+        offsets = self.offsets
+        parts = []
+        for index, opcode in enumerate(self.opcodes):
+            start, stop = offsets[index], offsets[index + 1]
+            if start == stop:
+                parts.append(chr(opcode))
+            elif opcode == _ARC_UPPER or opcode == _ARC_LOWER:
+                rx, ry, rotation, large_arc, sweep, x, y = coords[start:stop]
+                parts.append(f"{chr(opcode)} {number % rx} {number % ry} {number % rotation} "
+                             f"{int(large_arc)} {int(sweep)} {number % x} {number % y}")
+            else:
+                parts.append(chr(opcode) + ' ' + ' '.join([number % value for value in coords[start:stop]]))
+        return separator.join(parts)
+
+    def absolute(self):
+        """상대 좌표를 절대 좌표로 바꾼 PathData
+
+        S/T는 반사된 제어점을 계산하여 C/Q로 바꾸고, H/V와 호(A)는 그대로 둔다
+        (normalized와 달리 호를 근사하지 않으므로 모양이 정확히 유지됨).
+        """
+        result = PathData()
+        add = result.append
+        current_x = current_y = 0.0
+        start_x = start_y = 0.0
+        cubic_ctrl = quad_ctrl = None
+
+        for cmd, args in self:
+            upper = cmd.upper()
+            relative = cmd != upper
+            dx, dy = (current_x, current_y) if relative else (0.0, 0.0)
+            next_cubic = next_quad = None
+
+            if upper == 'M':
+                current_x, current_y = args[0] + dx, args[1] + dy
+                start_x, start_y = current_x, current_y
+                add('M', (current_x, current_y))
+            elif upper == 'L':
+                current_x, current_y = args[0] + dx, args[1] + dy
+                add('L', (current_x, current_y))
+            elif upper == 'H':
+                current_x = args[0] + dx
+                add('H', (current_x,))
+            elif upper == 'V':
+                current_y = args[0] + dy
+                add('V', (current_y,))
+            elif upper == 'C' or upper == 'S':
+                if upper == 'C':
+                    x1, y1 = args[0] + dx, args[1] + dy
+                    args = args[2:]
+                elif cubic_ctrl is not None:
+                    x1, y1 = 2 * current_x - cubic_ctrl[0], 2 * current_y - cubic_ctrl[1]
+                else:
+                    x1, y1 = current_x, current_y
+                x2, y2 = args[0] + dx, args[1] + dy
+                current_x, current_y = args[2] + dx, args[3] + dy
+                add('C', (x1, y1, x2, y2, current_x, current_y))
+                next_cubic = (x2, y2)
+            elif upper == 'Q' or upper == 'T':
+                if upper == 'Q':
+                    x1, y1 = args[0] + dx, args[1] + dy
+                    args = args[2:]
+                elif quad_ctrl is not None:
+                    x1, y1 = 2 * current_x - quad_ctrl[0], 2 * current_y - quad_ctrl[1]
+                else:
+                    x1, y1 = current_x, current_y
+                current_x, current_y = args[0] + dx, args[1] + dy
+                add('Q', (x1, y1, current_x, current_y))
+                next_quad = (x1, y1)
+            elif upper == 'A':
+                current_x, current_y = args[5] + dx, args[6] + dy
+                add('A', args[:5] + (current_x, current_y))
+            else:  # Z
+                current_x, current_y = start_x, start_y
+                add('Z')
+
+            cubic_ctrl, quad_ctrl = next_cubic, next_quad
+
+        return result
+
+    def normalized(self):
+        """절대 좌표 M/L/C/Q/Z 명령어만 사용하는 PathData로 변환
+
+        H/V는 L로, S/T는 반사된 제어점을 계산하여 C/Q로, 호(A)는 3차 베지어로 바꾼다.
+        결과의 좌표 버퍼는 항상 (x, y) 쌍으로만 이루어진다.
+        """
+        result = PathData()
+        add = result.append
+        current_x = current_y = 0.0
+        start_x = start_y = 0.0
+        # S/T 반사용 마지막 제어점
+        cubic_ctrl = quad_ctrl = None
+
+        for cmd, args in self:
+            upper = cmd.upper()
+            relative = cmd != upper
+            dx, dy = (current_x, current_y) if relative else (0.0, 0.0)
+            next_cubic = next_quad = None
+
+            if upper == 'M':
+                current_x, current_y = args[0] + dx, args[1] + dy
+                start_x, start_y = current_x, current_y
+                add('M', (current_x, current_y))
+            elif upper == 'L':
+                current_x, current_y = args[0] + dx, args[1] + dy
+                add('L', (current_x, current_y))
+            elif upper == 'H':
+                current_x = args[0] + dx
+                add('L', (current_x, current_y))
+            elif upper == 'V':
+                current_y = args[0] + (current_y if relative else 0.0)
+                add('L', (current_x, current_y))
+            elif upper == 'C':
+                x1, y1 = args[0] + dx, args[1] + dy
+                x2, y2 = args[2] + dx, args[3] + dy
+                current_x, current_y = args[4] + dx, args[5] + dy
+                add('C', (x1, y1, x2, y2, current_x, current_y))
+                next_cubic = (x2, y2)
+            elif upper == 'S':
+                if cubic_ctrl is not None:
+                    x1, y1 = 2 * current_x - cubic_ctrl[0], 2 * current_y - cubic_ctrl[1]
+                else:
+                    x1, y1 = current_x, current_y
+                x2, y2 = args[0] + dx, args[1] + dy
+                current_x, current_y = args[2] + dx, args[3] + dy
+                add('C', (x1, y1, x2, y2, current_x, current_y))
+                next_cubic = (x2, y2)
+            elif upper == 'Q':
+                x1, y1 = args[0] + dx, args[1] + dy
+                current_x, current_y = args[2] + dx, args[3] + dy
+                add('Q', (x1, y1, current_x, current_y))
+                next_quad = (x1, y1)
+            elif upper == 'T':
+                if quad_ctrl is not None:
+                    x1, y1 = 2 * current_x - quad_ctrl[0], 2 * current_y - quad_ctrl[1]
+                else:
+                    x1, y1 = current_x, current_y
+                current_x, current_y = args[0] + dx, args[1] + dy
+                add('Q', (x1, y1, current_x, current_y))
+                next_quad = (x1, y1)
+            elif upper == 'A':
+                end_x, end_y = args[5] + dx, args[6] + dy
+                for segment in arc_to_cubics(current_x, current_y, args[0], args[1], args[2],
+                                             args[3], args[4], end_x, end_y):
+                    add(segment[0], segment[1])
+                current_x, current_y = end_x, end_y
+            else:  # Z
+                current_x, current_y = start_x, start_y
+                add('Z')
+
+            cubic_ctrl, quad_ctrl = next_cubic, next_quad
+
+        return result
+
+
+def arc_to_cubics(x1, y1, rx, ry, rotation, large_arc, sweep, x2, y2):
+    """호(A)를 3차 베지어 명령어 목록으로 변환 (SVG 구현 노트 F.6.5)"""
+    if x1 == x2 and y1 == y2:
+        return []
+    rx, ry = abs(rx), abs(ry)
+    if rx == 0 or ry == 0:
+        return [('L', (x2, y2))]
+
+    phi = math.radians(rotation % 360)
+    cos_phi, sin_phi = math.cos(phi), math.sin(phi)
+
+    # 중심 좌표계로 변환
+    half_dx, half_dy = (x1 - x2) / 2, (y1 - y2) / 2
+    x1p = cos_phi * half_dx + sin_phi * half_dy
+    y1p = -sin_phi * half_dx + cos_phi * half_dy
+
+    # 반지름이 부족하면 확대
+    radius_check = (x1p * x1p) / (rx * rx) + (y1p * y1p) / (ry * ry)
+    if radius_check > 1:
+        scale = math.sqrt(radius_check)
+        rx, ry = rx * scale, ry * scale
+
+    numerator = rx * rx * ry * ry - rx * rx * y1p * y1p - ry * ry * x1p * x1p
+    denominator = rx * rx * y1p * y1p + ry * ry * x1p * x1p
+    coef = math.sqrt(max(0.0, numerator / denominator))
+    if bool(large_arc) == bool(sweep):
+        coef = -coef
+    cxp = coef * rx * y1p / ry
+    cyp = -coef * ry * x1p / rx
+    center_x = cos_phi * cxp - sin_phi * cyp + (x1 + x2) / 2
+    center_y = sin_phi * cxp + cos_phi * cyp + (y1 + y2) / 2
+
+    start_angle = math.atan2((y1p - cyp) / ry, (x1p - cxp) / rx)
+    end_angle = math.atan2((-y1p - cyp) / ry, (-x1p - cxp) / rx)
+    delta = end_angle - start_angle
+    if sweep and delta < 0:
+        delta += 2 * math.pi
+    elif not sweep and delta > 0:
+        delta -= 2 * math.pi
+
+    # 90도 이하 조각으로 나누어 근사
+    segment_count = max(1, math.ceil(abs(delta) / (math.pi / 2) - 1e-9))
+    step = delta / segment_count
+    k = 4 / 3 * math.tan(step / 4)
+
+    def point(angle):
+        ex, ey = rx * math.cos(angle), ry * math.sin(angle)
+        return (center_x + cos_phi * ex - sin_phi * ey, center_y + sin_phi * ex + cos_phi * ey)
+
+    def derivative(angle):
+        ex, ey = -rx * math.sin(angle), ry * math.cos(angle)
+        return (cos_phi * ex - sin_phi * ey, sin_phi * ex + cos_phi * ey)
+
+    segments = []
+    angle = start_angle
+    px, py = x1, y1
+    for index in range(segment_count):
+        next_angle = angle + step
+        d1x, d1y = derivative(angle)
+        d2x, d2y = derivative(next_angle)
+        if index == segment_count - 1:
+            ex, ey = x2, y2
+        else:
+            ex, ey = point(next_angle)
+        segments.append(('C', (px + k * d1x, py + k * d1y, ex - k * d2x, ey - k * d2y, ex, ey)))
+        px, py = ex, ey
+        angle = next_angle
+    return segments
+
+
+def as_path_data(path):
+    """문자열 또는 PathData를 PathData로 변환"""
+    if isinstance(path, PathData):
+        return path
+    return PathData.from_string(path)
+
+
+def _scan_path(path_data, opcodes, offsets, coords):
+    """패스 문자열을 한 번 훑으면서 명령어 코드와 좌표를 버퍼에 추가"""
+    number_match = _NUMBER_RE.match
+    separator_match = _SEPARATOR_RE.match
+    param_counts = PARAM_COUNTS
+    add_opcode = opcodes.append
+    add_offset = offsets.append
+    add_coord = coords.append
+
+    pos = separator_match(path_data, 0).end()
+    end = len(path_data)
+    cmd = None
+
+    while pos < end:
+        char = path_data[pos]
+        if char in param_counts:
+            cmd = char
+            pos = separator_match(path_data, pos + 1).end()
+            if cmd in 'Zz':
+                add_opcode(ord(cmd))
+                add_offset(len(coords))
+                continue
+        elif cmd is None or cmd in 'Zz':
+            raise ValueError(f"잘못된 패스 데이터 (위치 {pos}): {path_data[pos:pos + 20]!r}")
+
+        count = param_counts[cmd]
+        is_arc = cmd in 'Aa'
+        for index in range(count):
+            if is_arc and (index == 3 or index == 4):
+                # 호의 플래그는 "0"/"1" 한 글자 (구분자 없이 붙어 있을 수 있음)
+                flag = path_data[pos:pos + 1]
+                if flag not in ('0', '1'):
+                    raise ValueError(f"잘못된 호 플래그 (위치 {pos}): {path_data[pos:pos + 20]!r}")
+                add_coord(1.0 if flag == '1' else 0.0)
+                pos += 1
+            else:
+                match = number_match(path_data, pos)
+                if match is None:
+                    raise ValueError(f"숫자가 필요합니다 (위치 {pos}): {path_data[pos:pos + 20]!r}")
+                add_coord(float(match.group()))
+                pos = match.end()
+            pos = separator_match(path_data, pos).end()
+
+        add_opcode(ord(cmd))
+        add_offset(len(coords))
+
+        # 같은 명령어의 파라미터가 반복되면 암시적으로 명령어 반복
+        cmd = _IMPLICIT_COMMANDS.get(cmd, cmd)
+
+
+def iter_path_commands(path_data):
+    """패스 문자열을 PathCommand 순서대로 반환"""
+    return iter(as_path_data(path_data))
+
+
+def parse_path(path_data):
+    """패스 문자열을 PathCommand 리스트로 변환"""
+    return list(as_path_data(path_data))
@@ -0,0 +1,597 @@
+#!/usr/bin/env python3
+"""
+SVG 내장 래스터라이저 (외부 프로그램/라이브러리 없이 PNG 생성)
+- path, rect, circle, ellipse, line, polygon, polyline의 채우기 (단색)
+- 커버리지 누적 스캔라인: 선분마다 픽셀별 면적 기여를 누적한 뒤 행마다 누적합
+- nonzero / evenodd 채우기 규칙, 안티에일리어싱
+- NumPy가 있으면 선분 전체를 한 번에 벡터 연산, 없으면 순수 Python으로 처리
+- PNG는 zlib으로 직접 인코딩
+- 외곽선(stroke), 텍스트, 이미지, 클리핑/마스크는 그리지 않음 (그라디언트는 평균색)
+"""
+
+import math
+import re
+import struct
+import zlib
+from array import array
+
+from svg_document import (CONTAINER_TAGS, SHAPE_TAGS, SVGDocument, local_name, parse_length,
+                          parse_viewbox, shape_to_path)
+from svg_path import as_path_data
+from svg_transform import compose, multiply, parse_transform, scale, transform_coords, translate
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 순수 Python으로 처리
+    np = None
+
+RASTERIZER_VERSION = '1'
+
+# 곡선을 선분으로 나눌 때 허용 오차 (픽셀)
+FLATTEN_TOLERANCE = 0.2
+
+XLINK_HREF = '{http://www.w3.org/1999/xlink}href'
+
+NAMED_COLORS = {
+    'black': (0, 0, 0), 'white': (255, 255, 255), 'red': (255, 0, 0), 'lime': (0, 255, 0),
+    'green': (0, 128, 0), 'blue': (0, 0, 255), 'yellow': (255, 255, 0), 'cyan': (0, 255, 255),
+    'aqua': (0, 255, 255), 'magenta': (255, 0, 255), 'fuchsia': (255, 0, 255),
+    'gray': (128, 128, 128), 'grey': (128, 128, 128), 'silver': (192, 192, 192),
+    'maroon': (128, 0, 0), 'olive': (128, 128, 0), 'navy': (0, 0, 128), 'purple': (128, 0, 128),
+    'teal': (0, 128, 128), 'orange': (255, 165, 0),
+}
+
+# 부모에서 물려받는 표현 속성
+INHERITED_PROPERTIES = ('fill', 'fill-rule', 'fill-opacity', 'color', 'visibility')
+
+_COLOR_FUNCTION_RE = re.compile(r'rgba?\(\s*([^)]*)\)')
+_URL_RE = re.compile(r'url\(\s*[\'"]?#([^)\'"\s]+)[\'"]?\s*\)\s*(.*)')
+
+
+def _unit(value):
+    """색 성분/불투명도 문자열을 0~1 실수로 변환 (% 지원)"""
+    value = value.strip()
+    if value.endswith('%'):
+        return min(max(float(value[:-1]) / 100, 0.0), 1.0)
+    return min(max(float(value), 0.0), 1.0)
+
+
+def parse_color(value, current_color=None):
+    """색 문자열을 (r, g, b, a) 0~1 실수로 변환, none이거나 해석할 수 없으면 None"""
+    value = value.strip().lower()
+    if value in ('', 'none', 'transparent'):
+        return None
+    if value == 'currentcolor':
+        return current_color
+    try:
+        if value.startswith('#'):
+            digits = value[1:]
+            if len(digits) in (3, 4):
+                digits = ''.join(char * 2 for char in digits)
+            if len(digits) not in (6, 8):
+                return None
+            channels = [int(digits[i:i + 2], 16) / 255 for i in range(0, len(digits), 2)]
+            return tuple(channels) if len(channels) == 4 else tuple(channels) + (1.0,)
+        match = _COLOR_FUNCTION_RE.match(value)
+        if match:
+            parts = [part for part in re.split(r'[\s,/]+', match.group(1)) if part]
+            if len(parts) < 3:
+                return None
+            rgb = tuple(_unit(part) if part.endswith('%') else _unit(str(float(part) / 255))
+                        for part in parts[:3])
+            return rgb + (_unit(parts[3]) if len(parts) > 3 else 1.0,)
+    except ValueError:
+        return None
+    rgb = NAMED_COLORS.get(value)
+    return None if rgb is None else tuple(channel / 255 for channel in rgb) + (1.0,)
+
+
+def _declarations(attrib):
+    """표현 속성과 style 속성을 합친 dict (style이 우선)"""
+    declarations = dict(attrib)
+    for declaration in attrib.get('style', '').split(';'):
+        name, separator, value = declaration.partition(':')
+        if separator:
+            declarations[name.strip()] = value.replace('!important', '').strip()
+    return declarations
+
+
+def element_style(attrib, parent_style):
+    """부모 스타일을 물려받은 요소의 계산된 스타일
+
+    opacity는 물려받지 않지만 그룹 불투명도를 근사하기 위해 '_opacity'에 누적한다.
+    """
+    declarations = _declarations(attrib)
+    style = {name: parent_style[name] for name in INHERITED_PROPERTIES if name in parent_style}
+    for name in INHERITED_PROPERTIES + ('display',):
+        value = declarations.get(name)
+        if value is not None and value != 'inherit':
+            style[name] = value
+    opacity = parent_style.get('_opacity', 1.0)
+    try:
+        opacity *= _unit(declarations.get('opacity', '1'))
+    except ValueError:
+        pass
+    style['_opacity'] = opacity
+    return style
+
+
+def gradient_colors(root):
+    """그라디언트 id -> 정지점 평균색 (단색 채우기로 근사)"""
+    gradients = {element.get('id'): element for element in root.iter()
+                 if local_name(element.tag) in ('linearGradient', 'radialGradient')
+                 and element.get('id')}
+    colors = {}
+    for gradient_id, gradient in gradients.items():
+        # 정지점이 없으면 href로 연결된 그라디언트에서 찾음
+        stops = []
+        seen = set()
+        element = gradient
+        while element is not None and not stops and id(element) not in seen:
+            seen.add(id(element))
+            stops = [child for child in element if local_name(child.tag) == 'stop']
+            href = element.get('href') or element.get(XLINK_HREF) or ''
+            element = gradients.get(href[1:]) if href.startswith('#') else None
+
+        parsed = []
+        for stop in stops:
+            declarations = _declarations(stop.attrib)
+            color = parse_color(declarations.get('stop-color', 'black'))
+            if color is None:
+                continue
+            try:
+                alpha = color[3] * _unit(declarations.get('stop-opacity', '1'))
+            except ValueError:
+                alpha = color[3]
+            parsed.append(color[:3] + (alpha,))
+        if not parsed:
+            continue
+        total_alpha = sum(color[3] for color in parsed)
+        if total_alpha > 0:
+            rgb = tuple(sum(color[i] * color[3] for color in parsed) / total_alpha for i in range(3))
+        else:
+            rgb = (0.0, 0.0, 0.0)
+        colors[gradient_id] = rgb + (total_alpha / len(parsed),)
+    return colors
+
+
+def fill_color(style, paint_servers):
+    """스타일의 채우기 색 (r, g, b, a), 채우지 않으면 None"""
+    current_color = parse_color(style.get('color', 'black'))
+    value = style.get('fill', 'black')
+    match = _URL_RE.match(value)
+    if match:
+        color = paint_servers.get(match.group(1))
+        if color is None and match.group(2):
+            color = parse_color(match.group(2), current_color)
+    else:
+        color = parse_color(value, current_color)
+    if color is None:
+        return None
+    try:
+        fill_opacity = _unit(style.get('fill-opacity', '1'))
+    except ValueError:
+        fill_opacity = 1.0
+    alpha = color[3] * fill_opacity * style.get('_opacity', 1.0)
+    return color[:3] + (alpha,) if alpha > 0 else None
+
+
+def viewport_matrix(viewbox, width, height, preserve_aspect_ratio=None):
+    """viewBox 좌표를 (width x height) 픽셀 좌표로 옮기는 행렬 (preserveAspectRatio 지원)"""
+    vx, vy, vw, vh = viewbox
+    sx, sy = width / vw, height / vh
+    parts = (preserve_aspect_ratio or '').split()
+    if parts and parts[0] == 'defer':
+        parts = parts[1:]
+    align = parts[0] if parts else 'xMidYMid'
+    tx = ty = 0.0
+    if align != 'none':
+        sx = sy = max(sx, sy) if 'slice' in parts[1:] else min(sx, sy)
+        free_x, free_y = width - vw * sx, height - vh * sy
+        tx = {'xMin': 0.0, 'xMax': free_x}.get(align[:4], free_x / 2)
+        ty = {'YMin': 0.0, 'YMax': free_y}.get(align[4:], free_y / 2)
+    return compose(translate(tx, ty), scale(sx, sy), translate(-vx, -vy))
+
+
+def _flatten_cubic(points, x0, y0, x1, y1, x2, y2, x3, y3, tolerance):
+    # Wang 공식: 오차가 tolerance 이하가 되는 균등 분할 수
+    ddx = max(abs(x0 - 2 * x1 + x2), abs(x1 - 2 * x2 + x3))
+    ddy = max(abs(y0 - 2 * y1 + y2), abs(y1 - 2 * y2 + y3))
+    count = max(1, math.ceil(math.sqrt(0.75 * math.hypot(ddx, ddy) / tolerance)))
+    for i in range(1, count + 1):
+        t = i / count
+        mt = 1 - t
+        a, b, c, d = mt * mt * mt, 3 * mt * mt * t, 3 * mt * t * t, t * t * t
+        points.append(a * x0 + b * x1 + c * x2 + d * x3)
+        points.append(a * y0 + b * y1 + c * y2 + d * y3)
+
+
+def _flatten_quadratic(points, x0, y0, x1, y1, x2, y2, tolerance):
+    dd = math.hypot(x0 - 2 * x1 + x2, y0 - 2 * y1 + y2)
+    count = max(1, math.ceil(math.sqrt(0.25 * dd / tolerance)))
+    for i in range(1, count + 1):
+        t = i / count
+        mt = 1 - t
+        a, b, c = mt * mt, 2 * mt * t, t * t
+        points.append(a * x0 + b * x1 + c * x2)
+        points.append(a * y0 + b * y1 + c * y2)
+
+
+def flatten_path(path, tolerance=FLATTEN_TOLERANCE):
+    """정규화된 PathData를 하위 패스별 꼭짓점 버퍼 array('d') 목록으로 변환
+
+    채우기용이므로 각 하위 패스는 닫힌 다각형으로 취급한다.
+    """
+    polygons = []
+    points = array('d', (0.0, 0.0))
+    start_x = start_y = 0.0
+    for cmd, args in path:
+        x, y = points[-2], points[-1]
+        if cmd == 'M':
+            if len(points) >= 6:
+                polygons.append(points)
+            points = array('d', args)
+            start_x, start_y = args
+        elif cmd == 'L':
+            points.extend(args)
+        elif cmd == 'C':
+            _flatten_cubic(points, x, y, *args, tolerance)
+        elif cmd == 'Q':
+            _flatten_quadratic(points, x, y, *args, tolerance)
+        elif cmd == 'Z':
+            if len(points) >= 6:
+                polygons.append(points)
+            points = array('d', (start_x, start_y))
+    if len(points) >= 6:
+        polygons.append(points)
+    return polygons
+
+
+def _clip_edge_x(x0, y0, x1, y1, width, out):
+    """x가 [0, width] 밖으로 나가는 선분을 경계에서 나누고 바깥 부분은 경계선으로 투영
+
+    커버리지 누적에서는 왼쪽 바깥 부분을 x=0의 세로선으로 옮겨도 결과가 같다.
+    """
+    cuts = []
+    for bound in (0.0, width):
+        if (x0 - bound) * (x1 - bound) < 0:
+            cuts.append((bound - x0) / (x1 - x0))
+    cuts.sort()
+    previous_x, previous_y = x0, y0
+    for t in cuts + [1.0]:
+        if t < 1.0:
+            next_x, next_y = x0 + (x1 - x0) * t, y0 + (y1 - y0) * t
+        else:
+            next_x, next_y = x1, y1
+        out.extend((min(max(previous_x, 0.0), width), previous_y,
+                    min(max(next_x, 0.0), width), next_y))
+        previous_x, previous_y = next_x, next_y
+
+
+def polygon_edges(polygons, width):
+    """다각형 목록을 x 범위로 자른 선분 버퍼 (x0 y0 x1 y1 반복)로 변환"""
+    edges = array('d')
+    for points in polygons:
+        count = len(points) // 2
+        for i in range(count):
+            x0, y0 = points[2 * i], points[2 * i + 1]
+            j = (i + 1) % count
+            x1, y1 = points[2 * j], points[2 * j + 1]
+            if y0 == y1:
+                continue  # 수평 선분은 면적 기여가 없음
+            if 0.0 <= x0 <= width and 0.0 <= x1 <= width:
+                edges.extend((x0, y0, x1, y1))
+            else:
+                _clip_edge_x(x0, y0, x1, y1, width, edges)
+    return edges
+
+
+def _accumulate_numpy(edges, width, row_start, row_end):
+    """선분 전체의 픽셀 면적 기여를 (행 수, width + 2) 버퍼에 한 번에 누적"""
+    x0, y0, x1, y1 = np.frombuffer(edges, dtype=np.float64).reshape(-1, 4).T
+    stride = width + 2
+    rows_total = row_end - row_start
+
+    # 위에서 아래로 향하도록 정렬하고 방향(+1/-1) 기록
+    downward = y0 < y1
+    direction = np.where(downward, 1.0, -1.0)
+    top_x, top_y = np.where(downward, x0, x1), np.minimum(y0, y1)
+    bottom_x, bottom_y = np.where(downward, x1, x0), np.maximum(y0, y1)
+    dxdy = (bottom_x - top_x) / (bottom_y - top_y)
+
+    # 선분이 지나는 행마다 조각 하나씩 만들기
+    first = np.clip(np.floor(top_y), row_start, row_end).astype(np.intp)
+    last = np.clip(np.ceil(bottom_y), row_start, row_end).astype(np.intp)
+    counts = last - first
+    edge = np.repeat(np.arange(len(counts)), counts)
+    row = first[edge] + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+    ya = np.maximum(row, top_y[edge])
+    yb = np.minimum(row + 1, bottom_y[edge])
+    # 부동소수점 오차로 x 범위를 벗어나지 않도록 제한
+    xa = np.clip(top_x[edge] + (ya - top_y[edge]) * dxdy[edge], 0.0, width)
+    xb = np.clip(top_x[edge] + (yb - top_y[edge]) * dxdy[edge], 0.0, width)
+    d = (yb - ya) * direction[edge]
+    base = (row - row_start) * stride
+
+    lo, hi = np.minimum(xa, xb), np.maximum(xa, xb)
+    lo_floor = np.floor(lo)
+    lo_i = lo_floor.astype(np.intp)
+    hi_ceil = np.ceil(hi)
+    hi_i = hi_ceil.astype(np.intp)
+    single = hi_i <= lo_i + 1
+
+    indices = []
+    weights = []
+
+    # 한 칸 안에 들어가는 조각: 가운데 x 기준으로 두 칸에 나눔
+    s_base, s_lo, s_d = base[single] + lo_i[single], lo_floor[single], d[single]
+    xmf = 0.5 * (xa[single] + xb[single]) - s_lo
+    indices += [s_base, s_base + 1]
+    weights += [s_d * (1 - xmf), s_d * xmf]
+
+    # 여러 칸에 걸친 조각: 양 끝 삼각형 + 가운데 균일 기여
+    multi = ~single
+    m_base, m_d = base[multi] + lo_i[multi], d[multi]
+    m_lo, m_hi = lo[multi], hi[multi]
+    span = hi_i[multi] - lo_i[multi]
+    s = 1 / (m_hi - m_lo)
+    x0f = m_lo - lo_floor[multi]
+    x1f = m_hi - hi_ceil[multi] + 1
+    a0 = 0.5 * s * (1 - x0f) ** 2
+    am = 0.5 * s * x1f * x1f
+    a1 = s * (1.5 - x0f)
+    a2 = a1 + (span - 3) * s
+    two = span == 2
+    indices += [m_base, m_base + 1, m_base + span]
+    weights += [m_d * a0, m_d * np.where(two, 1 - a0 - am, a1 - a0), m_d * am]
+    wide = ~two
+    indices.append(m_base[wide] + span[wide] - 1)
+    weights.append(m_d[wide] * (1 - a2[wide] - am[wide]))
+
+    size = rows_total * stride
+    accumulation = np.bincount(np.concatenate(indices), np.concatenate(weights), minlength=size)
+
+    # 가운데 칸들은 같은 값을 더하므로 차분 버퍼에 기록한 뒤 누적합
+    middle = np.bincount(np.concatenate([m_base[wide] + 2, m_base[wide] + span[wide] - 1]),
+                         np.concatenate([m_d[wide] * s[wide], -m_d[wide] * s[wide]]),
+                         minlength=size)
+    accumulation = accumulation[:size].reshape(rows_total, stride)
+    accumulation += np.cumsum(middle[:size].reshape(rows_total, stride), axis=1)
+    return accumulation
+
+
+def _accumulate_python(edges, width, row_start, row_end):
+    """선분마다 픽셀 면적 기여를 누적 (순수 Python)"""
+    stride = width + 2
+    rows = [array('d', bytes(8 * stride)) for _ in range(row_end - row_start)]
+    for index in range(0, len(edges), 4):
+        x0, y0, x1, y1 = edges[index:index + 4]
+        if y0 < y1:
+            direction = 1.0
+        else:
+            direction = -1.0
+            x0, y0, x1, y1 = x1, y1, x0, y0
+        dxdy = (x1 - x0) / (y1 - y0)
+        first = min(max(math.floor(y0), row_start), row_end)
+        last = min(max(math.ceil(y1), row_start), row_end)
+        for row in range(first, last):
+            ya = max(row, y0)
+            yb = min(row + 1, y1)
+            xa = min(max(x0 + (ya - y0) * dxdy, 0.0), width)
+            xb = min(max(x0 + (yb - y0) * dxdy, 0.0), width)
+            d = (yb - ya) * direction
+            line = rows[row - row_start]
+            lo, hi = (xa, xb) if xa < xb else (xb, xa)
+            lo_floor = math.floor(lo)
+            hi_ceil = math.ceil(hi)
+            if hi_ceil <= lo_floor + 1:
+                xmf = 0.5 * (xa + xb) - lo_floor
+                line[lo_floor] += d * (1 - xmf)
+                line[lo_floor + 1] += d * xmf
+                continue
+            s = 1 / (hi - lo)
+            x0f = lo - lo_floor
+            x1f = hi - hi_ceil + 1
+            a0 = 0.5 * s * (1 - x0f) ** 2
+            am = 0.5 * s * x1f * x1f
+            line[lo_floor] += d * a0
+            if hi_ceil == lo_floor + 2:
+                line[lo_floor + 1] += d * (1 - a0 - am)
+            else:
+                a1 = s * (1.5 - x0f)
+                line[lo_floor + 1] += d * (a1 - a0)
+                for column in range(lo_floor + 2, hi_ceil - 1):
+                    line[column] += d * s
+                a2 = a1 + (hi_ceil - lo_floor - 3) * s
+                line[hi_ceil - 1] += d * (1 - a2 - am)
+            line[hi_ceil] += d * am
+    return rows
+
+
+def _coverage(value, even_odd):
+    """누적된 감김 값을 0~1 커버리지로 변환"""
+    value = abs(value)
+    if even_odd:
+        value %= 2.0
+        return 1.0 - abs(1.0 - value)
+    return min(value, 1.0)
+
+
+class Canvas:
+    """RGBA 이미지 버퍼 (알파를 미리 곱한 0~1 실수)"""
+
+    def __init__(self, width, height, background=None):
+        self.width = int(width)
+        self.height = int(height)
+        if np is not None:
+            self.pixels = np.zeros((self.height, self.width, 4))
+        else:
+            self.pixels = array('d', bytes(8 * 4 * self.width * self.height))
+        if background is not None:
+            self.fill_rect(background)
+
+    def fill_rect(self, color):
+        """캔버스 전체를 색으로 덮기"""
+        r, g, b, a = color
+        self.fill([array('d', (0, 0, self.width, 0, self.width, self.height, 0, self.height))],
+                  (r, g, b, a))
+
+    def fill(self, polygons, color, fill_rule='nonzero'):
+        """픽셀 좌표 다각형 목록을 색으로 채우기 (source-over 합성)"""
+        edges = polygon_edges(polygons, self.width)
+        if not edges:
+            return
+        ys = edges[1::2]
+        row_start = max(0, math.floor(min(ys)))
+        row_end = min(self.height, math.ceil(max(ys)))
+        if row_start >= row_end:
+            return
+        even_odd = fill_rule == 'evenodd'
+        if np is not None:
+            self._fill_numpy(edges, color, even_odd, row_start, row_end)
+        else:
+            self._fill_python(edges, color, even_odd, row_start, row_end)
+
+    def _fill_numpy(self, edges, color, even_odd, row_start, row_end):
+        accumulation = _accumulate_numpy(edges, self.width, row_start, row_end)
+        winding = np.abs(np.cumsum(accumulation, axis=1)[:, :self.width])
+        if even_odd:
+            winding %= 2.0
+            coverage = 1.0 - np.abs(1.0 - winding)
+        else:
+            coverage = np.minimum(winding, 1.0)
+
+        alpha = coverage * color[3]
+        source = alpha[..., None] * np.array(color[:3] + (1.0,))
+        region = self.pixels[row_start:row_end]
+        region *= 1.0 - alpha[..., None]
+        region += source
+
+    def _fill_python(self, edges, color, even_odd, row_start, row_end):
+        red, green, blue, opacity = color
+        pixels = self.pixels
+        for offset, line in enumerate(_accumulate_python(edges, self.width, row_start, row_end)):
+            index = (row_start + offset) * self.width * 4
+            winding = 0.0
+            for column in range(self.width):
+                winding += line[column]
+                if abs(winding) > 1e-9:
+                    alpha = _coverage(winding, even_odd) * opacity
+                    keep = 1.0 - alpha
+                    position = index + column * 4
+                    pixels[position] = pixels[position] * keep + red * alpha
+                    pixels[position + 1] = pixels[position + 1] * keep + green * alpha
+                    pixels[position + 2] = pixels[position + 2] * keep + blue * alpha
+                    pixels[position + 3] = pixels[position + 3] * keep + alpha
+
+    def to_rgba_bytes(self):
+        """알파를 미리 곱하지 않은 8비트 RGBA 바이트 (행 순서)"""
+        if np is not None:
+            alpha = self.pixels[..., 3:4]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rgb = np.where(alpha > 0, self.pixels[..., :3] / alpha, 0.0)
+            straight = np.concatenate([rgb, alpha], axis=2)
+            return np.clip(np.rint(straight * 255), 0, 255).astype(np.uint8).tobytes()
+
+        result = bytearray(4 * self.width * self.height)
+        pixels = self.pixels
+        for position in range(0, len(pixels), 4):
+            alpha = pixels[position + 3]
+            if alpha <= 0:
+                continue
+            for channel in range(3):
+                result[position + channel] = min(255, max(0, round(pixels[position + channel] / alpha * 255)))
+            result[position + 3] = min(255, round(alpha * 255))
+        return bytes(result)
+
+    def to_png(self, level=6):
+        """PNG 파일 바이트 (8비트 RGBA, zlib 압축)"""
+        data = self.to_rgba_bytes()
+        row_size = 4 * self.width
+        # 각 행 앞에 필터 종류(0 = 없음) 바이트 추가
+        raw = b''.join(b'\x00' + data[offset:offset + row_size]
+                       for offset in range(0, len(data), row_size))
+
+        def chunk(kind, body):
+            return (struct.pack('>I', len(body)) + kind + body
+                    + struct.pack('>I', zlib.crc32(kind + body) & 0xffffffff))
+
+        header = struct.pack('>IIBBBBB', self.width, self.height, 8, 6, 0, 0, 0)
+        return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header)
+                + chunk(b'IDAT', zlib.compress(raw, level)) + chunk(b'IEND', b''))
+
+    def save_png(self, png_path):
+        with open(png_path, 'wb') as f:
+            f.write(self.to_png())
+
+
+def document_size(document):
+    """문서의 기본 출력 크기 (width/height 속성, 없으면 viewBox, 그것도 없으면 300x150)"""
+    root = document.root
+    viewbox = parse_viewbox(root.attrib)
+    sizes = []
+    for name, index, default in (('width', 2, 300.0), ('height', 3, 150.0)):
+        value = root.get(name)
+        if value and not value.endswith('%'):
+            sizes.append(parse_length(value))
+        elif viewbox:
+            sizes.append(viewbox[index])
+        else:
+            sizes.append(default)
+    return tuple(sizes)
+
+
+def render_document(document, width=None, height=None, background=None):
+    """SVGDocument를 Canvas로 렌더링 (width/height 중 빠진 값은 문서 비율로 계산)"""
+    doc_width, doc_height = document_size(document)
+    if width and not height:
+        height = width * doc_height / doc_width
+    elif height and not width:
+        width = height * doc_width / doc_height
+    elif not width and not height:
+        width, height = doc_width, doc_height
+    width, height = max(1, round(width)), max(1, round(height))
+
+    root = document.root
+    viewbox = parse_viewbox(root.attrib) or (0.0, 0.0, doc_width, doc_height)
+    canvas = Canvas(width, height, background)
+    paint_servers = gradient_colors(root)
+    base = viewport_matrix(viewbox, width, height, root.get('preserveAspectRatio'))
+
+    stack = [(root, base, {})]
+    while stack:
+        element, ctm, parent_style = stack.pop()
+        tag = local_name(element.tag)
+        style = element_style(element.attrib, parent_style)
+        if style.get('display') == 'none':
+            continue
+        if element.get('transform'):
+            ctm = multiply(ctm, parse_transform(element.get('transform')))
+
+        if tag in SHAPE_TAGS:
+            if style.get('visibility', 'visible') != 'visible':
+                continue
+            color = fill_color(style, paint_servers)
+            path_d = shape_to_path(tag, element.attrib, viewbox)
+            if color is None or not path_d:
+                continue
+            path = as_path_data(path_d).normalized()
+            path.coords = transform_coords(path.coords, ctm)
+            canvas.fill(flatten_path(path), color, style.get('fill-rule', 'nonzero'))
+        elif tag in CONTAINER_TAGS or element is root:
+            # 순서를 유지하기 위해 역순으로 쌓음
+            stack.extend((child, ctm, style) for child in reversed(element)
+                         if isinstance(child.tag, str))
+    return canvas
+
+
+def render_svg(source, width=None, height=None, background=None):
+    """SVG 파일(경로 또는 파일 객체)을 Canvas로 렌더링"""
+    return render_document(SVGDocument.load(source), width, height, background)
+
+
+def rasterize_to_png(svg_path, png_path, width=None, height=None, background=None):
+    """SVG 파일을 내장 래스터라이저로 PNG 파일로 저장"""
+    render_svg(svg_path, width, height, background).save_png(png_path)
+    return png_path
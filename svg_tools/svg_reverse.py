@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+SVG 패스 방향 뒤집기
+- 하위 패스(M ... Z)마다 따로 뒤집기
+- 상대 좌표와 S/T는 PathData.absolute로 절대 좌표 C/Q로 바꾸고, H/V/A는 그대로 뒤집기
+- 부호 있는 넓이로 방향을 판단하여 반시계방향 하위 패스만 뒤집을 수 있음
+- 문자열을 거치지 않고 PathData 버퍼끼리 처리 (reverse_paths로 여러 패스를 한 번에 처리)
+
+좌표계는 SVG 기준 (y축이 아래쪽): 부호 있는 넓이가 양수이면 화면에서 시계방향이다.
+"""
+
+import math
+from collections import namedtuple
+
+from svg_path import PathData, arc_to_cubics, as_path_data
+
+CLOCKWISE = 'clockwise'
+COUNTER_CLOCKWISE = 'counter-clockwise'
+
+# 3점 Gauss-Legendre 적분 (5차 다항식까지 정확 -> 3차 베지어의 넓이 적분이 정확함)
+_GAUSS_NODES = (0.5 - math.sqrt(0.15), 0.5, 0.5 + math.sqrt(0.15))
+_GAUSS_WEIGHTS = (5 / 18, 8 / 18, 5 / 18)
+
+_M, _L, _H, _V, _C, _Q, _A, _Z = (ord(cmd) for cmd in 'MLHVCQAZ')
+
+Subpath = namedtuple('Subpath', ['start', 'stop', 'start_x', 'start_y', 'closed'])
+Subpath.__doc__ = """절대 좌표 PathData 안의 하위 패스 (명령어 범위 [start, stop), 시작점, Z로 닫혔는지)"""
+
+
+def iter_subpaths(path):
+    """절대 좌표 PathData(absolute 결과)의 하위 패스 범위를 순서대로 반환
+
+    Z 뒤에 M 없이 이어지는 명령은 직전 하위 패스의 시작점에서 시작하는 새 하위 패스로 본다.
+    """
+    opcodes = path.opcodes
+    coords = path.coords
+    offsets = path.offsets
+    start = None
+    start_x = start_y = 0.0
+    for index, opcode in enumerate(opcodes):
+        if opcode == _M:
+            if start is not None:
+                yield Subpath(start, index, start_x, start_y, False)
+            offset = offsets[index]
+            start_x, start_y = coords[offset], coords[offset + 1]
+            start = index
+        elif opcode == _Z:
+            if start is not None:
+                yield Subpath(start, index + 1, start_x, start_y, True)
+            start = None
+        elif start is None:
+            start = index
+    if start is not None:
+        yield Subpath(start, len(opcodes), start_x, start_y, False)
+
+
+def _curve_area(points):
+    """베지어 곡선(제어점 좌표 목록) 아래의 부호 있는 넓이 적분 1/2 * ∫(x dy - y dx)"""
+    count = len(points) // 2 - 1  # 차수
+    total = 0.0
+    for t, weight in zip(_GAUSS_NODES, _GAUSS_WEIGHTS):
+        s = 1 - t
+        if count == 3:
+            b = (s * s * s, 3 * s * s * t, 3 * s * t * t, t * t * t)
+            d = (-3 * s * s, 3 * s * s - 6 * s * t, 6 * s * t - 3 * t * t, 3 * t * t)
+        else:
+            b = (s * s, 2 * s * t, t * t)
+            d = (-2 * s, 2 * s - 2 * t, 2 * t)
+        x = y = dx = dy = 0.0
+        for i in range(count + 1):
+            px, py = points[2 * i], points[2 * i + 1]
+            x += b[i] * px
+            y += b[i] * py
+            dx += d[i] * px
+            dy += d[i] * py
+        total += weight * (x * dy - y * dx)
+    return total / 2
+
+
+def subpath_signed_area(path, subpath):
+    """하위 패스의 부호 있는 넓이 (닫히지 않았어도 시작점으로 닫아서 계산, 양수 = 시계방향)"""
+    opcodes = path.opcodes
+    coords = path.coords
+    offsets = path.offsets
+    x, y = subpath.start_x, subpath.start_y
+    area = 0.0
+    for index in range(subpath.start, subpath.stop):
+        opcode = opcodes[index]
+        args = coords[offsets[index]:offsets[index + 1]]
+        if opcode == _M or opcode == _Z:
+            continue
+        if opcode == _L:
+            nx, ny = args
+        elif opcode == _H:
+            nx, ny = args[0], y
+        elif opcode == _V:
+            nx, ny = x, args[0]
+        elif opcode == _C or opcode == _Q:
+            nx, ny = args[-2], args[-1]
+            area += _curve_area((x, y) + tuple(args))
+            x, y = nx, ny
+            continue
+        else:  # A: 3차 베지어로 근사하여 적분 (반지름이 0이면 직선)
+            nx, ny = args[5], args[6]
+            cx, cy = x, y
+            for cmd, segment in arc_to_cubics(x, y, *args[:5], nx, ny):
+                if cmd == 'L':
+                    ex, ey = segment
+                    area += (cx * ey - ex * cy) / 2
+                else:
+                    ex, ey = segment[4], segment[5]
+                    area += _curve_area((cx, cy) + tuple(segment))
+                cx, cy = ex, ey
+            x, y = nx, ny
+            continue
+        area += (x * ny - nx * y) / 2
+        x, y = nx, ny
+    # 시작점으로 닫는 선분
+    area += (x * subpath.start_y - subpath.start_x * y) / 2
+    return area
+
+
+def orientation(area):
+    """부호 있는 넓이의 방향 (넓이가 0이면 None)"""
+    if area > 0:
+        return CLOCKWISE
+    if area < 0:
+        return COUNTER_CLOCKWISE
+    return None
+
+
+def subpath_areas(path):
+    """패스의 하위 패스별 (Subpath, 부호 있는 넓이) 목록 (path는 문자열 또는 PathData)"""
+    path = as_path_data(path).absolute()
+    return path, [(subpath, subpath_signed_area(path, subpath)) for subpath in iter_subpaths(path)]
+
+
+def append_subpath(path, subpath, out):
+    """하위 패스를 그대로 out(PathData)에 추가 (M 없이 시작하면 시작점 M을 넣음)"""
+    if path.opcodes[subpath.start] != _M:
+        out.append('M', (subpath.start_x, subpath.start_y))
+    offsets = path.offsets
+    coords = path.coords
+    for index in range(subpath.start, subpath.stop):
+        out.append(chr(path.opcodes[index]), coords[offsets[index]:offsets[index + 1]])
+
+
+def append_reversed_subpath(path, subpath, out):
+    """하위 패스를 반대 방향으로 out(PathData)에 추가
+
+    닫힌 하위 패스는 시작점을 유지하고, 열린 하위 패스는 끝점에서 시작한다.
+    """
+    opcodes = path.opcodes
+    coords = path.coords
+    offsets = path.offsets
+
+    # 그리는 명령과 각 명령의 시작점
+    segments = []
+    x, y = subpath.start_x, subpath.start_y
+    for index in range(subpath.start, subpath.stop):
+        opcode = opcodes[index]
+        if opcode == _M or opcode == _Z:
+            continue
+        args = coords[offsets[index]:offsets[index + 1]]
+        segments.append((opcode, args, x, y))
+        if opcode == _H:
+            x = args[0]
+        elif opcode == _V:
+            y = args[0]
+        else:
+            x, y = args[-2], args[-1]
+
+    if subpath.closed:
+        out.append('M', (subpath.start_x, subpath.start_y))
+        if (x, y) != (subpath.start_x, subpath.start_y):
+            out.append('L', (x, y))  # Z가 그리던 닫는 선분
+        if segments and segments[0][0] in (_L, _H, _V):
+            del segments[0]  # 시작점으로 돌아오는 직선은 Z가 그림
+    else:
+        out.append('M', (x, y))
+
+    for opcode, args, prev_x, prev_y in reversed(segments):
+        if opcode == _L:
+            out.append('L', (prev_x, prev_y))
+        elif opcode == _H:
+            out.append('H', (prev_x,))
+        elif opcode == _V:
+            out.append('V', (prev_y,))
+        elif opcode == _C:
+            out.append('C', (args[2], args[3], args[0], args[1], prev_x, prev_y))
+        elif opcode == _Q:
+            out.append('Q', (args[0], args[1], prev_x, prev_y))
+        else:  # A: 같은 타원에서 회전 방향(sweep)만 반대
+            out.append('A', (args[0], args[1], args[2], args[3], 1.0 - args[4], prev_x, prev_y))
+
+    if subpath.closed:
+        out.append('Z')
+
+
+def reverse_path(path, only_counter_clockwise=False):
+    """패스의 하위 패스를 각각 뒤집은 절대 좌표 PathData (path는 문자열 또는 PathData)
+
+    only_counter_clockwise이면 반시계방향(부호 있는 넓이 < 0) 하위 패스만 뒤집는다.
+    """
+    path = as_path_data(path).absolute()
+    result = PathData()
+    for subpath in iter_subpaths(path):
+        if only_counter_clockwise and subpath_signed_area(path, subpath) >= 0:
+            append_subpath(path, subpath, result)
+        else:
+            append_reversed_subpath(path, subpath, result)
+    return result
+
+
+def reverse_paths(paths, only_counter_clockwise=True):
+    """여러 패스를 한 번에 뒤집기 (글리프 세트 등, 문자열 또는 PathData 목록 -> PathData 목록)"""
+    return [reverse_path(path, only_counter_clockwise) for path in paths]
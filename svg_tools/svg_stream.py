@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+대용량 SVG 스트리밍 처리 (iterparse 기반)
+- 요소를 하나씩 읽어 변환한 뒤 바로 출력 파일에 기록
+- 처리가 끝난 요소는 즉시 트리에서 제거하므로 파일 크기와 무관하게 메모리 사용량이 일정
+- 경계 상자/배경 판별 같은 기하 분석도 같은 방식으로 스트리밍
+- 변환 규칙은 svg_document의 DOM 처리와 동일 (transform_attributes 공유)
+"""
+
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+from xml.sax.saxutils import escape, quoteattr
+
+from svg_document import (CONTAINER_TAGS, MODE_KEEP, MODE_TRANSFORM, SHAPE_TAGS, format_viewbox,
+                          local_name, parse_viewbox, shape_geometry, transform_attributes)
+from svg_geometry import EMPTY_BOUNDS, is_background_bounds, union_bounds
+from svg_transform import IDENTITY, compose, multiply, parse_transform, scale, translate
+
+XML_NS = 'http://www.w3.org/XML/1998/namespace'
+
+StreamGeometry = namedtuple('StreamGeometry', ['bounds', 'background', 'canvas'])
+StreamGeometry.__doc__ = """심볼 경계 상자, 배경 요소 위치 집합, viewBox"""
+
+_WRITE_EVENTS = ('start', 'end', 'start-ns', 'comment', 'pi')
+
+
+def _iterparse(input_file, events, keep_comments=False):
+    """iterparse 반복자 (keep_comments=True이면 주석/처리 명령도 이벤트로 받음)"""
+    if keep_comments:
+        parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True, insert_pis=True))
+        return ET.iterparse(input_file, events=events, parser=parser)
+    return ET.iterparse(input_file, events=events)
+
+
+def read_root_attributes(input_file):
+    """루트 svg 요소의 속성만 읽고 중단"""
+    for _, element in _iterparse(input_file, ('start',)):
+        return dict(element.attrib)
+    return {}
+
+
+def iter_stream_shapes(input_file):
+    """(위치, 태그, 속성, 누적 변환 행렬, viewBox) 순서로 도형을 하나씩 반환
+
+    위치는 루트부터의 자식 인덱스 튜플로, 변환 단계에서 같은 요소를 찾는 데 쓴다.
+    SVGDocument.iter_shapes와 같은 규칙(컨테이너 안의 도형만)으로 순회한다.
+    """
+    stack = []  # (요소, 누적 행렬, 자식 순회 여부, 위치)
+    child_counts = []
+    canvas = None
+    for event, element in _iterparse(input_file, ('start', 'end')):
+        if event == 'start':
+            tag = local_name(element.tag)
+            if stack:
+                _, ctm, descend, parent_position = stack[-1]
+                position = parent_position + (child_counts[-1],)
+                child_counts[-1] += 1
+            else:
+                canvas = parse_viewbox(element.attrib)
+                ctm, descend, position = IDENTITY, True, ()
+
+            visible = descend
+            if visible and element.get('transform'):
+                ctm = multiply(ctm, parse_transform(element.get('transform')))
+            if visible and tag in SHAPE_TAGS:
+                yield position, tag, element.attrib, ctm, canvas
+
+            is_root = not stack
+            stack.append((element, ctm, visible and (tag in CONTAINER_TAGS or is_root), position))
+            child_counts.append(0)
+        else:
+            stack.pop()
+            child_counts.pop()
+            # 처리한 요소는 바로 제거하여 메모리 유지
+            element.clear()
+            if stack:
+                stack[-1][0].remove(element)
+
+
+def iter_stream_geometry(input_file):
+    """(위치, PathGeometry, 원 정보, 배경 여부) 순서로 도형 기하 정보를 하나씩 반환"""
+    for position, tag, attrib, ctm, canvas in iter_stream_shapes(input_file):
+        # 대용량 파일의 패스로 공용 캐시를 채우지 않음
+        shape = shape_geometry(tag, attrib, ctm, canvas, use_cache=False)
+        if shape is None:
+            continue
+        geometry, circle = shape
+        background = canvas is not None and is_background_bounds(geometry.bounds, canvas)
+        yield position, geometry, circle, background
+
+
+def stream_geometry(input_file, skip_background=True):
+    """스트리밍으로 심볼(배경 제외) 경계 상자와 배경 요소 위치 계산"""
+    bounds = EMPTY_BOUNDS
+    background = set()
+    for position, geometry, _, is_background in iter_stream_geometry(input_file):
+        if skip_background and is_background:
+            background.add(position)
+            continue
+        bounds = union_bounds(bounds, geometry.bounds)
+    return StreamGeometry(bounds, frozenset(background), parse_viewbox(read_root_attributes(input_file)))
+
+
+class _StreamWriter:
+    """iterparse 이벤트를 받아 XML을 바로 출력하는 작성기"""
+
+    def __init__(self, out):
+        self.write = out.write
+        self.prefixes = {XML_NS: 'xml'}
+        self.pending_ns = []
+        self.text_owner = None   # 시작 태그만 쓰고 text는 아직 안 쓴 요소
+        self.tail_owner = None   # 닫혔지만 tail은 아직 안 쓴 요소
+        self.tail_parent = None
+        self.open_tag = None     # '>'를 아직 쓰지 않은 시작 태그의 요소
+
+    def qname(self, name):
+        """{uri}local 형식 이름을 접두사:local 형식으로 변환"""
+        if name[:1] != '{':
+            return name
+        uri, local = name[1:].split('}', 1)
+        prefix = self.prefixes.get(uri)
+        return f"{prefix}:{local}" if prefix else local
+
+    def flush(self, closing=None):
+        """이전 이벤트에서 미뤄둔 '>', text, tail 기록
+
+        closing이 방금 연 요소이고 내용이 없으면 빈 요소 태그(/>)로 닫고 True 반환.
+        """
+        if self.open_tag is not None:
+            element = self.open_tag
+            self.open_tag = None
+            if closing is element and not element.text:
+                self.write(' />')
+                self.text_owner = None
+                return True
+            self.write('>')
+        if self.text_owner is not None:
+            if self.text_owner.text:
+                self.write(escape(self.text_owner.text))
+            self.text_owner = None
+        if self.tail_owner is not None:
+            if self.tail_owner.tail:
+                self.write(escape(self.tail_owner.tail))
+            if self.tail_parent is not None:
+                # 다 쓴 요소는 트리에서 제거하여 메모리 유지
+                self.tail_parent.remove(self.tail_owner)
+            self.tail_owner = self.tail_parent = None
+        return False
+
+    def start_ns(self, prefix, uri):
+        self.prefixes.setdefault(uri, prefix)
+        self.pending_ns.append((prefix, uri))
+
+    def start(self, element, attrib):
+        self.flush()
+        parts = ['<', self.qname(element.tag)]
+        for prefix, uri in self.pending_ns:
+            parts.append(f" xmlns:{prefix}={quoteattr(uri)}" if prefix else f" xmlns={quoteattr(uri)}")
+        self.pending_ns = []
+        for name, value in attrib.items():
+            parts.append(f" {self.qname(name)}={quoteattr(value)}")
+        self.write(''.join(parts))
+        self.open_tag = element
+        self.text_owner = element
+
+    def end(self, element, parent):
+        if not self.flush(closing=element):
+            self.write(f"</{self.qname(element.tag)}>")
+        self.tail_owner = element
+        self.tail_parent = parent
+
+    def special(self, element, parent, text):
+        """주석/처리 명령 기록"""
+        self.flush()
+        self.write(text)
+        self.tail_owner = element
+        self.tail_parent = parent
+        if parent is None:
+            self.write('\n')
+
+
+def stream_transform(input_file, output_file, matrix, skip_positions=frozenset(), root_attributes=None):
+    """요소를 하나씩 읽어 아핀 변환을 적용하고 바로 출력 파일에 기록
+
+    skip_positions: 변환하지 않을 요소 위치 (stream_geometry의 background)
+    root_attributes: 루트 svg 요소에 덮어쓸 속성 (예: 새 viewBox)
+    """
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 16) as out:
+        out.write("<?xml version='1.0' encoding='utf-8'?>\n")
+        writer = _StreamWriter(out)
+        stack = []  # (요소, 자식 모드, 위치)
+        child_counts = []
+        canvas = None
+
+        for event, item in _iterparse(input_file, _WRITE_EVENTS, keep_comments=True):
+            if event == 'start-ns':
+                writer.start_ns(*item)
+            elif event == 'start':
+                attrib = dict(item.attrib)
+                if stack:
+                    _, parent_mode, parent_position = stack[-1]
+                    position = parent_position + (child_counts[-1],)
+                    child_counts[-1] += 1
+                    if position in skip_positions:
+                        mode = MODE_KEEP
+                    else:
+                        mode = transform_attributes(local_name(item.tag), attrib, matrix,
+                                                    canvas, parent_mode)
+                else:
+                    canvas = parse_viewbox(attrib)
+                    position, mode = (), MODE_TRANSFORM
+                    if root_attributes:
+                        attrib.update(root_attributes)
+                writer.start(item, attrib)
+                stack.append((item, mode, position))
+                child_counts.append(0)
+            elif event == 'end':
+                stack.pop()
+                child_counts.pop()
+                writer.end(item, stack[-1][0] if stack else None)
+            elif event == 'comment':
+                writer.special(item, stack[-1][0] if stack else None, f"<!--{item.text}-->")
+            elif event == 'pi':
+                writer.special(item, stack[-1][0] if stack else None, f"<?{item.text}?>")
+        writer.flush()
+        out.write('\n')
+    return True
+
+
+def stream_resize(input_file, output_file, new_size):
+    """viewBox 기준으로 문서 전체를 new_size 크기로 스트리밍 조정
+
+    (원본 크기, 새 크기)를 반환하며 viewBox가 없으면 None.
+    """
+    viewbox = parse_viewbox(read_root_attributes(input_file))
+    if viewbox is None:
+        return None
+    original_size = viewbox[2]
+    matrix = compose(scale(new_size / original_size), translate(-viewbox[0], -viewbox[1]))
+    stream_transform(input_file, output_file, matrix,
+                     root_attributes={'viewBox': format_viewbox((0, 0, new_size, new_size))})
+    return original_size, new_size
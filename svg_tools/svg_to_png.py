@@ -2,117 +2,406 @@
 """
 SVG를 PNG로 변환하는 도구
 cairosvg 또는 Pillow + svglib 사용
+- SVGConverter: 사용할 수 있는 변환 방법 목록을 한 번만 찾아 재사용 (파일 변환에 실패하면 다음 방법 시도)
+- Inkscape는 하나의 `inkscape --shell` 프로세스에 여러 파일의 내보내기 명령을 전달
+- 같은 내용/설정의 렌더링 결과는 디스크 캐시에서 바로 반환 (render_cache)
+- 다른 방법을 모두 사용할 수 없으면 내장 래스터라이저로 변환 (svg_rasterizer)
 """
 
+import atexit
+import functools
 import os
+import re
+import shutil
 import sys
 import subprocess
 
-def check_and_install_libraries():
-    """필요한 라이브러리 확인 및 설치"""
-    libraries = {
-        'cairosvg': 'cairosvg',
-        'PIL': 'pillow',
-        'svglib': 'svglib',
-        'reportlab': 'reportlab'
-    }
-    
-    missing = []
-    for lib, pip_name in libraries.items():
-        try:
-            __import__(lib)
-        except ImportError:
-            missing.append(pip_name)
+from render_cache import RenderCache
+from svg_document import SVGDocument, parse_length, parse_viewbox
+from svg_rasterizer import RASTERIZER_VERSION, rasterize_to_png, render_document
+from svg_stream import read_root_attributes
+
+BACKENDS = ('cairosvg', 'svglib', 'inkscape', 'imagemagick', 'builtin')
+
+def _render_cairosvg(svg_path, png_path, width=None, height=None):
+    import cairosvg
+    cairosvg.svg2png(
+        url=svg_path,
+        write_to=png_path,
+        output_width=width,
+        output_height=height
+    )
+
+def _render_svglib(svg_path, png_path, width=None, height=None):
+    from svglib.svglib import svg2rlg
+    from reportlab.graphics import renderPM
+    from PIL import Image
     
-    if missing:
-        print("필요한 라이브러리가 설치되어 있지 않습니다.")
-        print(f"다음 명령어로 설치하세요: pip install {' '.join(missing)}")
-        return False
-    return True
+    drawing = svg2rlg(svg_path)
+    renderPM.drawToFile(drawing, png_path, fmt="PNG")
+    
+    # 크기 조정이 필요한 경우
+    if width or height:
+        img = Image.open(png_path)
+        if width and height:
+            img = img.resize((width, height), Image.Resampling.LANCZOS)
+        img.save(png_path)
 
-def convert_with_cairosvg(svg_path, png_path, width=None, height=None):
-    """CairoSVG를 사용한 변환"""
-    try:
-        import cairosvg
-        print("CairoSVG를 사용하여 변환 중...")
-        cairosvg.svg2png(
-            url=svg_path, 
-            write_to=png_path,
-            output_width=width,
-            output_height=height
-        )
-        return True
-    except Exception as e:
-        print(f"CairoSVG 변환 실패: {e}")
-        return False
+def _imagemagick_command(svg_path, png_path, width=None, height=None):
+    cmd = [shutil.which('magick') and 'magick' or 'convert']
+    
+    if width and height:
+        cmd.extend(['-density', '300', '-resize', f'{width}x{height}'])
+    
+    cmd.extend([svg_path, png_path])
+    return cmd
 
-def convert_with_svglib(svg_path, png_path, width=None, height=None):
-    """svglib + reportlab + Pillow를 사용한 변환"""
-    try:
+def intrinsic_size(svg_path):
+    """SVG 문서의 기본 출력 크기 (width/height 속성, 없으면 viewBox)"""
+    attrib = read_root_attributes(svg_path)
+    viewbox = parse_viewbox(attrib)
+    sizes = []
+    for name, index in (('width', 2), ('height', 3)):
+        value = attrib.get(name)
+        if value and not value.endswith('%'):
+            sizes.append(parse_length(value))
+        elif viewbox:
+            sizes.append(viewbox[index])
+        else:
+            sizes.append(None)
+    return tuple(sizes)
+
+def resolve_size(svg_path, width=None, height=None):
+    """너비/높이 중 빠진 값을 문서 비율에 맞춰 채움"""
+    if width and height:
+        return width, height
+    doc_width, doc_height = intrinsic_size(svg_path)
+    if not doc_width or not doc_height:
+        return width, height
+    if width:
+        return width, max(1, round(width * doc_height / doc_width))
+    if height:
+        return max(1, round(height * doc_width / doc_height)), height
+    return max(1, round(doc_width)), max(1, round(doc_height))
+
+def load_svg(backend, svg_path):
+    """여러 크기로 렌더링할 때 재사용할 파싱 결과 (변환 방법별)
+    
+    cairosvg는 문서 트리, svglib는 Drawing, 내장 래스터라이저는 SVGDocument,
+    외부 프로그램은 파일 경로 그대로.
+    """
+    if backend == 'cairosvg':
+        from cairosvg.parser import Tree
+        with open(svg_path, 'rb') as f:
+            return Tree(bytestring=f.read(), url=os.path.abspath(svg_path))
+    if backend == 'svglib':
         from svglib.svglib import svg2rlg
+        return svg2rlg(svg_path)
+    if backend == 'builtin':
+        return SVGDocument.load(svg_path)
+    return svg_path
+
+def render_loaded(backend, loaded, png_path, width=None, height=None, shell=None):
+    """load_svg 결과를 지정한 크기의 PNG로 렌더링 (다시 파싱하지 않음)
+    
+    Inkscape는 호출한 쪽이 계속 사용하는 InkscapeShell을 shell로 넘겨야 한다.
+    """
+    if backend == 'cairosvg':
+        from cairosvg.surface import PNGSurface
+        surface = PNGSurface(loaded, png_path, 96, output_width=width, output_height=height)
+        surface.finish()
+    elif backend == 'svglib':
         from reportlab.graphics import renderPM
-        from PIL import Image
-        
-        print("svglib를 사용하여 변환 중...")
-        drawing = svg2rlg(svg_path)
-        renderPM.drawToFile(drawing, png_path, fmt="PNG")
-        
-        # 크기 조정이 필요한 경우
-        if width or height:
-            img = Image.open(png_path)
-            if width and height:
-                img = img.resize((width, height), Image.Resampling.LANCZOS)
-            img.save(png_path)
-        
-        return True
-    except Exception as e:
-        print(f"svglib 변환 실패: {e}")
-        return False
+        # 원본 크기로 그린 뒤 줄이지 않고 dpi로 목표 크기에 바로 렌더링
+        scales = [size / base for size, base in ((width, loaded.width), (height, loaded.height))
+                  if size and base]
+        dpi = 72 * min(scales) if scales else 72
+        renderPM.drawToFile(loaded, png_path, fmt="PNG", dpi=dpi)
+    elif backend == 'builtin':
+        render_document(loaded, width, height).save_png(png_path)
+    elif backend == 'inkscape':
+        if shell is None:
+            raise ValueError("Inkscape 렌더링에는 InkscapeShell이 필요합니다.")
+        shell.export(loaded, png_path, width, height)
+    else:
+        result = subprocess.run(_imagemagick_command(loaded, png_path, width, height),
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip())
 
-def convert_with_inkscape(svg_path, png_path, width=None, height=None):
-    """Inkscape 명령줄 도구를 사용한 변환"""
+@functools.lru_cache(maxsize=None)
+def backend_version(backend):
+    """변환 방법의 버전 문자열 (캐시 키에 사용, 알 수 없으면 빈 문자열)"""
     try:
-        print("Inkscape를 사용하여 변환 중...")
-        cmd = ['inkscape', svg_path, '--export-type=png', f'--export-filename={png_path}']
-        
-        if width:
-            cmd.extend(['--export-width', str(width)])
-        if height:
-            cmd.extend(['--export-height', str(height)])
+        if backend == 'cairosvg':
+            import cairosvg
+            return cairosvg.__version__
+        if backend == 'svglib':
+            import reportlab
+            import svglib
+            return f"{svglib.__version__}/{reportlab.Version}"
+        if backend == 'builtin':
+            return RASTERIZER_VERSION
+        if backend == 'inkscape':
+            command = ['inkscape', '--version']
+        elif backend == 'imagemagick':
+            command = [shutil.which('magick') and 'magick' or 'convert', '-version']
+        else:
+            return ''
+        result = subprocess.run(command, capture_output=True, text=True)
+        output = (result.stdout or result.stderr).strip()
+        return output.splitlines()[0] if output else ''
+    except Exception:
+        return ''
+
+class InkscapeShell:
+    """하나의 `inkscape --shell` 프로세스로 여러 파일을 내보내기
+    
+    Inkscape 1.x는 액션 문법, 0.92는 명령줄 인자 문법을 사용한다.
+    프로세스가 종료되면 다음 내보내기에서 다시 시작한다.
+    """
+    
+    PROMPT = '>'
+
+    def __init__(self, executable='inkscape'):
+        self.executable = executable
+        self.version = self._detect_version()
+        self.process = None
+
+    def _detect_version(self):
+        result = subprocess.run([self.executable, '--version'], capture_output=True, text=True)
+        match = re.search(r'Inkscape (\d+)\.(\d+)', result.stdout + result.stderr)
+        return (int(match.group(1)), int(match.group(2))) if match else (1, 0)
+
+    def start(self):
+        if self.process is not None and self.process.poll() is None:
+            return
+        self.process = subprocess.Popen(
+            [self.executable, '--shell'], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, text=True, bufsize=1)
+        self._read_prompt()
+
+    def _read_prompt(self):
+        """프롬프트가 나올 때까지 출력 읽기 (명령 완료 대기)"""
+        output = []
+        at_line_start = True
+        while True:
+            char = self.process.stdout.read(1)
+            if not char:
+                raise RuntimeError("Inkscape 셸이 종료되었습니다.")
+            if char == self.PROMPT and at_line_start:
+                return ''.join(output)
+            output.append(char)
+            # 이전 프롬프트 뒤의 공백은 줄 시작으로 취급
+            at_line_start = char == '\n' or (at_line_start and char == ' ')
+
+    def _commands(self, svg_path, outputs):
+        """셸에 보낼 명령 줄 목록 (1.x는 문서를 한 번 열고 모든 크기를 내보냄)"""
+        if self.version >= (1, 0):
+            actions = [f'file-open:{svg_path}', 'export-type:png']
+            for png_path, width, height in outputs:
+                # 크기를 알 수 없으면 0(지정 안 함)으로 되돌려 이전 파일의 설정을 쓰지 않게 함
+                actions.append(f'export-filename:{png_path}')
+                actions.append(f'export-width:{width or 0}')
+                actions.append(f'export-height:{height or 0}')
+                actions.append('export-do')
+            actions.append('file-close')
+            return [';'.join(actions)]
+        commands = []
+        for png_path, width, height in outputs:
+            command = f'"{svg_path}" --export-png="{png_path}"'
+            if width:
+                command += f' -w {width}'
+            if height:
+                command += f' -h {height}'
+            commands.append(command)
+        return commands
+
+    def export(self, svg_path, png_path, width=None, height=None):
+        """PNG 하나 내보내기 (실패 시 RuntimeError)"""
+        self.export_many(svg_path, [(png_path, width, height)])
+
+    def export_many(self, svg_path, outputs):
+        """SVG 하나를 여러 (png 경로, 너비, 높이)로 내보내기 (실패 시 RuntimeError)"""
+        paths = [svg_path] + [png_path for png_path, _, _ in outputs]
+        if any(char in path for path in paths for char in ';\n"'):
+            raise ValueError(f"Inkscape 셸에서 사용할 수 없는 파일 경로: {svg_path}")
+        # 내보내기 설정은 셸 안에서 유지되므로 크기는 항상 명시
+        resolved = []
+        for png_path, width, height in outputs:
+            if os.path.exists(png_path):
+                os.remove(png_path)
+            resolved.append((os.path.abspath(png_path),) + resolve_size(svg_path, width, height))
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode == 0:
+        if self.version < (1, 0) and any(not width or not height for _, width, height in resolved):
+            # 0.92는 크기 설정을 되돌릴 수 없으므로 새 셸에서 내보냄
+            self.close()
+        self.start()
+        output = []
+        for command in self._commands(os.path.abspath(svg_path), resolved):
+            self.process.stdin.write(command + '\n')
+            self.process.stdin.flush()
+            output.append(self._read_prompt())
+        missing = [png_path for png_path, _, _ in outputs if not os.path.exists(png_path)]
+        if missing:
+            raise RuntimeError(''.join(output).strip() or f"PNG 파일이 생성되지 않았습니다: {missing[0]}")
+
+    def close(self):
+        if self.process is None:
+            return
+        if self.process.poll() is None:
+            try:
+                self.process.stdin.write('quit\n')
+                self.process.stdin.flush()
+                self.process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+        self.process = None
+
+class SVGConverter:
+    """SVG -> PNG 변환기 (사용할 수 있는 변환 방법 목록은 처음 한 번만 찾음)
+    
+    backend를 지정하지 않으면 BACKENDS 순서대로 사용할 수 있는 방법을 시도하고,
+    파일 하나의 변환에 실패하면 (지원하지 않는 기능 등) 다음 방법으로 다시 변환한다.
+    cache는 True(기본 캐시), False(사용 안 함) 또는 RenderCache 객체.
+    with 문이나 close()로 Inkscape 셸 프로세스를 정리한다.
+    """
+
+    def __init__(self, backend=None, verbose=True, cache=True):
+        if backend is not None and backend not in BACKENDS:
+            raise ValueError(f"알 수 없는 변환 방법: {backend}")
+        self._backends = None if backend is None else (backend,)
+        self.verbose = verbose
+        self._shell = None
+        if cache is True:
+            cache = RenderCache()
+        self.cache = cache or None
+
+    @staticmethod
+    def backend_available(backend):
+        """변환 방법을 사용할 수 있는지 확인"""
+        if backend == 'cairosvg':
+            modules = ('cairosvg',)
+        elif backend == 'svglib':
+            modules = ('svglib.svglib', 'reportlab.graphics.renderPM', 'PIL')
+        elif backend == 'inkscape':
+            return shutil.which('inkscape') is not None
+        elif backend == 'imagemagick':
+            return shutil.which('magick') is not None or shutil.which('convert') is not None
+        elif backend == 'builtin':
             return True
         else:
-            print(f"Inkscape 변환 실패: {result.stderr}")
             return False
-    except FileNotFoundError:
-        print("Inkscape가 설치되어 있지 않습니다.")
-        return False
+        try:
+            for module in modules:
+                __import__(module)
+        except Exception:  # cairosvg는 libcairo가 없으면 OSError
+            return False
+        return True
 
-def convert_with_imagemagick(svg_path, png_path, width=None, height=None):
-    """ImageMagick을 사용한 변환"""
-    try:
-        print("ImageMagick을 사용하여 변환 중...")
-        cmd = ['convert']
-        
-        if width and height:
-            cmd.extend(['-density', '300', '-resize', f'{width}x{height}'])
+    @classmethod
+    def detect_backends(cls):
+        """사용할 수 있는 변환 방법 목록 (BACKENDS 순서)"""
+        return tuple(backend for backend in BACKENDS if cls.backend_available(backend))
+
+    @classmethod
+    def detect_backend(cls):
+        """사용할 수 있는 첫 번째 변환 방법 (없으면 None)"""
+        backends = cls.detect_backends()
+        return backends[0] if backends else None
+
+    @property
+    def backends(self):
+        """시도할 변환 방법 목록 (처음 한 번만 찾음)"""
+        if self._backends is None:
+            self._backends = self.detect_backends()
+            if self._backends and self.verbose:
+                print(f"변환 방법: {', '.join(self._backends)}")
+        return self._backends
+
+    @property
+    def backend(self):
+        """첫 번째로 시도할 변환 방법 (없으면 None)"""
+        backends = self.backends
+        return backends[0] if backends else None
+
+    def _render(self, backend, svg_path, png_path, width=None, height=None):
+        if backend == 'cairosvg':
+            _render_cairosvg(svg_path, png_path, width, height)
+        elif backend == 'svglib':
+            _render_svglib(svg_path, png_path, width, height)
+        elif backend == 'builtin':
+            rasterize_to_png(svg_path, png_path, width, height)
+        elif backend == 'inkscape':
+            if self._shell is None:
+                self._shell = InkscapeShell()
+            self._shell.export(svg_path, png_path, width, height)
+        else:
+            result = subprocess.run(_imagemagick_command(svg_path, png_path, width, height),
+                                    capture_output=True, text=True)
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr.strip())
+
+    def convert(self, svg_path, png_path=None, width=None, height=None):
+        """SVG 하나를 PNG로 변환 (실패하면 False)"""
+        if png_path is None:
+            png_path = os.path.splitext(svg_path)[0] + '.png'
+        backends = self.backends
+        if not backends:
+            print("사용할 수 있는 변환 방법이 없습니다.")
+            return False
         
-        cmd.extend([svg_path, png_path])
+        # 어느 방법으로든 같은 내용과 설정으로 렌더링한 적이 있으면 렌더러를 실행하지 않음
+        cache_keys = {}
+        if self.cache is not None:
+            with open(svg_path, 'rb') as f:
+                content = f.read()
+            for backend in backends:
+                cache_keys[backend] = self.cache.key(content, backend, width, height, backend_version(backend))
+                if self.cache.fetch(cache_keys[backend], png_path):
+                    return True
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode == 0:
+        for backend in backends:
+            try:
+                self._render(backend, svg_path, png_path, width, height)
+            except Exception as e:
+                print(f"{backend} 변환 실패 ({svg_path}): {e}")
+                continue
+            if backend in cache_keys:
+                self.cache.put(cache_keys[backend], png_path)
             return True
-        else:
-            print(f"ImageMagick 변환 실패: {result.stderr}")
-            return False
-    except FileNotFoundError:
-        print("ImageMagick이 설치되어 있지 않습니다.")
         return False
 
+    def convert_many(self, jobs):
+        """(svg 경로, png 경로, 너비, 높이) 목록을 차례로 변환하고 결과를 순서대로 반환"""
+        for svg_path, png_path, width, height in jobs:
+            yield svg_path, png_path, self.convert(svg_path, png_path, width, height)
+
+    def close(self):
+        if self._shell is not None:
+            self._shell.close()
+            self._shell = None
+        if self.cache is not None:
+            self.cache.flush_stats()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+_default_converter = None
+
+def get_converter():
+    """모듈 공용 변환기 (프로세스 종료 시 정리)"""
+    global _default_converter
+    if _default_converter is None:
+        _default_converter = SVGConverter()
+        atexit.register(_default_converter.close)
+    return _default_converter
+
 def svg_to_png(svg_path, png_path=None, width=None, height=None):
-    """SVG를 PNG로 변환 (여러 방법 시도)"""
+    """SVG를 PNG로 변환 (사용할 수 있는 방법을 한 번 찾아 재사용)"""
     if not os.path.exists(svg_path):
         print(f"SVG 파일을 찾을 수 없습니다: {svg_path}")
         return False
@@ -122,31 +411,16 @@ def svg_to_png(svg_path, png_path=None, width=None, height=None):
     
     print(f"변환 중: {svg_path} -> {png_path}")
     
-    # Python 라이브러리 방법 시도
-    if check_and_install_libraries():
-        # CairoSVG 시도
-        if convert_with_cairosvg(svg_path, png_path, width, height):
-            print(f"✅ 변환 성공: {png_path}")
-            return True
-        
-        # svglib 시도
-        if convert_with_svglib(svg_path, png_path, width, height):
-            print(f"✅ 변환 성공: {png_path}")
-            return True
-    
-    # 외부 프로그램 시도
-    if convert_with_inkscape(svg_path, png_path, width, height):
+    converter = get_converter()
+    if converter.convert(svg_path, png_path, width, height):
         print(f"✅ 변환 성공: {png_path}")
         return True
     
-    if convert_with_imagemagick(svg_path, png_path, width, height):
-        print(f"✅ 변환 성공: {png_path}")
-        return True
-    
-    print("\n❌ 변환 실패. 다음 중 하나를 설치하세요:")
-    print("1. Python 라이브러리: pip install cairosvg")
-    print("2. Inkscape: https://inkscape.org/")
-    print("3. ImageMagick: https://imagemagick.org/")
+    if converter.backend is None:
+        print("\n❌ 변환 실패. 다음 중 하나를 설치하세요:")
+        print("1. Python 라이브러리: pip install cairosvg")
+        print("2. Inkscape: https://inkscape.org/")
+        print("3. ImageMagick: https://imagemagick.org/")
     
     return False
 
@@ -155,14 +429,18 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='SVG를 PNG로 변환')
-    parser.add_argument('svg_file', nargs='?', default='../Images/Icon_1000x1000_profile.svg',
-                        help='변환할 SVG 파일 경로')
-    parser.add_argument('-o', '--output', help='출력 PNG 파일 경로')
+    parser.add_argument('svg_files', nargs='*', default=['../Images/Icon_1000x1000_profile.svg'],
+                        help='변환할 SVG 파일 경로 (여러 개 가능)')
+    parser.add_argument('-o', '--output', help='출력 PNG 파일 경로 (파일이 하나일 때)')
     parser.add_argument('-w', '--width', type=int, help='출력 너비')
     parser.add_argument('--height', type=int, help='출력 높이')
     parser.add_argument('-s', '--size', type=int, help='정사각형 크기 (너비와 높이 동일)')
+    parser.add_argument('--backend', choices=BACKENDS, help='변환 방법 지정 (기본: 자동 선택)')
+    parser.add_argument('--no-cache', action='store_true', help='렌더링 캐시를 사용하지 않음')
     
     args = parser.parse_args()
+    if args.output and len(args.svg_files) > 1:
+        parser.error("-o는 파일이 하나일 때만 사용할 수 있습니다.")
     
     # 크기 설정
     width = args.width
@@ -171,10 +449,18 @@ def main():
         width = height = args.size
     
     # 변환 실행
-    success = svg_to_png(args.svg_file, args.output, width, height)
+    if args.backend or args.no_cache:
+        global _default_converter
+        _default_converter = SVGConverter(args.backend, cache=not args.no_cache)
+        atexit.register(_default_converter.close)
+    
+    failed = 0
+    for svg_file in args.svg_files:
+        if not svg_to_png(svg_file, args.output, width, height):
+            failed += 1
     
-    if not success:
+    if failed:
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
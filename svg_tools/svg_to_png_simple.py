@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 SVG를 PNG로 변환하는 간단한 도구
-웹 서비스 또는 base64 인코딩 사용
+내장 래스터라이저로 바로 변환하고, 실패하면 브라우저 변환용 HTML 생성
 """
 
 import os
@@ -9,6 +9,8 @@ import sys
 import base64
 import json
 
+from svg_rasterizer import rasterize_to_png
+
 def svg_to_png_data_uri(svg_path, output_path=None, size=1000):
     """SVG를 읽어서 PNG 변환을 위한 HTML 생성"""
     if not os.path.exists(svg_path):
@@ -157,6 +159,18 @@ def main():
     print(f"크기: {size}x{size}")
     print("")
     
+    if not os.path.exists(svg_file):
+        print(f"SVG 파일을 찾을 수 없습니다: {svg_file}")
+        return
+    
+    try:
+        rasterize_to_png(svg_file, output_file, size, size)
+        print(f"✅ 변환 성공: {output_file}")
+        return
+    except Exception as e:
+        print(f"내장 래스터라이저 변환 실패: {e}")
+        print("브라우저 변환 도구를 생성합니다.")
+    
     svg_to_png_data_uri(svg_file, output_file, size)
 
 if __name__ == "__main__":
@@ -5,150 +5,96 @@ SVG 변환 도구 모음
 - SVG 크기 조정
 - SVG 심볼 확대 및 중앙 정렬
 - SVG 패스 병합
+- 여러 파일 일괄 처리 (프로세스 풀)
 """
 
 import re
 import os
 import sys
+import glob
+import io
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+
+from svg_path import PathData, parse_path
+from image_discovery import scan_images
+from svg_document import SVGDocument, local_name
+from svg_reverse import reverse_path, reverse_paths
+from svg_stream import stream_resize
+from svg_transform import compose, scale, translate
+
+BATCH_OPERATIONS = ('resize', 'center', 'profile', 'reverse', 'winding')
+
+BatchResult = namedtuple('BatchResult', ['input_file', 'output_file', 'ok', 'seconds', 'message', 'log'])
+BatchResult.__doc__ = """일괄 처리 파일 하나의 결과 (log는 작업 중 출력된 내용)"""
 
 class SVGTools:
     @staticmethod
     def parse_svg_path(path_data):
         """SVG 경로를 파싱하여 명령어 리스트로 변환"""
-        tokens = re.findall(r'[MLCQZmlcqz]|[-+]?\d*\.?\d+', path_data.strip())
-        
-        commands = []
-        i = 0
-        
-        while i < len(tokens):
-            if tokens[i] in 'MLCQZmlcqz':
-                cmd = tokens[i]
-                i += 1
-                
-                param_counts = {
-                    'M': 2, 'm': 2,
-                    'L': 2, 'l': 2,
-                    'C': 6, 'c': 6,
-                    'Q': 4, 'q': 4,
-                    'Z': 0, 'z': 0
-                }
-                
-                params = []
-                param_count = param_counts.get(cmd, 0)
-                
-                for _ in range(param_count):
-                    if i < len(tokens) and tokens[i] not in 'MLCQZmlcqz':
-                        params.append(float(tokens[i]))
-                        i += 1
-                
-                commands.append((cmd, params))
-            else:
-                i += 1
-        
-        return commands
+        return parse_path(path_data.strip())
 
     @staticmethod
-    def reverse_path_to_clockwise(path_data):
-        """반시계방향 패스를 시계방향으로 변환"""
-        commands = SVGTools.parse_svg_path(path_data)
-        
-        # Z 명령어 제거
-        if commands and commands[-1][0] in 'Zz':
-            commands = commands[:-1]
-        
-        # 각 점의 좌표 추출
-        points = []
-        for cmd, params in commands:
-            if cmd == 'M':
-                points.append(params)
-            elif cmd == 'L':
-                points.append(params)
-            elif cmd == 'C':
-                points.append(params[4:6])
-            elif cmd == 'Q':
-                points.append(params[2:4])
-        
-        # 역순으로 새 명령어 생성
-        reversed_commands = []
-        reversed_commands.append(('M', points[-1]))
-        
-        for i in range(len(commands) - 1, 0, -1):
-            cmd, params = commands[i]
-            prev_point = points[i-1]
-            
-            if cmd == 'L':
-                reversed_commands.append(('L', prev_point))
-            elif cmd == 'C':
-                reversed_commands.append(('C', [params[2], params[3], params[0], params[1], prev_point[0], prev_point[1]]))
-            elif cmd == 'Q':
-                reversed_commands.append(('Q', [params[0], params[1], prev_point[0], prev_point[1]]))
-        
-        # 명령어를 문자열로 변환
-        result = []
-        for cmd, params in reversed_commands:
-            if cmd in 'Zz':
-                result.append(cmd)
-            else:
-                if cmd == 'M' or cmd == 'L':
-                    result.append(f"{cmd} {params[0]:.2f} {params[1]:.2f}")
-                elif cmd == 'C':
-                    result.append(f"{cmd} {params[0]:.2f} {params[1]:.2f}, {params[2]:.2f} {params[3]:.2f}, {params[4]:.2f} {params[5]:.2f}")
-                elif cmd == 'Q':
-                    result.append(f"{cmd} {params[0]:.2f} {params[1]:.2f}, {params[2]:.2f} {params[3]:.2f}")
-        
-        result.append('Z')
-        return '\n  '.join(result)
+    def reverse_path_to_clockwise(path_data, only_counter_clockwise=True):
+        """반시계방향 하위 패스를 시계방향으로 변환 (문자열이면 문자열, PathData이면 PathData 반환)
+        
+        모든 명령어(상대 좌표, H/V/S/T/A 포함)와 여러 하위 패스를 지원한다.
+        only_counter_clockwise=False이면 방향과 관계없이 모든 하위 패스를 뒤집는다.
+        """
+        result = reverse_path(path_data, only_counter_clockwise)
+        if isinstance(path_data, PathData):
+            return result
+        return result.to_string(separator='\n  ')
 
     @staticmethod
-    def resize_svg(input_file, output_file, new_size):
-        """SVG 파일 크기 조정"""
-        with open(input_file, 'r', encoding='utf-8') as f:
-            svg_content = f.read()
+    def reverse_svg_file(input_file, output_file):
+        """SVG 파일의 모든 path 요소에서 반시계방향 하위 패스를 시계방향으로 뒤집어 저장"""
+        document = SVGDocument.load(input_file)
+        
+        elements = [element for element, _ in document.iter_shapes()
+                    if local_name(element.tag) == 'path' and element.get('d')]
+        # 문자열 변환 없이 PathData 목록을 한 번에 뒤집기
+        for element, path in zip(elements, reverse_paths(element.get('d') for element in elements)):
+            element.set('d', path.to_string())
+        
+        document.save(output_file)
+        print(f"{len(elements)}개의 패스를 뒤집었습니다.")
+        print(f"결과가 '{output_file}'에 저장되었습니다.")
+        return True
+
+    @staticmethod
+    def resize_svg(input_file, output_file, new_size, streaming=False):
+        """SVG 파일 크기 조정 (streaming=True이면 요소 단위로 읽고 바로 기록)"""
+        if streaming:
+            result = stream_resize(input_file, output_file, new_size)
+            if result is None:
+                print("viewBox를 찾을 수 없습니다.")
+                return False
+            original_size, _ = result
+            print(f"SVG가 {original_size}x{original_size}에서 {new_size}x{new_size}로 크기가 조정되었습니다.")
+            print(f"결과가 '{output_file}'에 저장되었습니다.")
+            return True
+        
+        document = SVGDocument.load(input_file)
         
         # 원본 크기 추출
-        viewbox_match = re.search(r'viewBox="[^"]*\s+(\d+\.?\d*)\s+(\d+\.?\d*)"', svg_content)
-        if viewbox_match:
-            original_size = float(viewbox_match.group(1))
+        viewbox = document.viewbox
+        if viewbox:
+            original_size = viewbox[2]
         else:
             print("viewBox를 찾을 수 없습니다.")
             return False
         
         scale_factor = new_size / original_size
         
-        # viewBox 변경
-        svg_content = re.sub(r'viewBox="[^"]*"', f'viewBox="0.00 0.00 {new_size:.2f} {new_size:.2f}"', svg_content)
-        
-        # 모든 좌표를 스케일링하는 함수
-        def scale_coordinates(match):
-            coords = match.group(1)
-            numbers = re.findall(r'[-+]?\d*\.?\d+', coords)
-            scaled_numbers = []
-            
-            for num in numbers:
-                scaled_value = float(num) * scale_factor
-                scaled_numbers.append(f"{scaled_value:.2f}")
-            
-            result = coords
-            for i, num in enumerate(numbers):
-                result = result.replace(num, scaled_numbers[i], 1)
-            
-            return match.group(0).replace(coords, result)
-        
-        # path d 속성의 좌표 스케일링
-        svg_content = re.sub(r'd="([^"]*)"', scale_coordinates, svg_content)
+        # 모든 도형 좌표를 한 번에 스케일링 (viewBox 원점은 0으로 이동)
+        document.apply_transform(compose(scale(scale_factor), translate(-viewbox[0], -viewbox[1])))
         
-        # circle 요소의 cx, cy, r 속성 스케일링
-        def scale_circle(match):
-            cx = float(match.group(1)) * scale_factor
-            cy = float(match.group(2)) * scale_factor
-            r = float(match.group(3)) * scale_factor
-            return f'<circle fill="#13aefe" cx="{cx:.2f}" cy="{cy:.2f}" r="{r:.2f}" />'
-        
-        svg_content = re.sub(r'<circle[^>]*cx="([\d.]+)"[^>]*cy="([\d.]+)"[^>]*r="([\d.]+)"[^>]*/>',
-                            scale_circle, svg_content)
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(svg_content)
+        # viewBox 변경
+        document.viewbox = (0, 0, new_size, new_size)
+        document.save(output_file)
         
         print(f"SVG가 {original_size}x{original_size}에서 {new_size}x{new_size}로 크기가 조정되었습니다.")
         print(f"결과가 '{output_file}'에 저장되었습니다.")
@@ -156,7 +102,14 @@ class SVGTools:
 
     @staticmethod
     def extract_numbers(path_d):
-        """패스 데이터에서 모든 숫자 추출"""
+        """패스 데이터에서 모든 숫자 추출 (문자열 또는 PathData)
+        
+        PathData는 H/V/A처럼 값이 두 개씩 짝지어지지 않는 명령이 있으므로
+        정규화한 (절대 좌표 M/L/C/Q/Z) 좌표를 (x, y) 쌍으로 반환한다.
+        """
+        if isinstance(path_d, PathData):
+            coords = path_d.normalized().coords
+            return list(zip(coords[0::2], coords[1::2]))
         numbers = re.findall(r'[-+]?\d*\.?\d+', path_d)
         coords = []
         for i in range(0, len(numbers), 2):
@@ -166,45 +119,17 @@ class SVGTools:
 
     @staticmethod
     def get_bounding_box(svg_content):
-        """SVG의 모든 패스에서 경계 상자 계산"""
-        min_x, min_y = float('inf'), float('inf')
-        max_x, max_y = float('-inf'), float('-inf')
-        
-        path_pattern = r'<path[^>]*d="([^"]*)"[^>]*>'
-        paths = re.findall(path_pattern, svg_content)
-        
-        for path_d in paths:
-            # Fill path는 제외
-            if 'M 1000.00 0.00' in path_d or 'M 1448.00 0.00' in path_d:
-                continue
-                
-            coords = SVGTools.extract_numbers(path_d)
-            for x, y in coords:
-                min_x = min(min_x, x)
-                min_y = min(min_y, y)
-                max_x = max(max_x, x)
-                max_y = max(max_y, y)
-        
-        # circle 요소도 고려
-        circle_pattern = r'<circle[^>]*cx="([\d.]+)"[^>]*cy="([\d.]+)"[^>]*r="([\d.]+)"[^>]*>'
-        circles = re.findall(circle_pattern, svg_content)
-        for cx_str, cy_str, r_str in circles:
-            cx, cy, r = float(cx_str), float(cy_str), float(r_str)
-            min_x = min(min_x, cx - r)
-            min_y = min(min_y, cy - r)
-            max_x = max(max_x, cx + r)
-            max_y = max(max_y, cy + r)
-        
-        return min_x, min_y, max_x, max_y
+        """SVG의 모든 도형에서 경계 상자 계산 (곡선 극값 기준, 배경 도형 제외)"""
+        return SVGDocument.from_string(svg_content).geometry().bounds
 
     @staticmethod
     def scale_and_center_symbol(input_file, output_file, canvas_size, target_size):
         """SVG 심볼을 확대하고 중앙 정렬"""
-        with open(input_file, 'r', encoding='utf-8') as f:
-            svg_content = f.read()
+        document = SVGDocument.load(input_file)
         
-        # 현재 심볼의 경계 상자 구하기
-        min_x, min_y, max_x, max_y = SVGTools.get_bounding_box(svg_content)
+        # 현재 심볼의 경계 상자 구하기 (배경 도형 제외)
+        geometry = document.geometry()
+        min_x, min_y, max_x, max_y = geometry.bounds
         
         # 현재 심볼의 크기
         current_width = max_x - min_x
@@ -232,62 +157,164 @@ class SVGTools:
         print(f"스케일 팩터: {scale_factor:.4f}")
         print(f"이동 거리: ({translate_x:.2f}, {translate_y:.2f})")
         
-        # 좌표 변환 함수
-        def transform_coordinates(match):
-            coords = match.group(1)
-            # Fill path는 변환하지 않음
-            if f'M {canvas_size:.2f} 0.00' in coords:
-                return match.group(0)
-                
-            # 숫자 패턴 찾기
-            def replace_number(num_match):
-                num = float(num_match.group(0))
-                if hasattr(replace_number, 'index'):
-                    replace_number.index += 1
-                else:
-                    replace_number.index = 0
-                    
-                # 홀수 인덱스는 x좌표, 짝수 인덱스는 y좌표
-                if replace_number.index % 2 == 1:  # x 좌표
-                    transformed = num * scale_factor + translate_x
-                else:  # y 좌표
-                    transformed = num * scale_factor + translate_y
-                    
-                return f"{transformed:.2f}"
-            
-            replace_number.index = 0
-            result = re.sub(r'[-+]?\d*\.?\d+', replace_number, coords)
-            return match.group(0).replace(coords, result)
-        
-        # path d 속성의 좌표 변환
-        svg_content = re.sub(r'd="([^"]*)"', transform_coordinates, svg_content)
-        
-        # circle 요소의 변환
-        def transform_circle(match):
-            cx = float(match.group(1)) * scale_factor + translate_x
-            cy = float(match.group(2)) * scale_factor + translate_y
-            r = float(match.group(3)) * scale_factor
-            return f'<circle fill="#13aefe" cx="{cx:.2f}" cy="{cy:.2f}" r="{r:.2f}" />'
-        
-        svg_content = re.sub(r'<circle[^>]*cx="([\d.]+)"[^>]*cy="([\d.]+)"[^>]*r="([\d.]+)"[^>]*/>',
-                            transform_circle, svg_content)
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(svg_content)
+        # 스케일 후 이동하는 아핀 행렬 (배경 도형은 변환하지 않음)
+        matrix = compose(translate(translate_x, translate_y), scale(scale_factor))
+        document.apply_transform(matrix, skip=geometry.background)
+        document.save(output_file)
         
         print(f"\n심볼이 {target_size}x{target_size} 크기로 확대되었습니다.")
         print(f"결과가 '{output_file}'에 저장되었습니다.")
         return True
 
+def collect_svg_files(patterns, recursive=False):
+    """glob 패턴 또는 디렉토리 목록에서 SVG 파일 경로 수집 (중복 제거, 정렬)"""
+    files = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            files.update(entry.path for entry in scan_images(pattern, ('.svg',), recursive))
+        else:
+            files.update(path for path in glob.glob(pattern, recursive=recursive)
+                         if os.path.isfile(path))
+    return sorted(files)
+
+def common_root(files):
+    """파일 목록의 공통 상위 폴더 (없으면 None)"""
+    if not files:
+        return None
+    return os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in files])
+
+def batch_output_path(input_file, operation, output_dir=None, suffix=None, root=None):
+    """일괄 처리 결과 파일 경로 (기본: 같은 폴더에 _<작업> 접미사)
+    
+    output_dir가 있으면 root(입력 파일들의 공통 상위 폴더) 기준 상대 폴더 구조를 유지하여
+    다른 폴더의 같은 이름 파일이 서로 덮어쓰지 않게 한다.
+    """
+    base, ext = os.path.splitext(os.path.basename(input_file))
+    if suffix is None:
+        suffix = '' if output_dir else f'_{operation}'
+    if output_dir:
+        parent = os.path.dirname(os.path.abspath(input_file))
+        directory = os.path.normpath(os.path.join(output_dir, os.path.relpath(parent, root or parent)))
+    else:
+        directory = os.path.dirname(input_file)
+    return os.path.join(directory, f"{base}{suffix}{ext}")
+
+def run_batch_task(task):
+    """일괄 처리 작업 하나 실행 (프로세스 풀 작업 함수)
+
+    task는 (작업, 입력 파일, 출력 파일, 옵션 dict). 예외는 결과에 담아 반환한다.
+    """
+    operation, input_file, output_file, options = task
+    log = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with redirect_stdout(log):
+            if operation == 'resize':
+                ok = SVGTools.resize_svg(input_file, output_file, options['size'],
+                                         streaming=options.get('streaming', False))
+            elif operation == 'center':
+                ok = SVGTools.scale_and_center_symbol(input_file, output_file,
+                                                      options['canvas_size'], options['target_size'])
+            elif operation == 'profile':
+                from scale_for_profile import scale_for_circular_profile
+                scale_for_circular_profile(input_file, output_file, options['canvas_size'],
+                                           streaming=options.get('streaming', False),
+                                           center=options.get('center', 'bbox'))
+                ok = True
+            elif operation == 'reverse':
+                ok = SVGTools.reverse_svg_file(input_file, output_file)
+            elif operation == 'winding':
+                from svg_winding import normalize_svg_file
+                ok = normalize_svg_file(input_file, output_file, options.get('tolerance', 0.25))
+            else:
+                raise ValueError(f"알 수 없는 작업: {operation}")
+        message = '완료' if ok is not False else '실패'
+        ok = ok is not False
+    except Exception as e:
+        ok = False
+        message = f"{type(e).__name__}: {e}"
+    return BatchResult(input_file, output_file, ok, time.perf_counter() - start, message, log.getvalue())
+
+def run_batch(operation, files, output_dir=None, workers=None, chunksize=1, suffix=None, **options):
+    """파일 목록을 프로세스 풀로 나누어 처리하고 끝난 순서대로 BatchResult 반환
+
+    workers=1이면 현재 프로세스에서 순서대로 처리한다.
+    """
+    root = common_root(files)
+    tasks = [(operation, path, batch_output_path(path, operation, output_dir, suffix, root), options)
+             for path in files]
+    if output_dir:
+        for directory in {os.path.dirname(task[2]) for task in tasks}:
+            os.makedirs(directory, exist_ok=True)
+    if workers == 1 or len(tasks) <= 1:
+        yield from map(run_batch_task, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(run_batch_task, tasks, chunksize=max(1, chunksize))
+
+def batch_main(argv):
+    """일괄 처리 명령 (svg_tools.py batch <작업> <파일/폴더/패턴>...)"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog='svg_tools.py batch', description='여러 SVG 파일 일괄 변환')
+    parser.add_argument('operation', choices=BATCH_OPERATIONS, help='실행할 작업')
+    parser.add_argument('inputs', nargs='+', help='SVG 파일, 폴더 또는 glob 패턴')
+    parser.add_argument('-o', '--output-dir', help='결과 저장 폴더 (기본: 입력 파일과 같은 폴더)')
+    parser.add_argument('--suffix', help='결과 파일명 접미사 (기본: _<작업>, 출력 폴더 지정 시 없음)')
+    parser.add_argument('-r', '--recursive', action='store_true', help='하위 폴더까지 검색')
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count(), help='작업 프로세스 수')
+    parser.add_argument('--chunksize', type=int, default=4, help='프로세스에 한 번에 넘길 파일 수')
+    parser.add_argument('--size', type=float, default=1000, help='resize: 새 크기')
+    parser.add_argument('--canvas-size', type=float, default=1000, help='center/profile: 캔버스 크기')
+    parser.add_argument('--target-size', type=float, default=850, help='center: 목표 심볼 크기')
+    parser.add_argument('--stream', action='store_true', help='resize/profile: 스트리밍 모드')
+    parser.add_argument('--center', choices=('bbox', 'mec'), default='bbox',
+                        help='profile: 경계 상자 중심 또는 최소 외접원 중심에 맞춤')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='winding: 곡선 근사 허용 오차')
+    parser.add_argument('-v', '--verbose', action='store_true', help='파일별 상세 출력 표시')
+    args = parser.parse_args(argv)
+    
+    files = collect_svg_files(args.inputs, args.recursive)
+    if not files:
+        print("처리할 SVG 파일이 없습니다.")
+        return 1
+    
+    print(f"{len(files)}개 파일 {args.operation} 작업 시작 (프로세스 {args.workers}개)")
+    start = time.perf_counter()
+    succeeded = failed = 0
+    total_bytes = 0
+    for result in run_batch(args.operation, files, args.output_dir, args.workers, args.chunksize,
+                            args.suffix, size=args.size, canvas_size=args.canvas_size,
+                            target_size=args.target_size, streaming=args.stream,
+                            tolerance=args.tolerance, center=args.center):
+        if result.ok:
+            succeeded += 1
+            total_bytes += os.path.getsize(result.input_file)
+            print(f"✓ {result.input_file} -> {result.output_file} ({result.seconds * 1000:.1f}ms)")
+        else:
+            failed += 1
+            print(f"✗ {result.input_file}: {result.message}")
+        if args.verbose and result.log:
+            print('  ' + result.log.rstrip().replace('\n', '\n  '))
+    
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    print(f"\n완료: 성공 {succeeded}개, 실패 {failed}개, {elapsed:.2f}초")
+    print(f"처리량: {len(files) / elapsed:.1f} 파일/초, {total_bytes / 1024 / 1024 / elapsed:.2f} MB/초")
+    return 1 if failed else 0
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        sys.exit(batch_main(sys.argv[2:]))
+    
     print("SVG 변환 도구")
     print("=============")
     print("1. SVG 패스 뒤집기 (반시계 -> 시계)")
     print("2. SVG 크기 조정")
     print("3. SVG 심볼 확대 및 중앙 정렬")
     print("4. 모든 변환 실행")
+    print("5. 폴더의 패스 방향 자동 정리 (윤곽: 시계, 구멍: 반시계)")
     
-    choice = input("\n선택하세요 (1-4): ")
+    choice = input("\n선택하세요 (1-5): ")
     
     if choice == '1':
         path_data = input("변환할 패스 데이터를 입력하세요: ")
@@ -322,6 +349,11 @@ def main():
             print("\n변환 완료!")
         else:
             print("Icon.svg 파일을 찾을 수 없습니다.")
+        
+    elif choice == '5':
+        folder = input("SVG 폴더: ")
+        output_dir = input("결과 저장 폴더 (비우면 같은 폴더에 _winding 파일로 저장): ").strip() or None
+        sys.exit(batch_main(['winding', folder, '-r'] + (['-o', output_dir] if output_dir else [])))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
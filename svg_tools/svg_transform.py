@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+SVG 2D 아핀 변환 엔진
+- 행렬은 SVG matrix(a b c d e f)와 같은 6-튜플로 표현
+  x' = a*x + c*y + e, y' = b*x + d*y + f
+- 스케일, 이동, 회전, 기울이기 행렬 생성 및 합성
+- 패스를 정규화(절대 좌표 M/L/C/Q/Z)한 뒤 좌표 버퍼 전체를 한 번에 변환
+- NumPy가 있으면 벡터 연산, 없으면 순수 Python으로 처리
+"""
+
+import math
+import re
+from array import array
+
+from svg_path import PathData, as_path_data
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 순수 Python으로 처리
+    np = None
+
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+
+def translate(tx, ty=0.0):
+    """이동 행렬"""
+    return (1.0, 0.0, 0.0, 1.0, float(tx), float(ty))
+
+
+def scale(sx, sy=None):
+    """스케일 행렬 (sy가 없으면 균일 스케일)"""
+    if sy is None:
+        sy = sx
+    return (float(sx), 0.0, 0.0, float(sy), 0.0, 0.0)
+
+
+def rotate(degrees, cx=0.0, cy=0.0):
+    """(cx, cy)를 중심으로 회전하는 행렬"""
+    rad = math.radians(degrees)
+    cos_a, sin_a = math.cos(rad), math.sin(rad)
+    matrix = (cos_a, sin_a, -sin_a, cos_a, 0.0, 0.0)
+    if cx or cy:
+        matrix = multiply(translate(cx, cy), multiply(matrix, translate(-cx, -cy)))
+    return matrix
+
+
+def skew_x(degrees):
+    """x축 기울이기 행렬"""
+    return (1.0, 0.0, math.tan(math.radians(degrees)), 1.0, 0.0, 0.0)
+
+
+def skew_y(degrees):
+    """y축 기울이기 행렬"""
+    return (1.0, math.tan(math.radians(degrees)), 0.0, 1.0, 0.0, 0.0)
+
+
+def multiply(m1, m2):
+    """행렬 곱 m1 * m2 (m2를 먼저 적용)"""
+    a1, b1, c1, d1, e1, f1 = m1
+    a2, b2, c2, d2, e2, f2 = m2
+    return (a1 * a2 + c1 * b2,
+            b1 * a2 + d1 * b2,
+            a1 * c2 + c1 * d2,
+            b1 * c2 + d1 * d2,
+            a1 * e2 + c1 * f2 + e1,
+            b1 * e2 + d1 * f2 + f1)
+
+
+def compose(*matrices):
+    """왼쪽부터 곱한 행렬 (마지막 행렬이 가장 먼저 적용됨)"""
+    result = IDENTITY
+    for matrix in matrices:
+        result = multiply(result, matrix)
+    return result
+
+
+def apply_point(matrix, x, y):
+    """점 하나 변환"""
+    a, b, c, d, e, f = matrix
+    return a * x + c * y + e, b * x + d * y + f
+
+
+def scale_factor(matrix):
+    """길이(반지름 등)에 적용되는 평균 스케일 (행렬식의 제곱근)"""
+    a, b, c, d, _, _ = matrix
+    return math.sqrt(abs(a * d - b * c))
+
+
+def transform_coords(coords, matrix):
+    """(x, y) 쌍으로 된 좌표 버퍼를 한 번에 변환하여 새 array('d') 반환"""
+    a, b, c, d, e, f = matrix
+    if np is not None:
+        points = np.frombuffer(coords, dtype=np.float64).reshape(-1, 2)
+        linear = np.array([[a, b], [c, d]])
+        transformed = points @ linear + (e, f)
+        result = array('d')
+        result.frombytes(transformed.tobytes())
+        return result
+
+    xs = coords[0::2]
+    ys = coords[1::2]
+    result = array('d', coords)
+    result[0::2] = array('d', [a * x + c * y + e for x, y in zip(xs, ys)])
+    result[1::2] = array('d', [b * x + d * y + f for x, y in zip(xs, ys)])
+    return result
+
+
+def transform_path(path, matrix, normalized=False):
+    """패스(문자열 또는 PathData)에 아핀 변환을 적용한 정규화된 PathData 반환
+
+    normalized=True이면 이미 정규화된 PathData로 보고 정규화를 건너뛴다.
+    """
+    if normalized:
+        result = PathData(path.opcodes, path.offsets, path.coords)
+    else:
+        result = as_path_data(path).normalized()
+    result.coords = transform_coords(result.coords, matrix)
+    return result
+
+
+def transform_path_string(path_d, matrix, precision=2):
+    """패스 문자열을 변환하고 한 번에 직렬화"""
+    return transform_path(path_d, matrix).to_string(precision)
+
+
+_TRANSFORM_RE = re.compile(r'(matrix|translate|scale|rotate|skewX|skewY)\s*\(([^)]*)\)')
+_TRANSFORM_NUMBER_RE = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
+
+
+def parse_transform(value):
+    """SVG transform 속성 문자열을 하나의 행렬로 변환"""
+    result = IDENTITY
+    for name, params in _TRANSFORM_RE.findall(value or ''):
+        values = [float(v) for v in _TRANSFORM_NUMBER_RE.findall(params)]
+        if name == 'matrix' and len(values) == 6:
+            matrix = tuple(values)
+        elif name == 'translate' and values:
+            matrix = translate(*values[:2])
+        elif name == 'scale' and values:
+            matrix = scale(*values[:2])
+        elif name == 'rotate' and values:
+            matrix = rotate(*values[:3])
+        elif name == 'skewX' and values:
+            matrix = skew_x(values[0])
+        elif name == 'skewY' and values:
+            matrix = skew_y(values[0])
+        else:
+            raise ValueError(f"잘못된 transform 값: {name}({params})")
+        result = multiply(result, matrix)
+    return result
+
+
+def format_matrix(matrix, precision=6):
+    """행렬을 SVG transform 속성 문자열로 변환"""
+    number = f'%.{precision}g'
+    return 'matrix(' + ' '.join(number % value for value in matrix) + ')'
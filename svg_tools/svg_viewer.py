@@ -3,31 +3,84 @@
 SVG 파일을 HTML로 표시하는 뷰어 생성
 """
 
+import html
+import json
 import os
-import sys
+import threading
+from collections import deque
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
 
-def create_svg_viewer(svg_files, output_html="svg_viewer.html"):
-    """여러 SVG 파일을 비교할 수 있는 HTML 뷰어 생성"""
-    
-    # SVG 파일들 읽기
+from file_watcher import FileWatcher
+from image_discovery import scan_images
+
+DEFAULT_PORT = 8001
+
+# 감시 모드에서 보관하는 최근 변경 수 (다시 연결한 브라우저가 놓친 변경을 받음, 더 많이 놓쳤으면 새로고침)
+EVENT_HISTORY = 256
+KEEPALIVE_INTERVAL = 15  # 초
+
+# 감시 모드 페이지에 추가하는 스크립트 (Server-Sent Events로 바뀐 SVG만 교체)
+LIVE_RELOAD_SCRIPT = """
+        // 감시 모드: 바뀐 SVG만 교체
+        const events = new EventSource('/events');
+        events.onmessage = function(e) {
+            const data = JSON.parse(e.data);
+            if (data.reload) {
+                location.reload();
+                return;
+            }
+            svgData[data.index].content = data.content;
+            showSVG(data.index);
+        };
+"""
+
+def load_svg_file(svg_file):
+    """SVG 파일 하나 읽기 (없으면 None)"""
+    if not os.path.exists(svg_file):
+        print(f"파일을 찾을 수 없습니다: {svg_file}")
+        return None
+    with open(svg_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return {
+        'filename': os.path.basename(svg_file),
+        'path': svg_file,
+        'content': content
+    }
+
+def load_svg_files(svg_files):
+    """SVG 파일들 읽기 (없는 파일은 건너뜀)"""
     svg_contents = []
     for svg_file in svg_files:
-        if os.path.exists(svg_file):
-            with open(svg_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                svg_contents.append({
-                    'filename': os.path.basename(svg_file),
-                    'path': svg_file,
-                    'content': content
-                })
-        else:
-            print(f"파일을 찾을 수 없습니다: {svg_file}")
-    
-    if not svg_contents:
-        print("표시할 SVG 파일이 없습니다.")
-        return False
-    
-    # HTML 생성
+        svg_data = load_svg_file(svg_file)
+        if svg_data is not None:
+            svg_contents.append(svg_data)
+    return svg_contents
+
+def viewer_json(value):
+    """<script> 안에 넣을 JSON (<, >, &를 \\u 이스케이프하여 </script>나 주석으로 끊기지 않음)"""
+    text = json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+    return text.replace('<', '\\u003c').replace('>', '\\u003e').replace('&', '\\u0026')
+
+def svg_item_html(i, svg_data):
+    """SVG 하나의 HTML 조각 (SVG 내용은 svgData에서 스크립트가 채움)"""
+    return f"""
+            <div class="svg-item">
+                <div class="svg-title">{html.escape(svg_data['filename'])}</div>
+                <div class="svg-container" id="container-{i}">
+                    <div class="circle-overlay"></div>
+                </div>
+                <div class="controls">
+                    <button onclick="downloadSVG({i})">SVG 다운로드</button>
+                    <button onclick="downloadPNG({i})">PNG 다운로드</button>
+                </div>
+                <div class="info">{html.escape(svg_data['path'])}</div>
+            </div>
+"""
+
+def generate_viewer_html(svg_contents, live=False):
+    """뷰어 HTML 생성 (live: 감시 모드 서버에서 바뀐 SVG를 받아 바로 교체)"""
     html_content = """<!DOCTYPE html>
 <html lang="ko">
 <head>
@@ -149,31 +202,29 @@ def create_svg_viewer(svg_files, output_html="svg_viewer.html"):
     
     # 각 SVG 아이템 추가
     for i, svg_data in enumerate(svg_contents):
-        html_content += f"""
-            <div class="svg-item">
-                <div class="svg-title">{svg_data['filename']}</div>
-                <div class="svg-container" id="container-{i}">
-                    {svg_data['content']}
-                    <div class="circle-overlay"></div>
-                </div>
-                <div class="controls">
-                    <button onclick="downloadSVG({i})">SVG 다운로드</button>
-                    <button onclick="downloadPNG({i})">PNG 다운로드</button>
-                </div>
-                <div class="info">{svg_data['path']}</div>
-            </div>
-"""
+        html_content += svg_item_html(i, svg_data)
     
     html_content += """
         </div>
     </div>
     
+    <script type="application/json" id="svgData">""" + viewer_json([{
+        'filename': d['filename'],
+        'content': d['content']
+    } for d in svg_contents]) + """</script>
     <script>
-        // SVG 데이터 저장
-        const svgData = """ + str([{
-            'filename': d['filename'],
-            'content': d['content'].replace('\n', '\\n').replace('"', '\\"')
-        } for d in svg_contents]) + """;
+        // SVG 데이터 (화면 표시와 다운로드가 함께 사용, 페이지에 한 번만 포함)
+        const svgData = JSON.parse(document.getElementById('svgData').textContent);
+        
+        function showSVG(index) {
+            const container = document.getElementById(`container-${index}`);
+            const overlay = container.querySelector('.circle-overlay');
+            container.innerHTML = svgData[index].content;
+            container.appendChild(overlay);
+            container.style.backgroundColor = document.getElementById('bgColor').value;
+        }
+        
+        svgData.forEach((data, index) => showSVG(index));
         
         function toggleCircles() {
             const containers = document.querySelectorAll('.svg-container');
@@ -240,10 +291,22 @@ def create_svg_viewer(svg_files, output_html="svg_viewer.html"):
             };
             img.src = url;
         }
-    </script>
+""" + (LIVE_RELOAD_SCRIPT if live else "") + """    </script>
 </body>
 </html>
 """
+    return html_content
+
+def create_svg_viewer(svg_files, output_html="svg_viewer.html"):
+    """여러 SVG 파일을 비교할 수 있는 HTML 뷰어 생성"""
+    
+    # SVG 파일들 읽기
+    svg_contents = load_svg_files(svg_files)
+    if not svg_contents:
+        print("표시할 SVG 파일이 없습니다.")
+        return False
+    
+    html_content = generate_viewer_html(svg_contents)
     
     # HTML 파일 저장
     with open(output_html, 'w', encoding='utf-8') as f:
@@ -253,7 +316,124 @@ def create_svg_viewer(svg_files, output_html="svg_viewer.html"):
     print(f"   표시된 파일 수: {len(svg_contents)}개")
     return True
 
+class LiveViewer:
+    """감시 모드 상태: 현재 SVG 내용과 최근 변경 기록 (브라우저 연결마다 공유)"""
+
+    def __init__(self, svg_files):
+        self.svg_contents = load_svg_files(svg_files)
+        self.svg_files = [os.path.abspath(svg_data['path']) for svg_data in self.svg_contents]
+        self.events = deque(maxlen=EVENT_HISTORY)  # (번호, JSON)
+        self.version = 0
+        self.condition = threading.Condition()
+
+    def update(self, changed):
+        """바뀐 파일만 다시 읽고 브라우저에 보낼 변경 기록 추가 (같은 파일이 여러 번 있으면 모두 갱신)"""
+        for path in sorted(changed):
+            svg_data = load_svg_file(path)
+            if svg_data is None:  # 삭제됨 (다시 만들어지면 그때 반영)
+                continue
+            for index, svg_file in enumerate(self.svg_files):
+                if svg_file != path:
+                    continue
+                self.svg_contents[index]['content'] = svg_data['content']
+                payload = json.dumps({'index': index, 'content': svg_data['content']}, ensure_ascii=False)
+                with self.condition:
+                    self.version += 1
+                    self.events.append((self.version, payload))
+                    self.condition.notify_all()
+            print(f"🔄 {svg_data['filename']}")
+
+    def events_since(self, version, timeout):
+        """version 이후의 변경 목록 (timeout 동안 없으면 빈 목록, 놓친 변경이 있으면 None)"""
+        with self.condition:
+            self.condition.wait_for(lambda: self.version > version, timeout)
+            if self.events and self.events[0][0] > version + 1:
+                return None
+            return [event for event in self.events if event[0] > version]
+
+    def page(self):
+        return generate_viewer_html(self.svg_contents, live=True).encode('utf-8')
+
+class LiveViewerHandler(BaseHTTPRequestHandler):
+    """감시 모드 요청 처리: / (뷰어 페이지), /events (변경 알림 스트림)"""
+
+    def do_GET(self):
+        viewer = self.server.viewer
+        if self.path == '/':
+            body = viewer.page()
+            self.send_response(HTTPStatus.OK)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            self.wfile.write(body)
+        elif self.path == '/events':
+            self.send_response(HTTPStatus.OK)
+            self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            # 다시 연결하면 브라우저가 마지막으로 받은 번호를 보냄 (처음이면 현재 페이지가 최신)
+            last_id = self.headers.get('Last-Event-ID')
+            version = int(last_id) if last_id and last_id.isdigit() else viewer.version
+            try:
+                while True:
+                    events = viewer.events_since(version, KEEPALIVE_INTERVAL)
+                    if events is None:
+                        self.wfile.write(f"id: {viewer.version}\ndata: {{\"reload\": true}}\n\n".encode('utf-8'))
+                        return
+                    if not events:
+                        self.wfile.write(b": keepalive\n\n")
+                    for version, payload in events:
+                        self.wfile.write(f"id: {version}\ndata: {payload}\n\n".encode('utf-8'))
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):  # 브라우저 탭이 닫힘
+                return
+        else:
+            self.send_error(HTTPStatus.NOT_FOUND)
+
+    def log_message(self, format, *args):
+        pass
+
+class LiveViewerServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+def watch_svg_viewer(svg_files, port=DEFAULT_PORT):
+    """감시 모드: 뷰어를 로컬 서버로 띄우고 저장한 SVG만 다시 읽어 브라우저에 전송 (Ctrl+C로 종료)"""
+    viewer = LiveViewer(svg_files)
+    if not viewer.svg_contents:
+        print("표시할 SVG 파일이 없습니다.")
+        return False
+    
+    server = LiveViewerServer(('127.0.0.1', port), LiveViewerHandler)
+    server.viewer = viewer
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    with FileWatcher(viewer.svg_files) as watcher:
+        print(f"👀 감시 모드 ({watcher.method}): http://127.0.0.1:{server.server_address[1]}/  (Ctrl+C로 종료)")
+        print(f"   감시 중인 파일: {len(viewer.svg_files)}개")
+        try:
+            while True:
+                changed = watcher.wait()
+                if changed:
+                    viewer.update(changed)
+        except KeyboardInterrupt:
+            print("\n감시를 종료합니다.")
+        finally:
+            server.shutdown()
+            server.server_close()
+    return True
+
 def main():
+    """메인 함수"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='SVG 파일 비교 뷰어 HTML 생성')
+    parser.add_argument('files', nargs='*', help='SVG 파일 또는 폴더 (폴더는 하위 폴더까지 탐색)')
+    parser.add_argument('--watch', action='store_true',
+                        help='감시 모드: 로컬 서버로 띄우고 저장한 SVG를 바로 반영')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='감시 모드 포트 (기본: %(default)s)')
+    args = parser.parse_args()
+    
     # 기본 SVG 파일 목록
     default_files = [
         '../Images/Icon_1000x1000_profile.svg',
@@ -262,17 +442,23 @@ def main():
     ]
     
     # 명령줄 인수가 있으면 사용, 없으면 기본값
-    if len(sys.argv) > 1:
-        svg_files = sys.argv[1:]
-    else:
-        svg_files = default_files
+    svg_files = args.files or default_files
     
-    # 실제 존재하는 파일만 필터링
-    existing_files = [f for f in svg_files if os.path.exists(f)]
+    # 실제 존재하는 파일만 필터링 (폴더는 하위 폴더까지 SVG 탐색)
+    existing_files = []
+    for svg_file in svg_files:
+        if os.path.isdir(svg_file):
+            existing_files.extend(sorted(entry.path for entry in scan_images(svg_file, ('.svg',))))
+        elif os.path.exists(svg_file):
+            existing_files.append(svg_file)
     
     if not existing_files:
         print("표시할 SVG 파일이 없습니다.")
-        print("사용법: python svg_viewer.py [svg파일1] [svg파일2] ...")
+        print("사용법: python svg_viewer.py [svg파일 또는 폴더] ...")
+        return
+    
+    if args.watch:
+        watch_svg_viewer(existing_files, args.port)
         return
     
     output_html = '../svg_viewer.html'
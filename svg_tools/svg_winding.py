@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+SVG 패스 방향(감김) 분석과 일괄 정리
+- 문서의 모든 하위 패스를 허용 오차 안의 꺾은선으로 근사하고 부호 있는 넓이를 한 번에 계산
+  (NumPy가 있으면 벡터 연산)
+- 같은 path 요소의 다른 하위 패스 안에 몇 겹 들어 있는지(포함 깊이)로 바깥 윤곽과 구멍을 구분
+- 바깥 윤곽은 시계방향, 구멍은 반시계방향으로 정리 (방향이 다른 하위 패스만 뒤집기)
+- 요소의 transform이 좌우를 뒤집으면(행렬식 < 0) 화면 기준 방향으로 판단
+
+사용법:
+    python svg_winding.py icon.svg ../Images -r      # 하위 패스별 방향 분석
+    python svg_tools.py batch winding ../Images -r   # 폴더 전체 방향 정리
+"""
+
+import sys
+from array import array
+from collections import namedtuple
+
+from svg_document import SVGDocument, local_name
+from svg_geometry import flatten_curve
+from svg_path import PathData, arc_to_cubics, as_path_data
+from svg_reverse import (CLOCKWISE, COUNTER_CLOCKWISE, append_reversed_subpath, append_subpath,
+                         iter_subpaths, orientation)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy가 없으면 순수 Python으로 처리
+    np = None
+
+DEFAULT_TOLERANCE = 0.25  # 곡선을 꺾은선으로 근사할 때 허용하는 최대 거리 (사용자 단위)
+
+_M, _L, _H, _V, _C, _Q, _A, _Z = (ord(cmd) for cmd in 'MLHVCQAZ')
+
+Ring = namedtuple('Ring', ['subpath', 'area', 'orientation', 'depth', 'expected'])
+Ring.__doc__ = """하위 패스 분석 결과
+(Subpath, 화면 기준 부호 있는 넓이, 현재 방향, 포함 깊이, 정리 후 방향: 깊이가 짝수면 시계방향)"""
+
+PathWinding = namedtuple('PathWinding', ['element', 'path', 'rings'])
+PathWinding.__doc__ = """path 요소 하나의 분석 결과 (요소, 절대 좌표 PathData, Ring 목록)"""
+
+
+def flatten_subpath(path, subpath, tolerance=DEFAULT_TOLERANCE, out=None):
+    """하위 패스를 꺾은선 좌표 버퍼(x, y 반복)로 근사 (시작점 포함, 닫는 선분은 넣지 않음)"""
+    if out is None:
+        out = array('d')
+    opcodes = path.opcodes
+    coords = path.coords
+    offsets = path.offsets
+    x, y = subpath.start_x, subpath.start_y
+    out.extend((x, y))
+    for index in range(subpath.start, subpath.stop):
+        opcode = opcodes[index]
+        if opcode == _M or opcode == _Z:
+            continue
+        args = coords[offsets[index]:offsets[index + 1]]
+        if opcode == _L:
+            x, y = args
+            out.extend(args)
+        elif opcode == _H:
+            x = args[0]
+            out.extend((x, y))
+        elif opcode == _V:
+            y = args[0]
+            out.extend((x, y))
+        elif opcode == _C or opcode == _Q:
+            flatten_curve((x, y) + tuple(args), tolerance, out)
+            x, y = args[-2], args[-1]
+        else:  # A
+            for cmd, segment in arc_to_cubics(x, y, *args):
+                if cmd == 'L':  # 반지름이 0인 호는 직선
+                    out.extend(segment)
+                else:
+                    flatten_curve((x, y) + tuple(segment), tolerance, out)
+                x, y = segment[-2], segment[-1]
+            x, y = args[5], args[6]
+    return out
+
+
+def _ring_areas(points, starts):
+    """모든 꺾은선 고리의 부호 있는 넓이를 한 번에 계산 (starts: 고리별 첫 점 번호 + 끝 번호)"""
+    count = len(starts) - 1
+    if count <= 0:
+        return []
+    if np is not None:
+        xy = np.frombuffer(points, dtype=np.float64).reshape(-1, 2)
+        bounds = np.array(starts, dtype=np.intp)
+        begin, end = bounds[:-1], bounds[1:]
+        following = np.arange(1, len(xy) + 1)
+        following[end - 1] = begin  # 고리의 마지막 점은 첫 점으로 닫음
+        cross = xy[:, 0] * xy[following, 1] - xy[following, 0] * xy[:, 1]
+        return (np.add.reduceat(cross, begin) / 2).tolist()
+    areas = []
+    for ring in range(count):
+        begin, end = starts[ring], starts[ring + 1]
+        area = 0.0
+        px, py = points[2 * end - 2], points[2 * end - 1]
+        for i in range(begin, end):
+            x, y = points[2 * i], points[2 * i + 1]
+            area += px * y - x * py
+            px, py = x, y
+        areas.append(area / 2)
+    return areas
+
+
+def _contains(points, begin, end, x, y):
+    """점 (x, y)가 꺾은선 고리 안에 있는지 (교차 횟수 판정)"""
+    if np is not None:
+        ring = np.frombuffer(points, dtype=np.float64)[2 * begin:2 * end].reshape(-1, 2)
+        x0, y0 = ring[:, 0], ring[:, 1]
+        x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+        crosses = (y0 > y) != (y1 > y)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            at = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+        return bool(np.count_nonzero(crosses & (x < at)) % 2)
+    inside = False
+    px, py = points[2 * end - 2], points[2 * end - 1]
+    for i in range(begin, end):
+        qx, qy = points[2 * i], points[2 * i + 1]
+        if (qy > y) != (py > y) and x < qx + (y - qy) * (px - qx) / (py - qy):
+            inside = not inside
+        px, py = qx, qy
+    return inside
+
+
+def _ring_bounds(points, begin, end):
+    xs = points[2 * begin:2 * end:2]
+    ys = points[2 * begin + 1:2 * end:2]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _ring_depths(points, starts, first, last, areas):
+    """요소 하나(고리 first..last-1)의 고리별 포함 깊이 (넓이가 0인 고리는 세지 않음)"""
+    rings = [ring for ring in range(first, last) if areas[ring] != 0]
+    bounds = {ring: _ring_bounds(points, starts[ring], starts[ring + 1]) for ring in rings}
+    depths = {}
+    for ring in range(first, last):
+        begin = starts[ring]
+        x, y = points[2 * begin], points[2 * begin + 1]
+        depth = 0
+        for other in rings:
+            if other == ring:
+                continue
+            min_x, min_y, max_x, max_y = bounds[other]
+            if min_x <= x <= max_x and min_y <= y <= max_y and \
+                    _contains(points, starts[other], starts[other + 1], x, y):
+                depth += 1
+        depths[ring] = depth
+    return [depths[ring] for ring in range(first, last)]
+
+
+def analyze_document(document, tolerance=DEFAULT_TOLERANCE):
+    """문서의 모든 path 요소에 대한 PathWinding 목록
+
+    모든 하위 패스의 꺾은선을 하나의 버퍼에 모아 넓이를 한 번에 계산한다.
+    """
+    points = array('d')
+    starts = array('I', [0])
+    elements = []  # (요소, PathData, 하위 패스 목록, 첫 고리 번호, 방향 부호)
+    for element, ctm in document.iter_shapes():
+        if local_name(element.tag) != 'path' or not element.get('d'):
+            continue
+        path = as_path_data(element.get('d')).absolute()
+        subpaths = list(iter_subpaths(path))
+        first = len(starts) - 1
+        for subpath in subpaths:
+            flatten_subpath(path, subpath, tolerance, points)
+            starts.append(len(points) // 2)
+        a, b, c, d = ctm[:4]
+        elements.append((element, path, subpaths, first, -1.0 if a * d - b * c < 0 else 1.0))
+
+    areas = _ring_areas(points, starts)
+    results = []
+    for element, path, subpaths, first, sign in elements:
+        last = first + len(subpaths)
+        depths = _ring_depths(points, starts, first, last, areas)
+        rings = []
+        for subpath, area, depth in zip(subpaths, areas[first:last], depths):
+            area *= sign
+            rings.append(Ring(subpath, area, orientation(area), depth,
+                              CLOCKWISE if depth % 2 == 0 else COUNTER_CLOCKWISE))
+        results.append(PathWinding(element, path, rings))
+    return results
+
+
+def normalize_path(winding):
+    """바깥 윤곽을 시계방향, 구멍을 반시계방향으로 정리한 PathData (뒤집은 하위 패스가 없으면 None)"""
+    if all(ring.orientation in (None, ring.expected) for ring in winding.rings):
+        return None
+    result = PathData()
+    for ring in winding.rings:
+        if ring.orientation in (None, ring.expected):
+            append_subpath(winding.path, ring.subpath, result)
+        else:
+            append_reversed_subpath(winding.path, ring.subpath, result)
+    return result
+
+
+def normalize_document(document, tolerance=DEFAULT_TOLERANCE):
+    """문서의 모든 path 요소 방향 정리 (뒤집은 하위 패스 수 반환, 바뀐 요소만 d를 다시 씀)"""
+    flipped = 0
+    for winding in analyze_document(document, tolerance):
+        path = normalize_path(winding)
+        if path is None:
+            continue
+        flipped += sum(ring.orientation not in (None, ring.expected) for ring in winding.rings)
+        winding.element.set('d', path.to_string())
+    return flipped
+
+
+def normalize_svg_file(input_file, output_file, tolerance=DEFAULT_TOLERANCE):
+    """SVG 파일의 패스 방향을 정리하여 저장"""
+    document = SVGDocument.load(input_file)
+    flipped = normalize_document(document, tolerance)
+    document.save(output_file)
+    print(f"{flipped}개의 하위 패스를 뒤집었습니다.")
+    print(f"결과가 '{output_file}'에 저장되었습니다.")
+    return True
+
+
+def print_analysis(svg_file, tolerance=DEFAULT_TOLERANCE):
+    """파일 하나의 하위 패스별 방향 출력 (정리가 필요한 하위 패스 수 반환)"""
+    labels = {CLOCKWISE: '시계', COUNTER_CLOCKWISE: '반시계', None: '-'}
+    mismatched = 0
+    print(svg_file)
+    for index, winding in enumerate(analyze_document(SVGDocument.load(svg_file), tolerance)):
+        element_id = winding.element.get('id')
+        for number, ring in enumerate(winding.rings):
+            ok = ring.orientation in (None, ring.expected)
+            mismatched += not ok
+            kind = '구멍' if ring.depth % 2 else '윤곽'
+            print(f"  path {element_id or index}#{number}: {kind} (깊이 {ring.depth}), 넓이 {ring.area:,.1f}, "
+                  f"{labels[ring.orientation]}{'' if ok else ' -> ' + labels[ring.expected]}")
+    return mismatched
+
+
+def main():
+    """메인 함수"""
+    import argparse
+
+    from svg_tools import collect_svg_files
+
+    parser = argparse.ArgumentParser(description='SVG 하위 패스 방향 분석 (정리는 svg_tools.py batch winding)')
+    parser.add_argument('inputs', nargs='+', help='SVG 파일, 폴더 또는 glob 패턴')
+    parser.add_argument('-r', '--recursive', action='store_true', help='하위 폴더까지 검색')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='곡선 근사 허용 오차 (기본: %(default)s)')
+    args = parser.parse_args()
+
+    files = collect_svg_files(args.inputs, args.recursive)
+    if not files:
+        print("분석할 SVG 파일이 없습니다.")
+        return 1
+    mismatched = 0
+    for svg_file in files:
+        mismatched += print_analysis(svg_file, args.tolerance)
+    print(f"\n정리가 필요한 하위 패스: {mismatched}개 ({len(files)}개 파일)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
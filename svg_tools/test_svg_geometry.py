@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+svg_geometry 테스트 (python -m unittest test_svg_geometry)
+"""
+
+import unittest
+
+from svg_geometry import path_bounds
+
+# Z 다음에 M 없이 이어지는 곡선은 하위 패스 시작점 (100, 100)에서 시작한다
+CURVE_AFTER_CLOSE = "M100 100 L110 100 L110 110 Z C100 50 100 50 100 100"
+
+
+class ClosePathTest(unittest.TestCase):
+    def test_curve_after_close_starts_at_subpath_start(self):
+        bounds = path_bounds(CURVE_AFTER_CLOSE)
+        explicit = path_bounds(CURVE_AFTER_CLOSE.replace('Z C', 'Z M100 100 C'))
+        for value, expected in zip(bounds, explicit):
+            self.assertAlmostEqual(value, expected)
+        self.assertAlmostEqual(bounds[1], 62.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+svg_reverse / svg_winding 테스트 (python -m unittest test_svg_reverse)
+"""
+
+import unittest
+
+from svg_document import SVGDocument
+from svg_reverse import reverse_path, subpath_areas
+from svg_tools import SVGTools
+from svg_winding import analyze_document
+
+# 반지름이 0인 호는 직선으로 그린다 (SVG 구현 노트 F.6.2)
+DEGENERATE_ARC = "M0 0 A 0 5 0 0 1 10 0 L 5 5 Z"
+
+
+class DegenerateArcTest(unittest.TestCase):
+    def test_signed_area_matches_line(self):
+        _, areas = subpath_areas(DEGENERATE_ARC)
+        _, line_areas = subpath_areas("M0 0 L 10 0 L 5 5 Z")
+        self.assertAlmostEqual(areas[0][1], line_areas[0][1])
+
+    def test_reverse_path(self):
+        _, areas = subpath_areas(reverse_path(DEGENERATE_ARC))
+        self.assertAlmostEqual(areas[0][1], -25.0)
+        self.assertIn('A', SVGTools.reverse_path_to_clockwise(DEGENERATE_ARC))
+
+    def test_winding_analysis(self):
+        document = SVGDocument.from_string(
+            f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 20 20"><path d="{DEGENERATE_ARC}"/></svg>')
+        (winding,) = analyze_document(document)
+        self.assertAlmostEqual(winding.rings[0].area, 25.0)
+
+
+
+class ReverseClosedSubpathTest(unittest.TestCase):
+    def test_no_line_back_to_start_before_close(self):
+        reversed_path = reverse_path("M0 0 L10 0 L5 5 Z")
+        self.assertEqual([cmd for cmd, _ in reversed_path], ['M', 'L', 'L', 'Z'])
+        self.assertEqual(reversed_path.coords.tolist(), [0, 0, 5, 5, 10, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()